@@ -0,0 +1,510 @@
+"""Alert rules: a small expression language compiled to vectorized predicates.
+
+    RSI Oversold: rsi14 < 30
+    Golden Cross: sma50 crosses_above sma200 and rel_vol > 1.5
+
+Features are ``close``, ``volume``, ``price`` (the live quote), ``sma<N>``,
+``ema<N>``, ``rsi<N>``, ``macd``, ``signal``, ``macd_hist``,
+``support<N>`` / ``resistance<N>`` (N defaults to 30) and ``avg_vol<N>`` /
+``rel_vol<N>`` (N defaults to 20). They combine with ``+ - * /``,
+comparisons, ``crosses_above`` / ``crosses_below``, ``and`` / ``or`` /
+``not`` and parentheses.
+
+A rule is compiled once into a function over ``_Features``, which holds the
+previous and the latest bar of every symbol as ``(2, symbols)`` arrays, so
+one call evaluates the rule for a whole watchlist and rules share the
+indicators they read. ``AlertEngine`` keeps each (rule, symbol) state
+between passes, re-evaluates only symbols whose bars or price changed, and
+reports transitions: a rule fires when it turns true and not again until
+it has been false.
+"""
+
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from core import bars_key, ema_2d
+from instrument import count, timed
+from market import IST
+
+MAX_LOOKBACK = 260  # bars per symbol fed to the indicators; EMAs settle well within this
+LOG_SIZE = 500  # fired alerts kept by an engine
+
+DEFAULT_RULES = """\
+RSI Oversold (<30): rsi14 < 30
+RSI Overbought (>70): rsi14 > 70
+MACD Bullish Cross: macd crosses_above signal
+MACD Bearish Cross: macd crosses_below signal
+SMA5 Crossed Above SMA20: sma5 crosses_above sma20
+SMA5 Crossed Below SMA20: sma5 crosses_below sma20
+"""
+
+
+class RuleError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    expr: str
+
+
+def parse_rules(text: str) -> tuple[list[Rule], list[str]]:
+    """``Name: expression`` lines into compiled-checked rules, plus one error
+    message per line that does not compile. Blank and ``#`` lines are skipped."""
+    rules, errors = [], []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, sep, expr = line.partition(":")
+        if not sep:
+            name, expr = line, line
+        name, expr = name.strip(), expr.strip()
+        try:
+            compile_rule(expr)
+        except RuleError as e:
+            errors.append(f"line {lineno}: {e}")
+            continue
+        rules.append(Rule(name or expr, expr))
+    return rules, errors
+
+
+# ------------------ COMPILER ------------------
+
+
+TOKEN_RE = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|([A-Za-z_]\w*)|(<=|>=|==|!=|[<>()+\-*/]))")
+FEATURE_RE = re.compile(r"(close|volume|price|macd_hist|macd|signal|sma|ema|rsi|support|resistance|avg_vol|rel_vol)(\d*)")
+NEEDS_WINDOW = {"sma", "ema", "rsi"}
+TAKES_WINDOW = NEEDS_WINDOW | {"support", "resistance", "avg_vol", "rel_vol"}
+KEYWORDS = {"and", "or", "not", "crosses_above", "crosses_below"}
+
+COMPARE = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+ARITH = {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.divide}
+
+
+def _tokens(text: str) -> list[str]:
+    out, pos = [], 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:
+            raise RuleError(f"unexpected {text[pos:].strip()[:10]!r}")
+        out.append(m.group(m.lastindex))
+        pos = m.end()
+    return out
+
+
+def _check_feature(name: str) -> None:
+    m = FEATURE_RE.fullmatch(name)
+    if m is None:
+        raise RuleError(f"unknown feature {name!r}")
+    base, window = m.groups()
+    if base in NEEDS_WINDOW and not window:
+        raise RuleError(f"{base} needs a window, e.g. {base}14")
+    if window and (base not in TAKES_WINDOW or int(window) < 1):
+        raise RuleError(f"bad window in {name!r}")
+
+
+def _crosses(a, b, above: bool) -> np.ndarray:
+    """True in the latest row where ``a`` went from <= ``b`` to > ``b`` (or the mirror)."""
+    shape = np.broadcast_shapes(np.shape(a), np.shape(b), (2, 1))
+    a, b = np.broadcast_to(a, shape), np.broadcast_to(b, shape)
+    out = np.zeros(a.shape, dtype=bool)
+    with np.errstate(invalid="ignore"):
+        if above:
+            out[-1] = (a[-2] <= b[-2]) & (a[-1] > b[-1])
+        else:
+            out[-1] = (a[-2] >= b[-2]) & (a[-1] < b[-1])
+    return out
+
+
+class _Parser:
+    """Recursive descent straight to closures; each step returns (kind, fn)
+    with kind "num" or "bool", so type errors surface at compile time.
+
+        or      := and ("or" and)*
+        and     := not ("and" not)*
+        not     := "not" not | compare
+        compare := sum ((< <= > >= == != crosses_above crosses_below) sum)?
+        sum     := term (("+" | "-") term)*
+        term    := unary (("*" | "/") unary)*
+        unary   := "-" unary | NUMBER | FEATURE | "(" or ")"
+    """
+
+    def __init__(self, text: str):
+        self.toks = _tokens(text)
+        self.pos = 0
+        self.features: set[str] = set()
+
+    def peek(self) -> str | None:
+        return self.toks[self.pos] if self.pos < len(self.toks) else None
+
+    def take(self) -> str:
+        tok = self.peek()
+        if tok is None:
+            raise RuleError("unexpected end of rule")
+        self.pos += 1
+        return tok
+
+    def parse(self) -> Callable:
+        kind, fn = self.or_()
+        if self.peek() is not None:
+            raise RuleError(f"unexpected {self.peek()!r}")
+        if kind != "bool":
+            raise RuleError("a rule must be a condition, e.g. rsi14 < 30")
+        return fn
+
+    def _logic(self, sub, word: str, op):
+        kind, fn = sub()
+        while self.peek() == word:
+            self.take()
+            kind2, fn2 = sub()
+            if kind != "bool" or kind2 != "bool":
+                raise RuleError(f"'{word}' joins conditions, not numbers")
+            fn = (lambda f, g: lambda env: op(f(env), g(env)))(fn, fn2)
+        return kind, fn
+
+    def or_(self):
+        return self._logic(self.and_, "or", np.logical_or)
+
+    def and_(self):
+        return self._logic(self.not_, "and", np.logical_and)
+
+    def not_(self):
+        if self.peek() == "not":
+            self.take()
+            kind, fn = self.not_()
+            if kind != "bool":
+                raise RuleError("'not' needs a condition")
+            return "bool", lambda env: np.logical_not(fn(env))
+        return self.compare()
+
+    def compare(self):
+        kind, left = self.sum_()
+        op = self.peek()
+        if op not in COMPARE and op not in ("crosses_above", "crosses_below"):
+            return kind, left
+        self.take()
+        kind2, right = self.sum_()
+        if kind != "num" or kind2 != "num":
+            raise RuleError(f"'{op}' compares numbers")
+        if op in COMPARE:
+            ufunc = COMPARE[op]
+
+            def cmp(env):
+                with np.errstate(invalid="ignore"):
+                    return ufunc(left(env), right(env))
+
+            return "bool", cmp
+        above = op == "crosses_above"
+        return "bool", lambda env: _crosses(left(env), right(env), above)
+
+    def _arith(self, sub, ops: str):
+        kind, fn = sub()
+        while self.peek() is not None and self.peek() in ops:
+            ufunc = ARITH[self.take()]
+            kind2, fn2 = sub()
+            if kind != "num" or kind2 != "num":
+                raise RuleError("arithmetic needs numbers")
+
+            def step(env, f=fn, g=fn2, u=ufunc):
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    return u(f(env), g(env))
+
+            fn = step
+        return kind, fn
+
+    def sum_(self):
+        return self._arith(self.term, "+-")
+
+    def term(self):
+        return self._arith(self.unary, "*/")
+
+    def unary(self):
+        tok = self.take()
+        if tok == "-":
+            kind, fn = self.unary()
+            if kind != "num":
+                raise RuleError("'-' needs a number")
+            return "num", lambda env: np.negative(fn(env))
+        if tok == "(":
+            kind, fn = self.or_()
+            if self.take() != ")":
+                raise RuleError("missing ')'")
+            return kind, fn
+        if tok[0].isdigit() or tok[0] == ".":
+            value = float(tok)
+            return "num", lambda env: value
+        if tok in KEYWORDS or not (tok[0].isalpha() or tok[0] == "_"):
+            raise RuleError(f"unexpected {tok!r}")
+        name = tok.lower()
+        _check_feature(name)
+        self.features.add(name)
+        return "num", lambda env: env[name]
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    expr: str
+    features: frozenset[str]
+    fn: Callable
+
+
+@lru_cache(maxsize=4096)
+def compile_rule(expr: str) -> CompiledRule:
+    """Compile one expression; raises RuleError with what is wrong."""
+    parser = _Parser(expr)
+    fn = parser.parse()  # collects parser.features as it goes
+    return CompiledRule(expr, frozenset(parser.features), fn)
+
+
+# ------------------ FEATURES ------------------
+
+
+def _tail_panels(frames: list[pd.DataFrame], depth: int) -> tuple[np.ndarray, np.ndarray]:
+    """Right-aligned (depth, symbols) close and volume arrays: the last row is
+    every symbol's latest bar whatever its calendar. Bars without a close are
+    dropped, so the only NaNs in close are the padding above short histories."""
+    close = np.full((depth, len(frames)), np.nan)
+    volume = np.full_like(close, np.nan)
+    for j, f in enumerate(frames):
+        c = f["Close"].to_numpy(dtype="float64")
+        keep = ~np.isnan(c)
+        c = c[keep][-depth:]
+        close[depth - len(c) :, j] = c
+        if "Volume" in f:
+            v = f["Volume"].to_numpy(dtype="float64")[keep][-depth:]
+            volume[depth - len(v) :, j] = v
+    return close, volume
+
+
+def _ema_last(arr: np.ndarray, span: int) -> np.ndarray:
+    """Last row of ``ema_2d(arr, span)`` as one weighted sum instead of a pass
+    over every row; ``arr`` may only have leading NaNs."""
+    n = len(arr)
+    alpha = 2.0 / (span + 1)
+    beta = 1 - alpha
+    valid = ~np.isnan(arr)
+    first = n - valid.sum(axis=0)
+    out = (alpha * beta ** np.arange(n - 1, -1, -1)) @ np.where(valid, arr, 0.0)
+    # the seed value carries beta^age where later bars carry alpha * beta^age
+    has = first < n
+    seed = arr[np.minimum(first, n - 1), np.arange(arr.shape[1])]
+    out += beta ** (n - first) * np.where(has, seed, 0.0)
+    return np.where(has, out, np.nan)
+
+
+def _rsi_last(arr: np.ndarray, period: int) -> np.ndarray:
+    """Last row of ``_wilder_rsi_2d(arr, period)`` in closed form. Wilder's
+    averages are linear in the moves: the seeding moves all decay from the end
+    of the seed, later ones from their own bar. ``arr`` may only have leading NaNs."""
+    if len(arr) < 2:
+        return np.full(arr.shape[1], np.nan)
+    deltas = np.diff(arr, axis=0)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    last = len(deltas) - 1
+    seed_end = len(deltas) - (~np.isnan(deltas)).sum(axis=0) + period - 1
+    age = last - np.maximum(np.arange(len(deltas))[:, None], seed_end)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        weights = (1 - 1 / period) ** age / period
+        avg_gain = (weights * gains).sum(axis=0)
+        avg_loss = (weights * losses).sum(axis=0)
+        rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    return np.where(seed_end <= last, rsi, np.nan)
+
+
+def _window(arr: np.ndarray, w: int, reduce) -> np.ndarray:
+    """``reduce`` over the ``w`` bars ending at the previous and the latest bar."""
+    rows = np.full((2, arr.shape[1]), np.nan)
+    if len(arr) >= w:
+        rows[1] = reduce(arr[-w:], axis=0)
+    if len(arr) > w:
+        rows[0] = reduce(arr[-w - 1 : -1], axis=0)
+    return rows
+
+
+class _Features:
+    """Indicator rows (previous bar, latest bar) x symbols, computed on first use."""
+
+    def __init__(self, close: np.ndarray, volume: np.ndarray, live: np.ndarray):
+        self.close = close
+        self.volume = volume
+        self.live = live
+        self._cache: dict[str, np.ndarray] = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        hit = self._cache.get(name)
+        if hit is None:
+            hit = self._cache[name] = self._compute(name)
+        return hit
+
+    def _valid(self, key: str, arr: np.ndarray) -> np.ndarray:
+        """Non-NaN bar counts up to the previous and the latest bar."""
+        return self._full(key, lambda: np.cumsum(~np.isnan(arr), axis=0)[-2:])
+
+    def _full(self, key: str, build) -> np.ndarray:
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def _compute(self, name: str) -> np.ndarray:
+        base, window = FEATURE_RE.fullmatch(name).groups()
+        close, vol = self.close, self.volume
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if base == "close":
+                return close[-2:]
+            if base == "volume":
+                return vol[-2:]
+            if base == "price":
+                return np.vstack([close[-2], self.live])
+            if base == "sma":
+                return _window(close, int(window), np.mean)
+            if base == "ema":
+                w = int(window)
+                ema = np.vstack([_ema_last(close[:-1], w), _ema_last(close, w)])
+                return np.where(self._valid("_n_close", close) >= w, ema, np.nan)
+            if base == "rsi":
+                w = int(window)
+                return np.vstack([_rsi_last(close[:-1], w), _rsi_last(close, w)])
+            if base in ("macd", "signal", "macd_hist"):
+                line = self._full("_macd", lambda: ema_2d(close, 12) - ema_2d(close, 26))
+                sig = self._full("_signal", lambda: ema_2d(line, 9))
+                value = {"macd": line, "signal": sig, "macd_hist": line - sig}[base][-2:]
+                return np.where(self._valid("_n_close", close) >= 35, value, np.nan)
+            if base == "support":
+                return _window(close, int(window or 30), np.min)
+            if base == "resistance":
+                return _window(close, int(window or 30), np.max)
+            w = int(window or 20)
+            avg = np.where(self._valid("_n_vol", vol) >= w + 1, _window(vol, w, np.mean), np.nan)
+            if base == "avg_vol":
+                return avg
+            return np.where(avg == 0, np.nan, vol[-2:] / avg)
+
+
+def evaluate_rules(
+    rules: list[CompiledRule], frames: dict[str, pd.DataFrame], prices: dict
+) -> tuple[list[str], np.ndarray]:
+    """Symbols with bars and a (rules x symbols) bool matrix: which rules
+    hold on each symbol's latest bar."""
+    syms = [s for s, f in frames.items() if f is not None and not f.empty and "Close" in f]
+    if not syms or not rules:
+        return syms, np.zeros((len(rules), len(syms)), dtype=bool)
+    picked = [frames[s] for s in syms]
+    depth = max(2, min(MAX_LOOKBACK, max(len(f) for f in picked)))
+    live = np.array([np.nan if prices.get(s) is None else float(prices[s]) for s in syms])
+    env = _Features(*_tail_panels(picked, depth), live)
+    with timed("alerts.evaluate"):
+        out = np.vstack([np.broadcast_to(rule.fn(env), (2, len(syms)))[-1] for rule in rules])
+    return syms, out
+
+
+# ------------------ ENGINE ------------------
+
+
+class AlertEngine:
+    """Edge-triggered alerts for a fixed rule set.
+
+    ``evaluate`` has the scanner shard signature, so pages hand it straight
+    to ``run_scan``. On the first pass every rule that holds fires once.
+    """
+
+    def __init__(self, rules: list[Rule], log_size: int = LOG_SIZE):
+        self.rules = list(rules)
+        self._compiled = [compile_rule(r.expr) for r in self.rules]
+        self._col: dict[str, int] = {}
+        self._state = np.zeros((len(self.rules), 64), dtype=bool)
+        self._seen: dict[str, tuple] = {}
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._price: dict[str, float | None] = {}
+        self.log: deque[dict] = deque(maxlen=log_size)
+        self._lock = threading.Lock()
+
+    def _columns(self, syms: list[str]) -> np.ndarray:
+        for sym in syms:
+            if sym not in self._col:
+                self._col[sym] = len(self._col)
+        if len(self._col) > self._state.shape[1]:
+            grown = np.zeros((len(self.rules), 2 * len(self._col)), dtype=bool)
+            grown[:, : self._state.shape[1]] = self._state
+            self._state = grown
+        return np.fromiter((self._col[s] for s in syms), dtype=np.intp, count=len(syms))
+
+    def evaluate(self, symbols: list[str], hist: dict, prices: dict) -> pd.DataFrame:
+        """Alerts that fired among ``symbols`` since the last pass."""
+        with self._lock:
+            changed = {}
+            for sym in symbols:
+                h = hist.get(sym)
+                if h is None or h.empty or "Close" not in h:
+                    continue
+                live = prices.get(sym)
+                live = None if live is None else float(live)
+                if h is self._frames.get(sym) and self._seen[sym][1] == live:
+                    # the refresher hands back the same frame until its bars change
+                    continue
+                key = (bars_key(h), live)
+                self._frames[sym] = h
+                if self._seen.get(sym) != key:
+                    self._seen[sym] = key
+                    changed[sym] = h
+            count("alerts.unchanged", len(symbols) - len(changed))
+            if not changed:
+                return _events([])
+
+            syms, now = evaluate_rules(self._compiled, changed, prices)
+            cols = self._columns(syms)
+            fired = now & ~self._state[:, cols]
+            self._state[:, cols] = now
+            for sym in syms:
+                self._price[sym] = prices.get(sym)
+
+            stamp = datetime.now(IST).strftime("%H:%M:%S")
+            rows = [
+                {
+                    "Time": stamp,
+                    "Symbol": syms[j],
+                    "Alert": self.rules[i].name,
+                    "Price": _price(prices.get(syms[j]), changed[syms[j]]),
+                }
+                for j, i in zip(*np.nonzero(fired.T))
+            ]
+            count("alerts.fired", len(rows))
+            self.log.extendleft(reversed(rows))
+            return _events(rows)
+
+    def active(self) -> pd.DataFrame:
+        """Rules that hold right now, one row per symbol."""
+        with self._lock:
+            rows = []
+            for sym, j in self._col.items():
+                names = [self.rules[i].name for i in np.flatnonzero(self._state[:, j])]
+                if names:
+                    live = self._price.get(sym)
+                    rows.append({"Symbol": sym, "Price": None if live is None else round(live, 2), "Alerts": " | ".join(names)})
+            return pd.DataFrame(rows, columns=["Symbol", "Price", "Alerts"])
+
+
+def _price(live, h: pd.DataFrame) -> float:
+    return round(float(live) if live is not None else float(h["Close"].iloc[-1]), 2)
+
+
+def _events(rows: list[dict]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["Time", "Symbol", "Alert", "Price"])
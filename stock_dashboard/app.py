@@ -14,12 +14,14 @@ Ye project multi-page **Streamlit trading analytics suite** hai:
 3. Screener – Basic trend screener + swing picks  
 4. Ranking Engine – Smart algo rank (Score /100)  
 5. Breakout Scanner – Support/Resistance breakout check  
-6. Alerts Panel – Live conditions based alerts  
+6. Alerts Panel – Apne rules (`rsi14 < 30 and sma5 crosses_above sma20`), sirf naye crossings pe alert  
 7. Pattern AI – Simple pattern style checks  
 8. Institutional Flow – Volume-based accumulation/distribution view  
-9. Tomorrow Picks – Best candidates for next session
+9. Tomorrow Picks – Best candidates for next session  
+10. Diagnostics – Stage timings, counters & cache stats
 
 Left sidebar se **symbol & watchlist** change kar sakte ho.
+Scanner pages pe **Scan → Universe** choose karke poori index list (CSV in `universes/`, e.g. NSE ka `ind_nifty500list.csv`) shard-by-shard scan kar sakte ho.
 """)
 
 st.markdown(f"**Default symbol:** `{DEFAULT_SYMBOL}`")
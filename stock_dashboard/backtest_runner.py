@@ -0,0 +1,119 @@
+"""Universe-wide SMA crossover backtests on a process pool.
+
+The close panel is written once, symbol-major (symbols x dates, float64),
+to a temporary memory-mapped file; workers map it read-only and receive
+only a shard of row numbers, so no DataFrame is pickled per symbol. Results stream back
+shard by shard as workers finish.
+
+Headless use:
+
+    python backtest_runner.py --symbols RELIANCE,TCS,SBIN --period 5y --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+SHARD_SIZE = 25  # symbols per task
+
+
+def _as_windows(w) -> list[int]:
+    return [int(w)] if np.isscalar(w) else [int(x) for x in w]
+
+
+def _run_shard(path: str, columns: list[int], fast, slow) -> list[tuple[int, pd.DataFrame]]:
+    from core import sma_crossover_sweep
+
+    panel = np.load(path, mmap_mode="r")
+    out = []
+    for col in columns:
+        close = np.asarray(panel[col])
+        close = close[~np.isnan(close)]
+        table = sma_crossover_sweep(pd.DataFrame({"Close": close}), fast, slow)
+        if table is not None:
+            out.append((col, table.dropna(subset=["strategy_return_pct"])))
+    return out
+
+
+def run_universe_backtest(
+    close: pd.DataFrame,
+    fast=20,
+    slow=50,
+    workers: int = DEFAULT_WORKERS,
+    shard_size: int = SHARD_SIZE,
+):
+    """Yield ``(symbol, table)`` for every column of a dates x symbols close
+    panel as shards complete.
+
+    ``fast`` / ``slow`` take a single window or a range; ``table`` has one
+    row per pair in the sma_crossover_sweep layout. Symbols with too few
+    candles yield an empty table.
+    """
+    fast, slow = _as_windows(fast), _as_windows(slow)
+    symbols = list(close.columns)
+    # symbol-major so every worker reads one contiguous row per symbol
+    data = np.ascontiguousarray(close.to_numpy(dtype="float64").T)
+
+    fd, path = tempfile.mkstemp(suffix=".npy", prefix="nse_panel_")
+    os.close(fd)
+    try:
+        np.save(path, data)
+        shards = [
+            list(range(i, min(i + shard_size, len(symbols))))
+            for i in range(0, len(symbols), shard_size)
+        ]
+        # spawn: forking a threaded Streamlit server is not safe
+        ctx = get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max(1, workers), mp_context=ctx) as pool:
+            futures = [pool.submit(_run_shard, path, shard, fast, slow) for shard in shards]
+            for fut in as_completed(futures):
+                for col, table in fut.result():
+                    yield symbols[col], table
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="SMA crossover backtest over a symbol universe")
+    parser.add_argument("--symbols", required=True, help="comma separated NSE symbols")
+    parser.add_argument("--period", default="1y")
+    parser.add_argument("--fast", type=int, default=20)
+    parser.add_argument("--slow", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--out", default="backtest_results.csv")
+    args = parser.parse_args(argv)
+
+    from core import get_history_batch
+    from panel import Panel
+
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+    close = Panel.from_frames(get_history_batch(symbols, args.period, "1d"), ("Close",)).frame("Close")
+    if close.empty:
+        print("No history for any symbol.", file=sys.stderr)
+        return 1
+
+    rows = []
+    for sym, table in run_universe_backtest(close, args.fast, args.slow, args.workers):
+        if not table.empty:
+            rows.append(table.assign(Symbol=sym))
+        print(f"{sym}: done", file=sys.stderr)
+    if not rows:
+        print("Not enough candles for any symbol.", file=sys.stderr)
+        return 1
+    pd.concat(rows, ignore_index=True).to_csv(args.out, index=False)
+    print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
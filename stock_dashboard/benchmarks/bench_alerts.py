@@ -0,0 +1,83 @@
+"""Alert rule engine: hundreds of rules over hundreds of symbols per refresh.
+
+    python benchmarks/bench_alerts.py
+    python benchmarks/bench_alerts.py --rules 500 --symbols 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from alert_rules import AlertEngine, Rule, compile_rule  # noqa: E402
+from benchmarks.synthetic import synthetic_ohlcv, synthetic_symbols  # noqa: E402
+
+TEMPLATES = (
+    "rsi{a} < {lo}",
+    "rsi{a} > {hi}",
+    "sma{a} crosses_above sma{b}",
+    "ema{a} crosses_below ema{b}",
+    "macd crosses_above signal and rsi{a} < {hi}",
+    "close > resistance{b} * 0.98 and rel_vol > 1.{a}",
+    "price crosses_above sma{b} or (close - support{a}) / close < 0.0{a}",
+    "not macd_hist > 0 and volume > avg_vol{a} * 2",
+)
+
+
+def make_rules(n: int, seed: int = 0) -> list[Rule]:
+    rng = random.Random(seed)
+    rules = []
+    for i in range(n):
+        a = rng.randint(3, 20)
+        expr = rng.choice(TEMPLATES).format(a=a, b=a + rng.randint(5, 40), lo=rng.randint(20, 40), hi=rng.randint(60, 80))
+        rules.append(Rule(f"r{i}", expr))
+    return rules
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rules", type=int, default=300)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--changed", type=int, default=20, help="symbols with a new price per tick")
+    args = parser.parse_args(argv)
+
+    syms = synthetic_symbols(args.symbols)
+    hist = {s: synthetic_ohlcv(130, seed=i) for i, s in enumerate(syms)}
+    prices = {s: float(h["Close"].iloc[-1]) for s, h in hist.items()}
+    rules = make_rules(args.rules)
+
+    t0 = time.perf_counter()
+    compile_rule.cache_clear()
+    for r in rules:
+        compile_rule(r.expr)
+    print(f"compile {len(rules)} rules: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    engine = AlertEngine(rules)
+    t0 = time.perf_counter()
+    fired = engine.evaluate(syms, hist, prices)
+    print(f"first pass, {len(syms)} symbols: {(time.perf_counter() - t0) * 1e3:.1f} ms, {len(fired)} alerts")
+
+    t0 = time.perf_counter()
+    engine.evaluate(syms, hist, prices)
+    print(f"nothing changed: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    rng = random.Random(1)
+    times, total = [], 0
+    for _ in range(20):
+        for s in rng.sample(syms, args.changed):
+            prices[s] *= 1 + rng.uniform(-0.01, 0.01)
+        t0 = time.perf_counter()
+        total += len(engine.evaluate(syms, hist, prices))
+        times.append(time.perf_counter() - t0)
+    times.sort()
+    print(
+        f"tick, {args.changed} changed: median {times[len(times) // 2] * 1e3:.1f} ms, "
+        f"max {times[-1] * 1e3:.1f} ms, {total} alerts over {len(times)} ticks"
+    )
+
+
+if __name__ == "__main__":
+    main()
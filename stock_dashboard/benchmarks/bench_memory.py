@@ -0,0 +1,51 @@
+"""Memory held for a universe: yfinance-layout frames, float64 build_panel
+panels and the compact ``Panel``.
+
+    python benchmarks/bench_memory.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import build_panel  # noqa: E402
+from benchmarks.synthetic import synthetic_universe  # noqa: E402
+from panel import Panel  # noqa: E402
+
+SYMBOLS = 2000
+BARS = 1250  # ~5 years of sessions
+
+
+def _mb(n: int) -> str:
+    return f"{n / 2**20:>9.1f} MB"
+
+
+def main() -> None:
+    frames = synthetic_universe(SYMBOLS, BARS)
+    held = sum(int(df.memory_usage(deep=True, index=True).sum()) for df in frames.values())
+    print(f"{SYMBOLS} symbols x {BARS} bars")
+    print(f"  {'frames (6 columns + index each)':<44}{_mb(held)}")
+
+    t0 = time.perf_counter()
+    wide = {col: build_panel(frames, col) for col in ("Close", "Volume")}
+    build_s = time.perf_counter() - t0
+    wide_bytes = sum(int(df.memory_usage(index=True).sum()) for df in wide.values())
+    print(f"  {'build_panel Close + Volume (float64)':<44}{_mb(wide_bytes)}  {build_s * 1e3:7.0f} ms")
+
+    for cols in (("Close", "Volume"), ("Open", "High", "Low", "Close", "Volume")):
+        t0 = time.perf_counter()
+        panel = Panel.from_frames(frames, cols)
+        build_s = time.perf_counter() - t0
+        label = f"Panel {' + '.join(cols)}"
+        print(f"  {label:<44}{_mb(panel.nbytes)}  {build_s * 1e3:7.0f} ms  ({held / panel.nbytes:.0f}x smaller)")
+
+    t0 = time.perf_counter()
+    for sym in panel.symbols:
+        panel.series(sym)
+    print(f"  per-symbol views: {(time.perf_counter() - t0) / len(panel) * 1e6:.1f} us each, no copy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Full-history pattern scan on a large synthetic panel.
+
+    python benchmarks/bench_patterns.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import build_panel  # noqa: E402
+from patterns import pattern_stats, scan_patterns  # noqa: E402
+from benchmarks.synthetic import synthetic_universe  # noqa: E402
+
+CASES = ((500, 1250), (2000, 1250))
+
+
+def main() -> None:
+    print(f"{'symbols':>8} {'bars':>6} {'windows':>10} {'scan (s)':>9} {'occurrences':>12}")
+    for n_symbols, n_bars in CASES:
+        close = build_panel(synthetic_universe(n_symbols, n_bars), "Close")
+        t0 = time.perf_counter()
+        occ = scan_patterns(close)
+        pattern_stats(occ)
+        elapsed = time.perf_counter() - t0
+        windows = (n_bars - 40 + 1) * n_symbols
+        print(f"{n_symbols:>8} {n_bars:>6} {windows:>10} {elapsed:>9.2f} {len(occ):>12}")
+
+
+if __name__ == "__main__":
+    main()
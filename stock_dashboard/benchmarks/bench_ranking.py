@@ -0,0 +1,68 @@
+"""Incremental ranking on a large universe: full build, then one quote moving.
+
+    python benchmarks/bench_ranking.py
+    python benchmarks/bench_ranking.py --symbols 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import SyntheticSource, synthetic_symbols  # noqa: E402
+from core import RankWeights  # noqa: E402
+from ranking import RankingService  # noqa: E402
+from refresher import Refresher  # noqa: E402
+
+TARGET_MS = 100  # rerank after one quote update, 2000 symbols
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--symbols", type=int, default=2000)
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    syms = synthetic_symbols(args.symbols)
+    data = Refresher(SyntheticSource(), period="1y", cold_wait=60).start()
+    hist = data.history(syms, "6mo")
+    prices = data.source.quotes(syms)
+    data.stop()  # keep the stored bars fixed from here on
+
+    service = RankingService()
+    t0 = time.perf_counter()
+    service.update(syms, hist, prices)
+    print(f"first build, {len(syms)} symbols: {(time.perf_counter() - t0) * 1e3:.0f} ms")
+
+    rng = random.Random(0)
+    fetch, rerank = [], []
+    for _ in range(args.ticks):
+        sym = rng.choice(syms)
+        prices[sym] *= 1 + rng.uniform(-0.02, 0.02)
+        t0 = time.perf_counter()
+        hist = data.history(syms, "6mo")  # same slices back while the bars are unchanged
+        t1 = time.perf_counter()
+        service.update(syms, hist, prices)
+        service.top(20)
+        service.grade_counts()
+        t2 = time.perf_counter()
+        fetch.append(t1 - t0)
+        rerank.append(t2 - t1)
+
+    med, worst = np.median(rerank) * 1e3, np.max(rerank) * 1e3
+    print(f"refresher history: median {np.median(fetch) * 1e3:.1f} ms")
+    print(f"rerank after one quote: median {med:.1f} ms, max {worst:.1f} ms (target {TARGET_MS} ms)")
+
+    t0 = time.perf_counter()
+    service.set_weights(RankWeights(volume=30, near_support=5))
+    print(f"new weights, full re-score: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+    return 0 if worst < TARGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
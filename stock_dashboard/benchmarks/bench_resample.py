@@ -0,0 +1,84 @@
+"""Upstream downloads for a multi-timeframe page mix, with and without local
+resampling, plus resampling throughput.
+
+    python benchmarks/bench_resample.py
+"""
+
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import core  # noqa: E402
+from benchmarks.synthetic import synthetic_ohlcv, synthetic_symbols  # noqa: E402
+from data_access import DataAccess  # noqa: E402
+from resample import RESAMPLE_BASE, resample_bars  # noqa: E402
+
+# (period, interval) a session of pages asks for
+REQUESTS = [("3mo", "1d"), ("6mo", "1d"), ("1y", "1d"), ("1y", "1wk"), ("6mo", "1wk"), ("1y", "1mo")]
+
+
+def _fake_download(calls: list):
+    end = pd.Timestamp.now().normalize().strftime("%Y-%m-%d")
+
+    def download(symbols, **kwargs):
+        if symbols:
+            calls.append(kwargs["interval"])
+        return {s: synthetic_ohlcv(300, seed=sum(map(ord, s)), end=end) for s in symbols}
+
+    return download
+
+
+def count_downloads(syms: list[str], resample: bool) -> list[str]:
+    calls: list[str] = []
+    with ExitStack() as stack:
+        cache = stack.enter_context(tempfile.TemporaryDirectory())
+        stack.enter_context(mock.patch.object(core, "CACHE_DIR", cache))
+        stack.enter_context(mock.patch.object(core, "_download_many", _fake_download(calls)))
+        if not resample:
+            stack.enter_context(mock.patch.dict(RESAMPLE_BASE, clear=True))
+        hub = DataAccess()
+        for period, interval in REQUESTS:
+            hub.history(syms, period, interval)
+    return calls
+
+
+def intraday(days: int = 5) -> pd.DataFrame:
+    idx = pd.DatetimeIndex([])
+    for d in pd.bdate_range(end="2024-06-14", periods=days):
+        idx = idx.append(pd.date_range(d + pd.Timedelta("9h15min"), periods=375, freq="1min"))
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 0.05, len(idx)))
+    return pd.DataFrame(
+        {"Open": close, "High": close + 0.1, "Low": close - 0.1, "Close": close, "Volume": rng.integers(1, 1000, len(idx))},
+        index=idx.tz_localize("Asia/Kolkata"),
+    )
+
+
+def main() -> None:
+    syms = synthetic_symbols(50)
+    with_rs = count_downloads(syms, resample=True)
+    without = count_downloads(syms, resample=False)
+    print(f"{len(REQUESTS)} (period, interval) requests over {len(syms)} symbols")
+    print(f"  without resampling: {len(without)} downloads {sorted(set(without))}")
+    print(f"  with resampling:    {len(with_rs)} downloads {sorted(set(with_rs))}")
+
+    daily = synthetic_ohlcv(2500, seed=1)
+    minute = intraday()
+    for df, interval in ((daily, "1wk"), (daily, "1mo"), (minute, "5m"), (minute, "15m"), (minute, "60m")):
+        t0 = time.perf_counter()
+        for _ in range(20):
+            out = resample_bars(df, interval)
+        ms = (time.perf_counter() - t0) / 20 * 1e3
+        print(f"  {len(df)} bars -> {len(out)} x {interval}: {ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
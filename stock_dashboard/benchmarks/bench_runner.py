@@ -0,0 +1,38 @@
+"""Scaling of run_universe_backtest with the worker count.
+
+    python benchmarks/bench_runner.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest_runner import run_universe_backtest  # noqa: E402
+from core import build_panel  # noqa: E402
+from benchmarks.synthetic import synthetic_universe  # noqa: E402
+
+SYMBOLS = 200
+BARS = 1250
+WORKERS = (1, 2, 4, 8)
+# a small grid per symbol so the work is CPU bound rather than pool start-up
+FAST = range(5, 31, 5)
+SLOW = range(20, 201, 10)
+
+
+def main() -> None:
+    close = build_panel(synthetic_universe(SYMBOLS, BARS), "Close")
+    print(f"{SYMBOLS} symbols x {BARS} bars, {len(FAST) * len(SLOW)} pairs per symbol")
+    print(f"{'workers':>8} {'seconds':>9} {'symbols/s':>10}")
+    base = None
+    for workers in WORKERS:
+        t0 = time.perf_counter()
+        done = sum(1 for _ in run_universe_backtest(close, FAST, SLOW, workers=workers))
+        elapsed = time.perf_counter() - t0
+        base = base or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {done / elapsed:>10.1f}  ({base / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
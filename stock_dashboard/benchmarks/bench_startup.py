@@ -0,0 +1,82 @@
+"""Cold-start budget of the batch scanner, each figure from a fresh process.
+
+    python benchmarks/bench_startup.py
+
+Exits non-zero when ``scan.IMPORT_BUDGET`` or ``scan.STARTUP_BUDGET`` is
+exceeded or importing ``scan`` / ``core`` drags in a dependency it should
+load lazily, so CI can run it as a check.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+import scan  # noqa: E402
+
+RUNS = 3
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {here!r})
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {watch!r} if m in sys.modules]}}))
+"""
+
+
+def _import_probe(module: str, watch: list[str]) -> dict:
+    best = None
+    for _ in range(RUNS):
+        code = PROBE.format(here=str(HERE), module=module, watch=watch)
+        out = json.loads(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        best = out if best is None or out["seconds"] < best["seconds"] else best
+    return best
+
+
+def _end_to_end() -> float:
+    best = float("inf")
+    with tempfile.TemporaryDirectory() as out:
+        for _ in range(RUNS):
+            t0 = time.perf_counter()
+            subprocess.run(
+                [sys.executable, str(HERE / "scan.py"), "--universe", "nifty50", "--synthetic", "--out", out],
+                capture_output=True,
+                check=True,
+            )
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    failures = []
+
+    probe = _import_probe("scan", ["pandas", "numpy", "yfinance", "requests"])
+    print(f"import scan: {probe['seconds'] * 1e3:.1f} ms (budget {scan.IMPORT_BUDGET * 1e3:.0f} ms), "
+          f"heavy modules loaded: {probe['loaded'] or 'none'}")
+    if probe["seconds"] > scan.IMPORT_BUDGET or probe["loaded"]:
+        failures.append("import scan")
+
+    probe = _import_probe("core", ["yfinance", "requests"])
+    print(f"import core: {probe['seconds'] * 1e3:.0f} ms, network modules loaded: {probe['loaded'] or 'none'}")
+    if probe["loaded"]:
+        failures.append("import core")
+
+    seconds = _end_to_end()
+    print(f"scan.py --universe nifty50 --synthetic, all scans: {seconds:.2f} s (budget {scan.STARTUP_BUDGET:.1f} s)")
+    if seconds > scan.STARTUP_BUDGET:
+        failures.append("end to end")
+
+    if failures:
+        print("OVER BUDGET: " + ", ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""sma_crossover_sweep vs one sma_crossover_backtest call per pair.
+
+    python benchmarks/bench_sweep.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import sma_crossover_backtest, sma_crossover_sweep  # noqa: E402
+from benchmarks.synthetic import synthetic_ohlcv  # noqa: E402
+
+BARS = 1250  # ~5 years of daily candles
+GRIDS = {
+    "5-50 x 20-200": (range(5, 51), range(20, 201)),
+    "2-100 x 10-300": (range(2, 101), range(10, 301)),
+}
+LOOP_SAMPLE = 200  # pairs timed with the per-pair backtest
+
+
+def main() -> None:
+    df = synthetic_ohlcv(BARS, seed=1)
+
+    fast, slow = GRIDS["5-50 x 20-200"]
+    pairs = [(f, s) for f in fast for s in slow][:LOOP_SAMPLE]
+    t0 = time.perf_counter()
+    for f, s in pairs:
+        sma_crossover_backtest(df, f, s)
+    per_pair = (time.perf_counter() - t0) / len(pairs)
+
+    print(f"{'grid':>16} {'pairs':>7} {'sweep (s)':>10} {'loop est. (s)':>14}")
+    for name, (fast, slow) in GRIDS.items():
+        t0 = time.perf_counter()
+        table = sma_crossover_sweep(df, fast, slow)
+        sweep_s = time.perf_counter() - t0
+        print(f"{name:>16} {len(table):>7} {sweep_s:>10.3f} {per_pair * len(table):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
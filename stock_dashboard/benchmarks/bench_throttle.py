@@ -0,0 +1,91 @@
+"""Quote fetching against a throttling stub: unthrottled vs rate-limited client,
+then an outage with the circuit breaker open.
+
+    python benchmarks/bench_throttle.py
+    python benchmarks/bench_throttle.py --symbols 100 --server-rate 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import QuoteClient  # noqa: E402
+from benchmarks.nse_stub import NseStub  # noqa: E402
+from benchmarks.synthetic import synthetic_symbols  # noqa: E402
+from upstream import CircuitBreaker  # noqa: E402
+
+
+def _timed_fetches(client: QuoteClient) -> list[float]:
+    """Per-symbol wall time of every ``_fetch`` the client makes."""
+    samples = []
+    fetch = client._fetch
+
+    def wrapper(symbol):
+        t0 = time.perf_counter()
+        try:
+            return fetch(symbol)
+        finally:
+            samples.append(time.perf_counter() - t0)
+
+    client._fetch = wrapper
+    return samples
+
+
+def run(name: str, stub: NseStub, client: QuoteClient, syms: list[str]) -> dict:
+    before = dict(stub.stats)
+    samples = _timed_fetches(client)
+    t0 = time.perf_counter()
+    prices = client.get_many(syms)
+    elapsed = time.perf_counter() - t0
+    got = [p for p in prices.values() if p is not None]
+    ms = np.asarray(samples) * 1e3
+    res = {
+        "name": name,
+        "elapsed_s": elapsed,
+        "fresh": sum(not getattr(p, "stale", False) for p in got),
+        "stale": sum(getattr(p, "stale", False) for p in got),
+        "missing": len(syms) - len(got),
+        "quotes_per_s": len(got) / elapsed,
+        "p50_ms": np.percentile(ms, 50),
+        "p99_ms": np.percentile(ms, 99),
+        "max_ms": ms.max(),
+        "throttled": stub.stats["throttled"] - before["throttled"],
+    }
+    print(
+        f"{name:<12} {elapsed:6.1f}s  fresh {res['fresh']:>4}  stale {res['stale']:>4}  missing {res['missing']:>4}"
+        f"  {res['quotes_per_s']:6.1f} q/s  p50 {res['p50_ms']:7.0f} ms  p99 {res['p99_ms']:7.0f} ms"
+        f"  429s {res['throttled']}"
+    )
+    return res
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--server-rate", type=float, default=20.0, help="requests/s the stub accepts")
+    args = parser.parse_args(argv)
+    syms = synthetic_symbols(args.symbols)
+
+    with NseStub(rate=args.server_rate) as stub:
+        # no client-side limit, one try per symbol: how the fetcher used to behave
+        naive = QuoteClient(base_url=stub.url, ttl=0, rate=1e6, burst=1e6, attempts=1, breaker=CircuitBreaker(10**9))
+        run("unthrottled", stub, naive, syms)
+
+        # just under the server's limit, with retries and backoff
+        limited = QuoteClient(base_url=stub.url, ttl=0, rate=args.server_rate * 0.9, burst=2)
+        run("rate-limited", stub, limited, syms)
+
+        # endpoint goes down: the breaker opens after a few failures and the
+        # rest are answered at once from the last good prices
+        stub.down = True
+        run("outage", stub, limited, syms)
+        print(f"breaker: {limited.breaker.state}")
+
+
+if __name__ == "__main__":
+    main()
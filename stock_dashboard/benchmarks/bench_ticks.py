@@ -0,0 +1,69 @@
+"""Tick store throughput: one trading day of 500 symbols at a 1 s cadence.
+
+    python benchmarks/bench_ticks.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tick_store import TickStore  # noqa: E402
+
+SYMBOLS = 500
+SECONDS = 6 * 3600 + 15 * 60  # 09:15 - 15:30
+OPEN_TS = 1718336700.0  # 2024-06-14 09:15 IST
+
+
+def _rss_mb() -> tuple[float, float]:
+    """(anonymous, file-backed) resident MB; mapped tick pages are the latter
+    and the kernel can drop them at any time. Linux only."""
+    fields = {}
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            key, _, value = line.partition(":")
+            fields[key] = value
+    return tuple(int(fields[k].split()[0]) / 1024 for k in ("RssAnon", "RssFile"))
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    names = [f"SYM{i:04d}" for i in range(SYMBOLS)]
+    base = rng.uniform(50, 5000, SYMBOLS)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = TickStore(root)
+        anon0, _ = _rss_mb()
+        t0 = time.perf_counter()
+        for sec in range(SECONDS):
+            px = base * (1 + rng.normal(0, 1e-4, SYMBOLS))
+            store.append(OPEN_TS + sec, names, px, rng.integers(1, 500, SYMBOLS))
+        append_s = time.perf_counter() - t0
+        store.flush()
+        rows = SYMBOLS * SECONDS
+        print(f"appended {rows:,} ticks in {append_s:.1f}s ({rows / append_s:,.0f} ticks/s, "
+              f"{append_s / SECONDS * 1e3:.2f} ms per 500-symbol poll)")
+
+        t0 = time.perf_counter()
+        window = store.range(OPEN_TS + 3600, OPEN_TS + 3900)
+        print(f"5-minute range, all symbols: {len(window['ts']):,} rows in "
+              f"{(time.perf_counter() - t0) * 1e3:.2f} ms (view: {window['ts'].base is not None})")
+
+        # a fresh reader, as another process would open the day
+        store = TickStore(root, readonly=True)
+        for freq in ("1m", "5m"):
+            t0 = time.perf_counter()
+            bars = store.bars("SYM0250", freq, start=OPEN_TS, end=OPEN_TS + SECONDS)
+            print(f"{freq} bars for one symbol over the day: {len(bars)} bars in "
+                  f"{(time.perf_counter() - t0) * 1e3:.1f} ms")
+        anon, mapped = _rss_mb()
+        print(f"day on disk: {rows * 28 / 2**20:.0f} MB; heap grew by {anon - anon0:.0f} MB, "
+              f"{mapped:.0f} MB of file pages resident")
+
+
+if __name__ == "__main__":
+    main()
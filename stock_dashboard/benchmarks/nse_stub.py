@@ -0,0 +1,111 @@
+"""Local stand-in for the NSE quote endpoint that throttles like the real one.
+
+    with NseStub(rate=5) as stub:
+        client = core.QuoteClient(base_url=stub.url)
+
+The home page hands out a cookie; ``/api/quote-equity?symbol=X`` answers
+401 without it, 429 (with ``Retry-After``) once requests exceed ``rate``
+per second, and 503 while ``down`` is set. Prices are deterministic per
+symbol, and ``latency`` seconds are added to every answer. Connections
+are kept alive (HTTP/1.1) and ``stats["connections"]`` counts the ones
+opened, so a pooled client shows up as few connections for many requests.
+"""
+
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class NseStub:
+    def __init__(self, rate: float = 5.0, latency: float = 0.02, retry_after: float = 1.0):
+        self.rate = rate
+        self.latency = latency
+        self.retry_after = retry_after
+        self.down = False
+        self.stats = {"ok": 0, "throttled": 0, "unauthorized": 0, "down": 0, "connections": 0}
+        self._window: list[float] = []  # request times in the last second
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _admit(self) -> bool:
+        """Sliding one-second window of at most ``rate`` requests."""
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.rate:
+                return False
+            self._window.append(now)
+            return True
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                stub._count("connections")
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: dict | None = None, headers: dict | None = None):
+                payload = json.dumps(body or {}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                time.sleep(stub.latency)
+                url = urlparse(self.path)
+                if url.path != "/api/quote-equity":
+                    return self._send(200, headers={"Set-Cookie": "nsit=stub; Path=/"})
+                if stub.down:
+                    stub._count("down")
+                    return self._send(503)
+                if "nsit=stub" not in (self.headers.get("Cookie") or ""):
+                    stub._count("unauthorized")
+                    return self._send(401)
+                if not stub._admit():
+                    stub._count("throttled")
+                    return self._send(429, headers={"Retry-After": f"{stub.retry_after:g}"})
+                stub._count("ok")
+                symbol = parse_qs(url.query).get("symbol", [""])[0]
+                price = 100 + zlib.crc32(symbol.encode()) % 4000 / 10
+                self._send(200, {"info": {"symbol": symbol}, "priceInfo": {"lastPrice": price}})
+
+        return Handler
+
+    def start(self) -> "NseStub":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "NseStub":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
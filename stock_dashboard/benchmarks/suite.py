@@ -0,0 +1,200 @@
+"""Offline benchmark suite: core micro-benchmarks and every page's scan loop.
+
+    python benchmarks/suite.py                      # writes results/<commit>.json
+    python benchmarks/suite.py --quick              # skip the 1000-symbol scans
+    python benchmarks/suite.py --compare results/abc1234.json
+
+Network access is stubbed with ``synthetic.offline`` (deterministic bars
+and quotes behind core's get_history / get_live_price functions). Every
+figure is the min and median seconds per call over several runs. The
+indicator memo is cleared before each run, so the numbers are for cold
+computation. ``--compare`` prints the ratio of the min times to an earlier
+result file and exits non-zero when anything is slower than ``--threshold``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import core  # noqa: E402
+from benchmarks.synthetic import offline, synthetic_ohlcv, synthetic_symbols  # noqa: E402
+
+SCAN_SIZES = (10, 100, 1000)
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+MIN_SAMPLE_S = 0.02  # a micro-benchmark sample loops until it takes this long
+
+
+def _timeit(fn, setup=None, runs: int = 5) -> dict:
+    """Seconds per call of ``fn()``; ``setup()`` runs untimed before each sample."""
+    if setup:
+        setup()
+    t0 = time.perf_counter()
+    fn()
+    once = time.perf_counter() - t0
+    number = max(1, int(MIN_SAMPLE_S / once)) if once > 0 else 1000
+
+    samples = []
+    for _ in range(runs):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return {"min_s": min(samples), "median_s": statistics.median(samples), "runs": runs, "number": number}
+
+
+def _cold():
+    core._indicator_cache.clear()
+
+
+# ------------------ MICRO ------------------
+
+
+def micro_benchmarks(n_bars: int = 250) -> dict:
+    df = synthetic_ohlcv(n_bars, seed=1)
+    close, volume = df["Close"], df["Volume"]
+    live = float(close.iloc[-1])
+    cases = {
+        "calc_sma": lambda: core.calc_sma(close, 20),
+        "calc_ema": lambda: core.calc_ema(close, 20),
+        "calc_rsi": lambda: core.calc_rsi(close, 14),
+        "calc_macd": lambda: core.calc_macd(close),
+        "calc_sr": lambda: core.calc_sr(close, 30),
+        "volume_check": lambda: core.volume_check(volume, 20),
+        "compute_snapshot": lambda: core.compute_snapshot(df),
+        "sma_crossover_backtest": lambda: core.sma_crossover_backtest(df, 20, 50),
+        "rank_score": lambda: core.rank_score("SYN", df, live),
+        "detect_breakout": lambda: core.detect_breakout(df),
+    }
+    out = {}
+    for name, fn in cases.items():
+        out[f"micro/{name}"] = {"group": "micro", "n": n_bars, **_timeit(fn, setup=_cold)}
+    return out
+
+
+# ------------------ SCANS ------------------
+
+
+def _pattern_page(syms: list[str], hist: dict, prices: dict) -> pd.DataFrame:
+    from patterns import latest_patterns, pattern_stats, scan_patterns
+
+    close = core.build_panel({s: h for s, h in hist.items() if h is not None}, "Close")
+    latest_patterns(close)
+    return pattern_stats(scan_patterns(close))
+
+
+def _backtest_page(syms: list[str], hist: dict, prices: dict) -> list:
+    return [core.sma_crossover_backtest(hist[s]) for s in syms if hist.get(s) is not None]
+
+
+def scan_benchmarks(sizes=SCAN_SIZES) -> dict:
+    """Each page's per-watchlist work: fetch through a fresh (stubbed) hub,
+    then the page's scan over every symbol as a single shard."""
+    from data_access import DataAccess
+    from scanners import SCANNERS
+
+    pages = {name: (s.fn, s.period, True) for name, s in SCANNERS.items()}
+    pages["patterns"] = (_pattern_page, "2y", False)
+    pages["backtest"] = (_backtest_page, "1y", False)
+
+    out = {}
+    with offline(n_bars=520):
+        for n in sizes:
+            syms = synthetic_symbols(n)
+            for name, (fn, period, quotes) in pages.items():
+
+                def run():
+                    hub = DataAccess()
+                    hist = hub.history(syms, period, "1d")
+                    prices = hub.quotes(syms) if quotes else {}
+                    fn(syms, hist, prices)
+
+                runs = 3 if n < 1000 else 1
+                out[f"scan/{name}/{n}"] = {"group": "scan", "n": n, **_timeit(run, setup=_cold, runs=runs)}
+                print(f"  scan/{name}/{n}: {out[f'scan/{name}/{n}']['median_s'] * 1e3:.1f} ms", file=sys.stderr)
+    return out
+
+
+# ------------------ RESULTS ------------------
+
+
+def _git(*args: str) -> str | None:
+    try:
+        res = subprocess.run(["git", *args], capture_output=True, text=True, cwd=Path(__file__).parent, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return res.stdout.strip() if res.returncode == 0 else None
+
+
+def meta() -> dict:
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--", ".")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(base: dict, now: dict, threshold: float) -> list[str]:
+    """Print per-benchmark ratios; names of those slower than ``threshold``x."""
+    slower = []
+    print(f"{'benchmark':<36} {'base ms':>10} {'now ms':>10} {'ratio':>7}")
+    for name, res in now["results"].items():
+        old = base["results"].get(name)
+        if old is None:
+            continue
+        # min is the least noisy estimate of the true cost
+        ratio = res["min_s"] / old["min_s"] if old["min_s"] else float("inf")
+        flag = "  <-- slower" if ratio > threshold else ""
+        print(f"{name:<36} {old['min_s'] * 1e3:>10.3f} {res['min_s'] * 1e3:>10.3f} {ratio:>6.2f}x{flag}")
+        if ratio > threshold:
+            slower.append(name)
+    return slower
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="offline benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="skip the 1000-symbol scans")
+    parser.add_argument("--out", help="result file (default results/<commit>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio that fails --compare")
+    args = parser.parse_args(argv)
+
+    info = meta()
+    results = micro_benchmarks()
+    for name, res in results.items():
+        print(f"  {name}: {res['median_s'] * 1e6:.1f} us", file=sys.stderr)
+    results.update(scan_benchmarks(SCAN_SIZES[:-1] if args.quick else SCAN_SIZES))
+    report = {"meta": info, "results": results}
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"{info['commit'] or 'local'}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"Wrote {out}")
+
+    if args.compare:
+        slower = compare(json.loads(Path(args.compare).read_text()), report, args.threshold)
+        if slower:
+            print(f"{len(slower)} benchmark(s) slower than {args.threshold}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Deterministic synthetic OHLCV data so benchmarks run without NSE / Yahoo."""
+
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_ohlcv(n_bars: int = 250, seed: int = 0, end: str = "2024-12-31") -> pd.DataFrame:
+    """One symbol's daily bars as a geometric random walk, yfinance column layout."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=end, periods=n_bars)
+
+    start_price = rng.uniform(50, 3000)
+    rets = rng.normal(0.0003, 0.018, n_bars)
+    close = start_price * np.exp(np.cumsum(rets))
+    open_ = close * np.exp(rng.normal(0, 0.006, n_bars))
+    spread = np.abs(rng.normal(0, 0.01, n_bars)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(13, 0.5, n_bars).astype("int64")
+
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": volume,
+        },
+        index=index,
+    )
+
+
+def synthetic_symbols(n_symbols: int) -> list[str]:
+    return [f"SYN{i:04d}" for i in range(n_symbols)]
+
+
+def synthetic_universe(n_symbols: int, n_bars: int = 250, seed: int = 0) -> dict[str, pd.DataFrame]:
+    """Symbol-keyed frames shaped like get_history_batch output."""
+    return {
+        sym: synthetic_ohlcv(n_bars, seed=seed + i)
+        for i, sym in enumerate(synthetic_symbols(n_symbols))
+    }
+
+
+class SyntheticSource:
+    """Offline stand-in for the data hub: ``history`` / ``quotes`` served from
+    synthetic bars, with a call counter and optional latency."""
+
+    def __init__(self, n_bars: int = 260, latency: float = 0.0, end: str | None = None):
+        self.n_bars = n_bars
+        self.latency = latency
+        self.end = end or pd.Timestamp.now().normalize().strftime("%Y-%m-%d")
+        self.calls = {"history": 0, "quotes": 0}
+        self._frames: dict[str, pd.DataFrame] = {}
+
+    def _frame(self, symbol: str) -> pd.DataFrame:
+        if symbol not in self._frames:
+            self._frames[symbol] = synthetic_ohlcv(self.n_bars, seed=sum(map(ord, symbol)), end=self.end)
+        return self._frames[symbol]
+
+    def _wait(self) -> None:
+        if self.latency:
+            import time
+
+            time.sleep(self.latency)
+
+    def history(self, symbols: list[str], period: str = "6mo", interval: str = "1d") -> dict[str, pd.DataFrame]:
+        from core import slice_period
+
+        self.calls["history"] += 1
+        self._wait()
+        return {s.upper(): slice_period(self._frame(s.upper()), period) for s in symbols}
+
+    def quotes(self, symbols: list[str]) -> dict[str, float]:
+        self.calls["quotes"] += 1
+        self._wait()
+        return {s.upper(): float(self._frame(s.upper())["Close"].iloc[-1]) for s in symbols}
+
+
+@contextmanager
+def offline(n_bars: int = 260, end: str | None = None):
+    """Swap core's fetchers (get_history, get_history_batch, get_live_price,
+    get_live_prices) for a SyntheticSource until the block exits.
+
+    Hubs created inside the block (``data_access.DataAccess()``) pick the
+    stubs up; the yielded source counts the calls.
+    """
+    import core
+
+    src = SyntheticSource(n_bars, end=end)
+    stubs = {
+        "get_history_batch": lambda symbols, period="6mo", interval="1d": src.history(symbols, period, interval),
+        "get_history": lambda symbol, period="6mo", interval="1d": src.history([symbol], period, interval)[symbol.upper()],
+        "get_live_prices": src.quotes,
+        "get_live_price": lambda symbol: src.quotes([symbol])[symbol.upper()],
+    }
+    saved = {name: getattr(core, name) for name in stubs}
+    try:
+        for name, fn in stubs.items():
+            setattr(core, name, fn)
+        yield src
+    finally:
+        for name, fn in saved.items():
+            setattr(core, name, fn)
@@ -1,11 +1,28 @@
-import requests
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from instrument import count, timed
+from market import expires_at
+from resample import RESAMPLE_BASE, bucket_keys, resample_bars
+from upstream import CircuitBreaker, Quote, TokenBucket, backoff_delay
+
+# requests and yfinance are only imported on the first network call, so
+# offline users (benchmarks, the batch CLI on a warm cache) skip their
+# import cost
+if TYPE_CHECKING:
+    import requests
 
 # ------------------ CONFIG ------------------
 
-NSE_URL = "https://www.nseindia.com/api/quote-equity?symbol={symbol}"
+NSE_BASE_URL = "https://www.nseindia.com"
 HEADERS = {
     "User-Agent": "Mozilla/5.0",
     "Accept-Language": "en-US,en;q=0.9",
@@ -14,35 +31,429 @@ HEADERS = {
 DEFAULT_SYMBOL = "RELIANCE"
 DEFAULT_WATCHLIST = "RELIANCE, TCS, SBIN, INFY, HDFCBANK"
 
+# on-disk OHLCV cache, one parquet file per symbol + interval
+CACHE_DIR = os.environ.get(
+    "NSE_QUANT_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"),
+)
+# seconds a cached frame is served before topping it up while the market is
+# live; after the close it is good until the next session opens
+CACHE_TTL = 60
+BATCH_CHUNK = 50  # tickers per multi-ticker yfinance request
+
+QUOTE_TTL = 5  # seconds a live quote is reused
+QUOTE_WORKERS = 8  # concurrent quote requests per client
+NSE_RATE = 3  # quote requests per second, shared by all workers
+NSE_BURST = 5
+NSE_ATTEMPTS = 3  # tries per quote on 401/403/429/5xx/timeouts
+NSE_BREAKER_THRESHOLD = 5  # consecutive failures that open the circuit
+NSE_BREAKER_RESET = 30  # seconds the circuit stays open before a probe
+
+INDICATOR_CACHE_SIZE = 4096  # memoised indicator frames / snapshots kept in memory
+
+PERIOD_OFFSETS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
 # ------------------ DATA FETCH ------------------
 
 
-def get_live_price(symbol: str) -> float | None:
+class QuoteClient:
+    """Live NSE quotes over one pooled session, fetched concurrently.
+
+    The session is primed with the cookies NSE hands out on its home page,
+    and every quote is kept for ``ttl`` seconds so one rerun never asks for
+    the same symbol twice.
+
+    Requests share a token bucket (``rate`` per second) so a big watchlist
+    does not trip NSE's throttling, and 401/403/429/5xx answers are retried
+    with jittered backoff. After ``NSE_BREAKER_THRESHOLD`` failures in a row
+    the circuit opens: quotes fail fast and fall back to the last good
+    price, returned as a ``Quote`` with ``stale=True``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = NSE_BASE_URL,
+        ttl: float = QUOTE_TTL,
+        workers: int = QUOTE_WORKERS,
+        timeout: float = 8,
+        rate: float = NSE_RATE,
+        burst: float = NSE_BURST,
+        attempts: int = NSE_ATTEMPTS,
+        breaker: CircuitBreaker | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.ttl = ttl
+        self.workers = workers
+        self.timeout = timeout
+        self.attempts = attempts
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = breaker or CircuitBreaker(NSE_BREAKER_THRESHOLD, NSE_BREAKER_RESET)
+        self._session: "requests.Session | None" = None
+        self._lock = threading.Lock()
+        self._cache: dict[str, tuple[float, Quote | None]] = {}
+        self._last_good: dict[str, Quote] = {}
+
+    def _prime(self, session: "requests.Session") -> None:
+        try:
+            session.get(self.base_url, timeout=self.timeout)
+        except Exception:
+            pass
+
+    def _get_session(self) -> "requests.Session":
+        with self._lock:
+            if self._session is None:
+                import requests
+
+                session = requests.Session()
+                session.headers.update(HEADERS)
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.workers
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._prime(session)
+                self._session = session
+            return self._session
+
+    def _attempt(self, session: "requests.Session", url: str, symbol: str) -> tuple[str, object]:
+        """One request: ("ok", price), ("missing", None) or ("retry", delay)."""
+        try:
+            r = session.get(url, params={"symbol": symbol}, timeout=self.timeout)
+        except Exception:
+            return "retry", None
+        count("nse.bytes", len(r.content))
+        if r.status_code in (401, 403):
+            # cookies expired or we are being throttled, redo the handshake
+            self._prime(session)
+            return "retry", None
+        if r.status_code == 429 or r.status_code >= 500:
+            try:
+                return "retry", float(r.headers.get("Retry-After", ""))
+            except ValueError:
+                return "retry", None
+        if r.status_code != 200:
+            return "missing", None
+        try:
+            return "ok", float(r.json()["priceInfo"]["lastPrice"])
+        except Exception:
+            # the endpoint works, it just has no price for this symbol
+            return "missing", None
+
+    def _fetch(self, symbol: str) -> Quote | None:
+        session = self._get_session()
+        url = self.base_url + "/api/quote-equity"
+        with timed("nse.quote", symbol):
+            for attempt in range(self.attempts):
+                if not self.breaker.allow():
+                    count("nse.short_circuits")
+                    break
+                if attempt:
+                    count("nse.retries")
+                self.bucket.acquire()
+                count("nse.requests")
+                outcome, value = self._attempt(session, url, symbol)
+                if outcome == "ok":
+                    self.breaker.record_success()
+                    quote = self._last_good[symbol] = Quote(value, time.time())
+                    return quote
+                if outcome == "missing":
+                    self.breaker.record_success()
+                    return None
+                self.breaker.record_failure()
+                if attempt + 1 < self.attempts:
+                    # honour Retry-After, but never park a worker for long
+                    time.sleep(min(8.0, max(value or 0.0, backoff_delay(attempt))))
+
+            count("nse.failures")
+            last = self._last_good.get(symbol)
+            if last is None:
+                return None
+            count("nse.stale_served")
+            return Quote(last, last.as_of, stale=True)
+
+    def get_many(self, symbols: list[str]) -> dict[str, Quote | None]:
+        syms = list(dict.fromkeys(s.upper() for s in symbols if s))
+        now = time.time()
+        out: dict[str, Quote | None] = {}
+        missing = []
+        with self._lock:
+            for sym in syms:
+                hit = self._cache.get(sym)
+                if hit is not None and now - hit[0] < self.ttl:
+                    out[sym] = hit[1]
+                else:
+                    missing.append(sym)
+        count("quotes.cache_hits", len(syms) - len(missing))
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(missing))) as pool:
+                prices = list(pool.map(self._fetch, missing))
+            now = time.time()
+            with self._lock:
+                for sym, price in zip(missing, prices):
+                    self._cache[sym] = (now, price)
+                    out[sym] = price
+        return {sym: out[sym] for sym in syms}
+
+    def get(self, symbol: str) -> Quote | None:
+        return self.get_many([symbol]).get(symbol.upper())
+
+
+_quotes = QuoteClient()
+
+
+def get_live_price(symbol: str) -> Quote | None:
+    """Last traded price; a ``Quote`` whose ``stale`` flag marks a
+    last-known-good value served while NSE is failing."""
+    return _quotes.get(symbol)
+
+
+def get_live_prices(symbols: list[str]) -> dict[str, Quote | None]:
+    return _quotes.get_many(symbols)
+
+
+def _download(tickers, **kwargs) -> pd.DataFrame | None:
+    """Single choke point for yfinance, swapped out by offline tests."""
+    import yfinance as yf
+
+    return yf.download(tickers, progress=False, auto_adjust=False, **kwargs)
+
+
+def flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # newer yfinance returns (Price, Ticker) columns even for one ticker
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.copy()
+        df.columns = df.columns.get_level_values(0)
+    return df
+
+
+def _period_start(period: str, index: pd.Index) -> pd.Timestamp | None:
+    """First timestamp a period covers, None for "max"."""
+    now = pd.Timestamp.now(tz=getattr(index, "tz", None))
+    if period == "max":
+        return None
+    if period == "ytd":
+        return now.normalize().replace(month=1, day=1)
+    offset = PERIOD_OFFSETS.get(period)
+    if offset is None:
+        raise ValueError(f"Unsupported period: {period}")
+    return (now - offset).normalize()
+
+
+def _cache_path(symbol: str, interval: str) -> str:
+    return os.path.join(CACHE_DIR, f"{symbol.upper()}_{interval}.parquet")
+
+
+def _read_cache(symbol: str, interval: str) -> pd.DataFrame | None:
+    path = _cache_path(symbol, interval)
+    if not os.path.exists(path):
+        return None
     try:
-        r = requests.get(
-            NSE_URL.format(symbol=symbol.upper()),
-            headers=HEADERS,
-            timeout=8,
-        )
-        r.raise_for_status()
-        data = r.json()
-        return float(data["priceInfo"]["lastPrice"])
+        with timed("disk.read", symbol.upper()):
+            return pd.read_parquet(path)
     except Exception:
+        count("disk.read_failures")
         return None
 
 
-def get_history(symbol: str, period: str = "6mo", interval: str = "1d") -> pd.DataFrame | None:
+def _write_cache(symbol: str, interval: str, df: pd.DataFrame) -> None:
+    path = _cache_path(symbol, interval)
     try:
-        df = yf.download(
-            symbol.upper() + ".NS",
-            period=period,
-            interval=interval,
-            progress=False,
-            auto_adjust=False,
-        )
-        if df is None or df.empty:
-            return None
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp)
+        os.replace(tmp, path)
+    except Exception:
+        # cache is best effort (read-only disk, no pyarrow, ...)
+        pass
+
+
+def _is_covered(cached: pd.DataFrame, period: str) -> bool:
+    covered = cached.attrs.get("covered_from")
+    if covered == "max":
+        return True
+    if period == "max":
+        return False
+    start = _period_start(period, cached.index)
+    first = pd.Timestamp(covered) if covered else cached.index[0]
+    if first.tzinfo is None and start.tzinfo is not None:
+        first = first.tz_localize(start.tzinfo)
+    return first <= start
+
+
+def _merge_bars(cached: pd.DataFrame | None, fresh: pd.DataFrame | None) -> pd.DataFrame | None:
+    if fresh is None or fresh.empty:
+        return cached
+    fresh = flatten_columns(fresh)
+    if cached is None:
+        return fresh.sort_index()
+    merged = pd.concat([cached, fresh])
+    # the last cached bar may have been a partial one, keep the re-fetched copy
+    merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+    merged.attrs = dict(cached.attrs)
+    return merged
+
+
+def slice_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    start = _period_start(period, df.index)
+    if start is None:
         return df
+    return df[df.index >= start]
+
+
+def bars_key(df: pd.DataFrame | None) -> tuple | None:
+    """Cheap change key of a bar frame, None when it has no closes.
+
+    A new bar moves the ends of a rolling window even at equal length, and
+    a revised last bar changes its close or its volume.
+    """
+    if df is None or df.empty or "Close" not in df:
+        return None
+    close = df["Close"].to_numpy()
+    last_vol = float(df["Volume"].to_numpy()[-1]) if "Volume" in df else np.nan
+    # NaN != NaN, keep missing values comparable
+    return tuple(None if np.isnan(x) else float(x) for x in (len(close), close[0], close[-1], last_vol))
+
+
+def _split_tickers(raw: pd.DataFrame | None, symbols: list[str]) -> dict[str, pd.DataFrame]:
+    """Break a group_by="ticker" download into one frame per symbol."""
+    out = {}
+    if raw is None or raw.empty:
+        return out
+    if not isinstance(raw.columns, pd.MultiIndex):
+        if len(symbols) == 1:
+            out[symbols[0]] = raw
+        return out
+    tickers = set(raw.columns.get_level_values(0))
+    for sym in symbols:
+        if sym + ".NS" not in tickers:
+            continue
+        df = raw[sym + ".NS"].dropna(how="all")
+        if not df.empty:
+            out[sym] = df
+    return out
+
+
+def _chunks(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _download_many(symbols: list[str], **kwargs) -> dict[str, pd.DataFrame]:
+    out = {}
+    for chunk in _chunks(symbols, BATCH_CHUNK):
+        count("yf.requests")
+        count("yf.symbols", len(chunk))
+        try:
+            with timed("yf.download"):
+                raw = _download(
+                    [s + ".NS" for s in chunk],
+                    group_by="ticker",
+                    threads=True,
+                    **kwargs,
+                )
+        except Exception:
+            # a failed chunk only costs its own symbols
+            count("yf.failures")
+            continue
+        if raw is not None:
+            count("yf.frame_bytes", int(raw.memory_usage(deep=False).sum()))
+        out.update(_split_tickers(raw, chunk))
+    return out
+
+
+def get_history_batch(
+    symbols: list[str], period: str = "6mo", interval: str = "1d"
+) -> dict[str, pd.DataFrame | None]:
+    """History for a whole watchlist, fetched in chunked multi-ticker requests.
+
+    Weekly / monthly and 2m-90m bars are resampled from cached daily / 1m
+    bars when those cover ``period``; only the other symbols are asked for
+    ``interval`` upstream. Returns a symbol-keyed dict; symbols with no
+    data map to None.
+    """
+    syms = list(dict.fromkeys(s.upper() for s in symbols if s))
+    base = RESAMPLE_BASE.get(interval)
+    if base is None:
+        return _load_batch(syms, period, interval)
+
+    cached = {sym: _read_cache(sym, base) for sym in syms}
+    covered = {sym: df for sym, df in cached.items() if df is not None and _is_covered(df, period)}
+    count("resample.local", len(covered))
+    out = {}
+    # top the base bars up as usual, resample them whole so the first bar
+    # is a full week / bucket, then cut to the period
+    for sym, df in _load_batch(list(covered), period, base, covered, sliced=False).items():
+        df = None if df is None else slice_period(resample_bars(df, interval), period)
+        out[sym] = None if df is None or df.empty else df
+    out.update(_load_batch([s for s in syms if s not in covered], period, interval))
+    return {sym: out[sym] for sym in syms}
+
+
+def _load_batch(
+    syms: list[str],
+    period: str,
+    interval: str,
+    preread: dict[str, pd.DataFrame] | None = None,
+    sliced: bool = True,
+) -> dict[str, pd.DataFrame | None]:
+    """Disk cache first, then one download for the cold symbols and one per
+    last-cached-bar group for the stale ones. ``preread`` holds frames the
+    caller already read from disk; ``sliced=False`` returns whole frames."""
+    frames: dict[str, pd.DataFrame | None] = {}
+    cold: list[str] = []
+    stale: dict[pd.Timestamp, list[str]] = {}
+
+    for sym in syms:
+        cached = preread.get(sym) if preread else None
+        if cached is None:
+            cached = _read_cache(sym, interval)
+        frames[sym] = cached
+        if cached is None or not _is_covered(cached, period):
+            cold.append(sym)
+        elif time.time() >= expires_at(os.path.getmtime(_cache_path(sym, interval)), CACHE_TTL):
+            # only ask for bars from the last cached one onwards
+            stale.setdefault(cached.index[-1], []).append(sym)
+    count("disk.cold", len(cold))
+    count("disk.stale", sum(len(g) for g in stale.values()))
+    count("disk.hits", len(syms) - len(cold) - sum(len(g) for g in stale.values()))
+
+    for sym, fresh in _download_many(cold, period=period, interval=interval).items():
+        df = _merge_bars(frames[sym], fresh)
+        start = _period_start(period, df.index)
+        df.attrs["covered_from"] = "max" if start is None else start.isoformat()
+        _write_cache(sym, interval, df)
+        frames[sym] = df
+
+    for since, group in stale.items():
+        for sym, fresh in _download_many(group, start=since, interval=interval).items():
+            frames[sym] = _merge_bars(frames[sym], fresh)
+            _write_cache(sym, interval, frames[sym])
+
+    out: dict[str, pd.DataFrame | None] = {}
+    for sym in syms:
+        # a failed download falls back to whatever the cache already holds
+        df = frames[sym]
+        if df is not None and sliced:
+            df = slice_period(df, period)
+        out[sym] = None if df is None or df.empty else df
+    return out
+
+
+def get_history(symbol: str, period: str = "6mo", interval: str = "1d") -> pd.DataFrame | None:
+    """OHLCV history served from the local cache, topped up with new bars only."""
+    try:
+        return get_history_batch([symbol], period, interval).get(symbol.upper())
     except Exception:
         return None
 
@@ -50,57 +461,158 @@ def get_history(symbol: str, period: str = "6mo", interval: str = "1d") -> pd.Da
 # ------------------ INDICATORS ------------------
 
 
-def calc_sma(series: pd.Series, window: int) -> float | None:
-    if series is None or len(series) < window:
-        return None
-    return float(series.tail(window).mean())
+def _as_series(series) -> pd.Series:
+    if isinstance(series, pd.Series):
+        return series.astype("float64")
+    return pd.Series(np.asarray(series, dtype="float64"))
 
 
-def calc_ema(series: pd.Series, window: int) -> float | None:
-    if series is None or len(series) < window:
+def _last(series: pd.Series | None) -> float | None:
+    if series is None or len(series) == 0:
         return None
-    ema = series.ewm(span=window, adjust=False).mean()
-    return float(ema.iloc[-1])
+    value = series.iloc[-1]
+    return None if pd.isna(value) else float(value)
 
 
-def calc_rsi(series: pd.Series, period: int = 14) -> float | None:
-    if series is None:
-        return None
-    values = np.asarray(series, dtype="float64")
-    if values.size < period + 1:
-        return None
+def _scalar(value) -> float | None:
+    return None if np.isnan(value) else float(value)
+
 
+def _wilder_rsi(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI of one close array, the single-column ``_wilder_rsi_2d``:
+    seeded with the mean of the first ``period`` moves, missing moves skipped."""
     deltas = np.diff(values)
     gains = np.where(deltas > 0, deltas, 0.0)
     losses = np.where(deltas < 0, -deltas, 0.0)
+    missing = np.isnan(deltas)
+
+    out = np.full(len(values), np.nan)
+    seen = np.flatnonzero(~missing)
+    if len(seen) < period:
+        return out
+    start = seen[period - 1] + 1  # first move after the seed
+    avg_gain = float(gains[seen[:period]].sum()) / period
+    avg_loss = float(losses[seen[:period]].sum()) / period
+    avg_gains, avg_losses = [avg_gain], [avg_loss]
+    # a plain float loop: per-element numpy calls cost more than the math
+    for gain, loss, skip in zip(gains[start:].tolist(), losses[start:].tolist(), missing[start:].tolist()):
+        if not skip:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        avg_gains.append(avg_gain)
+        avg_losses.append(avg_loss)
+
+    avg_gain, avg_loss = np.array(avg_gains), np.array(avg_losses)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[start:] = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+def _ewm(close: pd.Series, span: int) -> pd.Series:
+    return close.ewm(span=span, adjust=False).mean()
+
+
+def _ewm_values(values: np.ndarray, span: int) -> np.ndarray:
+    """``_ewm`` of one array."""
+    if np.isnan(values).any():
+        # pandas decays the weights across gaps, leave those to it
+        return _ewm(pd.Series(values, copy=False), span).to_numpy(copy=True)
+    alpha = 2.0 / (span + 1)
+    out = values.tolist()
+    for t in range(1, len(out)):
+        out[t] = alpha * out[t] + (1 - alpha) * out[t - 1]
+    return np.array(out, dtype="float64")
+
+
+def _values(series) -> np.ndarray:
+    if isinstance(series, pd.Series):
+        return series.to_numpy(dtype="float64")
+    return np.asarray(series, dtype="float64")
+
+
+def _macd_values(ewm12: np.ndarray, ewm26: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Unmasked MACD line and signal from the 12/26 ewm values."""
+    macd_line = ewm12 - ewm26
+    return macd_line, _ewm_values(macd_line, 9)
+
+
+def sma_series(series: pd.Series, window: int) -> pd.Series:
+    return _as_series(series).rolling(window, min_periods=window).mean()
+
+
+def ema_series(series: pd.Series, window: int) -> pd.Series:
+    """ewm(span=window, adjust=False), NaN until ``window`` bars exist."""
+    ema = _ewm(_as_series(series), window)
+    ema.iloc[: window - 1] = np.nan
+    return ema
+
+
+def rsi_series(series: pd.Series, period: int = 14) -> pd.Series:
+    """Wilder RSI, NaN for the first ``period`` bars."""
+    close = _as_series(series)
+    return pd.Series(_wilder_rsi(close.to_numpy(), period), index=close.index)
+
+
+def macd_series(
+    series: pd.Series, ewm12: pd.Series | None = None, ewm26: pd.Series | None = None
+) -> pd.DataFrame:
+    """MACD line, signal and histogram; NaN until 35 bars exist.
+
+    Unmasked 12/26 ewm series that were already computed can be passed in.
+    """
+    close = _as_series(series)
+    values = close.to_numpy()
+    e12 = _ewm_values(values, 12) if ewm12 is None else ewm12.to_numpy()
+    e26 = _ewm_values(values, 26) if ewm26 is None else ewm26.to_numpy()
+    macd_line, signal_line = _macd_values(e12, e26)
+    hist = macd_line - signal_line
+    for arr in (macd_line, signal_line, hist):
+        arr[:34] = np.nan
+    return pd.DataFrame({"macd": macd_line, "signal": signal_line, "hist": hist}, index=close.index)
+
+
+def sr_series(series: pd.Series, window: int = 30) -> pd.DataFrame:
+    """Rolling support (min) and resistance (max) of the last ``window`` bars."""
+    close = _as_series(series)
+    rolling = close.rolling(window, min_periods=window)
+    return pd.DataFrame({"support": rolling.min(), "resistance": rolling.max()})
+
+
+# the scalar helpers return the last value of the matching *_series, read
+# off the tail of the array instead of building the whole series
+
 
-    avg_gain = gains[-period:].mean()
-    avg_loss = losses[-period:].mean()
-    if np.isnan(avg_gain) or np.isnan(avg_loss):
+def calc_sma(series: pd.Series, window: int) -> float | None:
+    if series is None or len(series) < window:
         return None
-    if avg_loss == 0:
-        return 100.0
+    return _scalar(_values(series)[-window:].mean())
 
-    rs = avg_gain / avg_loss
-    rsi_val = 100 - (100 / (1 + rs))
-    return float(rsi_val)
+
+def calc_ema(series: pd.Series, window: int) -> float | None:
+    if series is None or len(series) < window:
+        return None
+    return _scalar(_ewm_values(_values(series), window)[-1])
+
+
+def calc_rsi(series: pd.Series, period: int = 14) -> float | None:
+    if series is None or len(series) < period + 1:
+        return None
+    return _scalar(_wilder_rsi(_values(series), period)[-1])
 
 
 def calc_macd(series: pd.Series) -> tuple[float | None, float | None]:
     if series is None or len(series) < 35:
         return None, None
-    ema12 = series.ewm(span=12, adjust=False).mean()
-    ema26 = series.ewm(span=26, adjust=False).mean()
-    macd_line = ema12 - ema26
-    signal_line = macd_line.ewm(span=9, adjust=False).mean()
-    return float(macd_line.iloc[-1]), float(signal_line.iloc[-1])
+    values = _values(series)
+    macd_line, signal_line = _macd_values(_ewm_values(values, 12), _ewm_values(values, 26))
+    return _scalar(macd_line[-1]), _scalar(signal_line[-1])
 
 
 def calc_sr(series: pd.Series, window: int = 30) -> tuple[float | None, float | None]:
     if series is None or len(series) < window:
         return None, None
-    recent = series.tail(window)
-    return float(recent.min()), float(recent.max())
+    tail = _values(series)[-window:]
+    return _scalar(tail.min()), _scalar(tail.max())
 
 
 def volume_check(series: pd.Series, window: int = 20) -> tuple[float | None, float | None, float | None]:
@@ -112,6 +624,298 @@ def volume_check(series: pd.Series, window: int = 20) -> tuple[float | None, flo
     return last, avg, ratio
 
 
+# ------------------ INDICATOR FRAME / SNAPSHOT ------------------
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """Which indicators to compute (hashable, used as memo key)."""
+
+    sma: tuple[int, ...] = (5, 20)
+    ema: tuple[int, ...] = (12, 26)
+    rsi: int | None = 14
+    macd: bool = True
+    sr: int | None = 30
+    volume: int | None = 20
+    weekly_sma: int | None = 10  # weeks; indicator_panel only, from the daily bars
+
+
+DEFAULT_SPEC = IndicatorSpec()
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    """Latest value of every indicator in a spec; None when data is too short."""
+
+    sma: dict[int, float | None] = field(default_factory=dict)
+    ema: dict[int, float | None] = field(default_factory=dict)
+    rsi: float | None = None
+    macd: float | None = None
+    signal: float | None = None
+    support: float | None = None
+    resistance: float | None = None
+    last_vol: float | None = None
+    avg_vol: float | None = None
+    rel_vol: float | None = None
+
+
+_indicator_cache: OrderedDict = OrderedDict()
+_indicator_cache_lock = threading.Lock()
+
+
+def _memoised(kind: str, df: pd.DataFrame, spec: IndicatorSpec, symbol: str | None, build):
+    """LRU memo keyed on the last bar (timestamp plus ``bars_key``, so a
+    re-fetched partial bar, a revised volume or another period is not
+    mistaken for a hit)."""
+    if symbol is None:
+        return build()
+
+    key = (kind, symbol.upper(), df.index[-1], bars_key(df), spec)
+    with _indicator_cache_lock:
+        hit = _indicator_cache.get(key)
+        if hit is not None:
+            _indicator_cache.move_to_end(key)
+            count("indicators.memo_hits")
+            return hit
+
+    count("indicators.memo_misses")
+    with timed("indicators", symbol.upper()):
+        value = build()
+    with _indicator_cache_lock:
+        _indicator_cache[key] = value
+        while len(_indicator_cache) > INDICATOR_CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
+    return value
+
+
+def _build_frame(df: pd.DataFrame, spec: IndicatorSpec) -> pd.DataFrame:
+    close = _as_series(df["Close"])
+    values = close.to_numpy()
+    cols = {"close": values}
+
+    for w in spec.sma:
+        cols[f"sma{w}"] = sma_series(close, w).to_numpy()
+
+    # one ewm pass per span, shared by the EMA columns and MACD
+    spans = set(spec.ema) | ({12, 26} if spec.macd else set())
+    ewm = {w: _ewm_values(values, w) for w in spans}
+    for w in spec.ema:
+        ema = ewm[w].copy()
+        ema[: w - 1] = np.nan
+        cols[f"ema{w}"] = ema
+
+    if spec.rsi is not None:
+        cols[f"rsi{spec.rsi}"] = rsi_series(close, spec.rsi).to_numpy()
+
+    if spec.macd:
+        macd_line, signal_line = _macd_values(ewm[12], ewm[26])
+        hist = macd_line - signal_line
+        for arr in (macd_line, signal_line, hist):
+            arr[:34] = np.nan
+        cols.update(macd=macd_line, signal=signal_line, hist=hist)
+    if spec.sr is not None:
+        rolling = close.rolling(spec.sr, min_periods=spec.sr)
+        cols.update(support=rolling.min().to_numpy(), resistance=rolling.max().to_numpy())
+
+    if spec.volume is not None and "Volume" in df:
+        vol = _as_series(df["Volume"])
+        avg = vol.rolling(spec.volume, min_periods=spec.volume).mean().to_numpy(copy=True)
+        avg[: spec.volume] = np.nan  # volume_check wants window + 1 bars
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rel = np.where(avg != 0, vol.to_numpy() / avg, np.nan)
+        cols.update(volume=vol.to_numpy(), avg_vol=avg, rel_vol=rel)
+    return pd.DataFrame(cols, index=close.index)
+
+
+def indicator_frame(
+    df: pd.DataFrame, spec: IndicatorSpec = DEFAULT_SPEC, symbol: str | None = None
+) -> pd.DataFrame:
+    """Full indicator history for one frame, one column per indicator.
+
+    Charting and backtests read from this; with a symbol the result is
+    memoised so they share one computation.
+    """
+    return _memoised("frame", df, spec, symbol, lambda: _build_frame(df, spec))
+
+
+def _build_snapshot(df: pd.DataFrame, spec: IndicatorSpec) -> IndicatorSnapshot:
+    """The last row of ``_build_frame``, from the tail of the arrays."""
+    close = df["Close"].to_numpy(dtype="float64")
+    n = len(close)
+
+    spans = set(spec.ema) | ({12, 26} if spec.macd else set())
+    ewm = {w: _ewm_values(close, w) for w in spans}
+    out = {
+        "sma": {w: _scalar(close[-w:].mean()) if n >= w else None for w in spec.sma},
+        "ema": {w: _scalar(ewm[w][-1]) if n >= w else None for w in spec.ema},
+    }
+    if spec.rsi is not None:
+        out["rsi"] = calc_rsi(close, spec.rsi)
+    if spec.macd and n >= 35:
+        macd_line, signal_line = _macd_values(ewm[12], ewm[26])
+        out.update(macd=_scalar(macd_line[-1]), signal=_scalar(signal_line[-1]))
+    if spec.sr is not None and n >= spec.sr:
+        tail = close[-spec.sr :]
+        out.update(support=_scalar(tail.min()), resistance=_scalar(tail.max()))
+
+    w = spec.volume
+    if w is not None and "Volume" in df and n >= w + 1:
+        vol = df["Volume"].to_numpy(dtype="float64")
+        avg = _scalar(vol[-w:].mean())
+        if avg is not None:
+            rel = _scalar(vol[-1] / avg) if avg != 0 else None
+            out.update(last_vol=_scalar(vol[-1]), avg_vol=avg, rel_vol=rel)
+    return IndicatorSnapshot(**out)
+
+
+def compute_snapshot(
+    df: pd.DataFrame, spec: IndicatorSpec = DEFAULT_SPEC, symbol: str | None = None
+) -> IndicatorSnapshot:
+    """Latest value of every indicator in ``spec``; matches the last row of
+    indicator_frame without building it."""
+    return _memoised("snapshot", df, spec, symbol, lambda: _build_snapshot(df, spec))
+
+
+# ------------------ INDICATOR PANEL (WHOLE WATCHLIST) ------------------
+
+
+def build_panel(frames: dict[str, pd.DataFrame | None], column: str = "Close") -> pd.DataFrame:
+    """Align one OHLCV column of many symbols into a dates x symbols frame."""
+    cols = {sym: df[column] for sym, df in frames.items() if df is not None and column in df}
+    if not cols:
+        return pd.DataFrame()
+    index = next(iter(cols.values())).index
+    if all(c.index.equals(index) for c in cols.values()):
+        # common case: one exchange calendar, stack the arrays directly
+        data = np.column_stack([c.to_numpy(dtype="float64") for c in cols.values()])
+        return pd.DataFrame(data, index=index, columns=list(cols)).sort_index()
+    return pd.DataFrame(cols).sort_index()
+
+
+def ema_2d(arr: np.ndarray, span: int) -> np.ndarray:
+    """ewm(span, adjust=False) down every column; leading NaNs are skipped."""
+    alpha = 2.0 / (span + 1)
+    out = np.empty_like(arr)
+    prev = np.full(arr.shape[1], np.nan)
+    for t in range(arr.shape[0]):
+        x = arr[t]
+        step = alpha * x + (1 - alpha) * prev
+        prev = np.where(np.isnan(prev), x, np.where(np.isnan(x), prev, step))
+        out[t] = prev
+    return out
+
+
+def _wilder_rsi_2d(arr: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI down every column, seeded with the mean of the first ``period`` moves."""
+    deltas = np.diff(arr, axis=0)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    missing = np.isnan(deltas)
+
+    n_sym = arr.shape[1]
+    n_seen = np.zeros(n_sym)
+    avg_gain = np.zeros(n_sym)
+    avg_loss = np.zeros(n_sym)
+    out = np.full(arr.shape, np.nan)
+    for t in range(deltas.shape[0]):
+        ok = ~missing[t]
+        n_seen += ok
+        seeding = ok & (n_seen <= period)
+        smoothing = ok & (n_seen > period)
+        avg_gain = np.where(seeding, avg_gain + gains[t] / period, avg_gain)
+        avg_loss = np.where(seeding, avg_loss + losses[t] / period, avg_loss)
+        avg_gain = np.where(smoothing, (avg_gain * (period - 1) + gains[t]) / period, avg_gain)
+        avg_loss = np.where(smoothing, (avg_loss * (period - 1) + losses[t]) / period, avg_loss)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        out[t + 1] = np.where(n_seen >= period, rsi, np.nan)
+    return out
+
+
+def _right_align(arr: np.ndarray, *others: np.ndarray) -> list[np.ndarray]:
+    """``arr`` and ``others`` with every column's valid rows (non-NaN in
+    ``arr``) moved, in order, to the bottom: the last row is each symbol's
+    own latest bar whatever its calendar, the NaN padding ends up on top."""
+    valid = ~np.isnan(arr)
+    if (valid[1:] >= valid[:-1]).all():
+        # only leading NaNs (short histories), already aligned
+        return [arr, *others]
+    order = np.argsort(valid, axis=0, kind="stable")
+    return [np.take_along_axis(a, order, axis=0) for a in (arr, *others)]
+
+
+def indicator_panel(
+    close: pd.DataFrame, volume: pd.DataFrame | None = None, spec: IndicatorSpec = DEFAULT_SPEC
+) -> pd.DataFrame:
+    """Latest indicators for every column of a dates x symbols panel at once.
+
+    Returns one row per symbol with sma<w>, ema<w>, rsi<p>, macd, signal,
+    support, resistance, last_vol, avg_vol and rel_vol columns. Values are NaN
+    where a symbol has too few bars, mirroring the None of the scalar helpers.
+    """
+    raw = close.to_numpy(dtype="float64")
+    vol = None
+    if spec.volume is not None and volume is not None:
+        vol = volume.reindex(index=close.index, columns=close.columns).to_numpy(dtype="float64")
+    # symbols on different calendars leave NaN rows in each other's columns;
+    # windows are taken over each symbol's own bars, as the scalar helpers do
+    arr, *rest = _right_align(raw, *([] if vol is None else [vol]))
+    n_valid = np.sum(~np.isnan(arr), axis=0)
+    out = {}
+
+    for w in spec.sma:
+        out[f"sma{w}"] = arr[-w:].mean(axis=0) if len(arr) >= w else np.full(arr.shape[1], np.nan)
+
+    spans = set(spec.ema) | ({12, 26} if spec.macd else set())
+    ema = {w: ema_2d(arr, w) for w in spans}
+    for w in spec.ema:
+        out[f"ema{w}"] = np.where(n_valid >= w, ema[w][-1], np.nan)
+
+    if spec.macd:
+        macd_line = ema[12] - ema[26]
+        signal_line = ema_2d(macd_line, 9)
+        enough = n_valid >= 35
+        out["macd"] = np.where(enough, macd_line[-1], np.nan)
+        out["signal"] = np.where(enough, signal_line[-1], np.nan)
+
+    if spec.rsi is not None:
+        out[f"rsi{spec.rsi}"] = _wilder_rsi_2d(arr, spec.rsi)[-1]
+
+    if spec.sr is not None:
+        recent = arr[-spec.sr :]
+        enough = len(arr) >= spec.sr
+        out["support"] = recent.min(axis=0) if enough else np.full(arr.shape[1], np.nan)
+        out["resistance"] = recent.max(axis=0) if enough else np.full(arr.shape[1], np.nan)
+
+    if vol is not None:
+        vol = rest[0]
+        w = spec.volume
+        enough = np.sum(~np.isnan(vol), axis=0) >= w + 1
+        avg = vol[-w:].mean(axis=0)
+        last = vol[-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(avg == 0, np.nan, last / avg)
+        out["last_vol"] = np.where(enough, last, np.nan)
+        out["avg_vol"] = np.where(enough, avg, np.nan)
+        out["rel_vol"] = np.where(enough, ratio, np.nan)
+
+    if spec.weekly_sma is not None:
+        # weekly closes resampled from the same daily panel, no extra fetch
+        keys = bucket_keys(close.index, "1wk")
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], dtype=int)
+        week_ends = np.r_[starts[1:], len(keys)] - 1
+        weekly = close.ffill().to_numpy(dtype="float64")[week_ends]
+        if len(starts):
+            # a week a symbol has no bar in is not one of its weekly bars
+            traded = np.logical_or.reduceat(~np.isnan(raw), starts, axis=0)
+            (weekly,) = _right_align(np.where(traded, weekly, np.nan))
+        w = spec.weekly_sma
+        out["wk_close"] = weekly[-1] if len(weekly) else np.full(arr.shape[1], np.nan)
+        out[f"wk_sma{w}"] = weekly[-w:].mean(axis=0) if len(weekly) >= w else np.full(arr.shape[1], np.nan)
+
+    return pd.DataFrame(out, index=pd.Index(close.columns, name="Symbol"))
+
+
 # ------------------ BACKTEST (SMA CROSSOVER) ------------------
 
 
@@ -126,8 +930,8 @@ def sma_crossover_backtest(df: pd.DataFrame, fast: int = 20, slow: int = 50) ->
     if len(close) < min_req:
         return None
 
-    fast_sma = close.rolling(fast, min_periods=fast).mean()
-    slow_sma = close.rolling(slow, min_periods=slow).mean()
+    fast_sma = sma_series(close, fast)
+    slow_sma = sma_series(close, slow)
 
     if not isinstance(fast_sma, pd.Series) or not isinstance(slow_sma, pd.Series):
         return None
@@ -164,41 +968,163 @@ def sma_crossover_backtest(df: pd.DataFrame, fast: int = 20, slow: int = 50) ->
     }
 
 
+def _rolling_means(close: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """SMA of every window from one cumulative sum, NaN during warm-up."""
+    n = close.size
+    csum = np.concatenate([[0.0], np.cumsum(close)])
+    out = np.full((windows.size, n), np.nan)
+    for i, w in enumerate(windows):
+        out[i, w - 1 :] = (csum[w:] - csum[:-w]) / w
+    return out
+
+
+def sma_crossover_sweep(
+    df: pd.DataFrame,
+    fast_windows=range(5, 51),
+    slow_windows=range(20, 201),
+    chunk_cells: int = 4_000_000,
+) -> pd.DataFrame | None:
+    """sma_crossover_backtest for every (fast, slow) pair at once.
+
+    Returns one row per pair with strategy / buy & hold return, max drawdown,
+    number of entries and exposure (% of bars in the market), ready for
+    ``pivot(index="fast", columns="slow")``. Pairs without enough candles get
+    NaN, like the None of the single backtest.
+    """
+    if not isinstance(df, pd.DataFrame) or df.empty or "Close" not in df.columns:
+        return None
+    close = _as_series(df["Close"]).dropna().to_numpy()
+    n = close.size
+    fast = np.asarray(sorted(set(fast_windows)), dtype=int)
+    slow = np.asarray(sorted(set(slow_windows)), dtype=int)
+    if n < 2 or fast.size == 0 or slow.size == 0:
+        return None
+
+    windows = np.union1d(fast, slow)
+    windows = windows[windows <= n]
+    sma = _rolling_means(close, windows)
+    row = {w: i for i, w in enumerate(windows)}
+    nan_row = np.full(n, np.nan)
+    fast_sma = np.stack([sma[row[w]] if w in row else nan_row for w in fast])
+    slow_sma = np.stack([sma[row[w]] if w in row else nan_row for w in slow])
+
+    log_ret = np.log(close[1:] / close[:-1])
+    # first bar where both averages exist, per pair
+    start = np.maximum(fast[:, None], slow[None, :]) - 1
+    valid = n >= start + 11
+
+    shape = (fast.size, slow.size)
+    strat = np.full(shape, np.nan)
+    max_dd = np.full(shape, np.nan)
+    trades = np.zeros(shape, dtype=int)
+    in_market = np.zeros(shape)
+
+    # the fast x slow x bars cube is built a few fast rows at a time
+    rows_per_chunk = max(1, chunk_cells // (slow.size * n))
+    for lo in range(0, fast.size, rows_per_chunk):
+        hi = min(lo + rows_per_chunk, fast.size)
+        # NaN comparisons are False, so warm-up bars are flat automatically
+        signal = fast_sma[lo:hi, None, :] > slow_sma[None, :, :]
+        position = signal[..., :-1]  # yesterday's signal earns today's return
+
+        total = position @ log_ret
+        curve = np.cumsum(np.where(position, log_ret, 0.0), axis=-1)
+        peak = np.maximum(np.maximum.accumulate(curve, axis=-1), 0.0)
+        strat[lo:hi] = np.expm1(total) * 100
+        max_dd[lo:hi] = -np.expm1(-(peak - curve).max(axis=-1)) * 100
+        trades[lo:hi] = (position[..., 1:] & ~position[..., :-1]).sum(axis=-1) + position[..., 0]
+        in_market[lo:hi] = position.sum(axis=-1)
+
+    bars = np.maximum(n - 1 - start, 1)
+    buy_hold = (close[-1] / close[np.minimum(start, n - 1)] - 1) * 100
+
+    out = pd.DataFrame(
+        {
+            "fast": np.repeat(fast, slow.size),
+            "slow": np.tile(slow, fast.size),
+            "strategy_return_pct": np.where(valid, strat, np.nan).ravel(),
+            "buy_hold_return_pct": np.where(valid, buy_hold, np.nan).ravel(),
+            "max_drawdown_pct": np.where(valid, max_dd, np.nan).ravel(),
+            "trades": np.where(valid, trades, 0).ravel(),
+            "exposure_pct": np.where(valid, in_market / bars * 100, np.nan).ravel(),
+        }
+    )
+    return out
+
+
 # ------------------ RANKING ENGINE SCORE ------------------
 
 
-def rank_score(symbol: str, df: pd.DataFrame, live: float) -> dict:
+@dataclass(frozen=True)
+class RankWeights:
+    """Points each ranking condition adds; the defaults make a score out of 100."""
+
+    sma_trend: int = 20  # SMA5 > SMA20
+    ema_trend: int = 20  # EMA12 > EMA26
+    macd: int = 15  # MACD above signal
+    rsi_sweet: int = 15  # RSI 45-60
+    rsi_strong: int = 10  # RSI 60-70
+    near_support: int = 15  # LTP in the lower quarter of the support/resistance range
+    volume: int = 15  # relative volume >= 1.2
+    weekly_trend: int = 0  # weekly close above its 10-week SMA (off by default)
+
+    def vector(self) -> np.ndarray:
+        return np.array([getattr(self, name) for name in RANK_COMPONENTS])
+
+    @property
+    def max_points(self) -> int:
+        # the two RSI bands never both hold
+        return sum(self.vector()) - min(self.rsi_sweet, self.rsi_strong)
+
+
+RANK_COMPONENTS = tuple(RankWeights.__dataclass_fields__)
+DEFAULT_WEIGHTS = RankWeights()
+
+
+def rank_grade(score: float, weights: RankWeights = DEFAULT_WEIGHTS) -> str:
+    """Grade band of a score, scaled to 100 whatever the weights add up to."""
+    if weights.max_points > 0:
+        score = score * 100 / weights.max_points
+    if score >= 75:
+        return "🔥 STRONG BUY"
+    if score >= 60:
+        return "BUY"
+    if score >= 40:
+        return "HOLD"
+    if score >= 20:
+        return "WEAK"
+    return "BEARISH"
+
+
+def rank_score(symbol: str, df: pd.DataFrame, live: float, weights: RankWeights = DEFAULT_WEIGHTS) -> dict:
     """Return dict with score + components for ranking engine."""
-    close = df["Close"]
-    vol = df["Volume"]
+    snap = compute_snapshot(df, DEFAULT_SPEC, symbol)
 
-    sma5 = calc_sma(close, 5)
-    sma20 = calc_sma(close, 20)
-    ema12 = calc_ema(close, 12)
-    ema26 = calc_ema(close, 26)
-    rsi = calc_rsi(close, 14)
-    mac, sig = calc_macd(close)
-    sup, res = calc_sr(close, 30)
-    lastv, avgv, relv = volume_check(vol, 20)
+    sma5, sma20 = snap.sma[5], snap.sma[20]
+    ema12, ema26 = snap.ema[12], snap.ema[26]
+    rsi = snap.rsi
+    mac, sig = snap.macd, snap.signal
+    sup, res = snap.support, snap.resistance
+    relv = snap.rel_vol
 
     score = 0
 
     # Trend
     if sma5 and sma20 and sma5 > sma20:
-        score += 20
+        score += weights.sma_trend
     if ema12 and ema26 and ema12 > ema26:
-        score += 20
+        score += weights.ema_trend
 
     # MACD
     if mac and sig and mac > sig:
-        score += 15
+        score += weights.macd
 
     # RSI
     if rsi:
         if 45 <= rsi <= 60:
-            score += 15
+            score += weights.rsi_sweet
         if 60 < rsi <= 70:
-            score += 10
+            score += weights.rsi_strong
 
     # Near support
     if sup and res and live:
@@ -208,33 +1134,67 @@ def rank_score(symbol: str, df: pd.DataFrame, live: float) -> dict:
             if dist >= 0:
                 pct = dist / gap * 100
                 if pct <= 25:
-                    score += 15
+                    score += weights.near_support
 
     # Volume
     if relv and relv >= 1.2:
-        score += 15
+        score += weights.volume
 
-    if score >= 75:
-        grade = "🔥 STRONG BUY"
-    elif score >= 60:
-        grade = "BUY"
-    elif score >= 40:
-        grade = "HOLD"
-    elif score >= 20:
-        grade = "WEAK"
-    else:
-        grade = "BEARISH"
+    # Weekly confirmation, from weekly bars resampled out of the daily ones
+    if weights.weekly_trend:
+        weekly = resample_bars(df, "1wk")["Close"]
+        if len(weekly) >= 10 and weekly.iloc[-1] > weekly.iloc[-10:].mean():
+            score += weights.weekly_trend
 
     return {
         "Symbol": symbol,
         "LTP": round(live, 2) if live else None,
         "Score": score,
-        "Grade": grade,
+        "Grade": rank_grade(score, weights),
         "RSI": round(rsi, 2) if rsi else None,
         "RelVol": round(relv, 2) if relv else None,
     }
 
 
+def rank_components(ind: pd.DataFrame, ltp: pd.Series) -> pd.DataFrame:
+    """One bool column per RANK_COMPONENTS condition for indicator_panel rows."""
+    gap = ind["resistance"] - ind["support"]
+    pct = (ltp - ind["support"]) / gap * 100
+    return pd.DataFrame(
+        {
+            "sma_trend": ind["sma5"] > ind["sma20"],
+            "ema_trend": ind["ema12"] > ind["ema26"],
+            "macd": ind["macd"] > ind["signal"],
+            "rsi_sweet": ind["rsi14"].between(45, 60),
+            "rsi_strong": (ind["rsi14"] > 60) & (ind["rsi14"] <= 70),
+            "near_support": (gap > 0) & (pct >= 0) & (pct <= 25),
+            "volume": ind["rel_vol"] >= 1.2,
+            "weekly_trend": ind["wk_close"] > ind["wk_sma10"]
+            if "wk_sma10" in ind
+            else pd.Series(False, index=ind.index),
+        }
+    )
+
+
+def rank_panel(
+    ind: pd.DataFrame, live: dict[str, float | None] | pd.Series, weights: RankWeights = DEFAULT_WEIGHTS
+) -> pd.DataFrame:
+    """rank_score for a whole indicator_panel (DEFAULT_SPEC columns) at once."""
+    ltp = pd.Series(live, dtype="float64").reindex(ind.index)
+    score = rank_components(ind, ltp).to_numpy() @ weights.vector()
+
+    return pd.DataFrame(
+        {
+            "Symbol": ind.index,
+            "LTP": ltp.round(2).to_numpy(),
+            "Score": score,
+            "Grade": [rank_grade(x, weights) for x in score],
+            "RSI": ind["rsi14"].round(2).to_numpy(),
+            "RelVol": ind["rel_vol"].round(2).to_numpy(),
+        }
+    )
+
+
 # ------------------ SIMPLE BREAKOUT DETECTION ------------------
 
 
@@ -0,0 +1,320 @@
+"""Process-wide, request-coalescing data hub in front of core's fetchers.
+
+Pages ask for overlapping data: the Screener wants 3mo and then 6mo of the
+same watchlist, Ranking Engine and Tomorrow Picks both want 6mo, Backtest
+wants 1y, and every browser session asks for the same watchlist again.
+``DataAccess`` fetches every (symbol, interval) once at the widest period
+any page needs and serves narrower periods by slicing. One instance is
+shared by all Streamlit sessions of the server process (``shared_data``),
+so concurrent sessions asking for the same key wait on a single upstream
+fetch instead of starting their own.
+
+Entries expire on the NSE calendar: seconds while the market is live,
+until the next open once it has closed. The store is an LRU bounded by a
+memory budget, with hit / miss / coalesced / eviction counters.
+"""
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import pandas as pd
+
+import core
+from instrument import count, timed
+from market import expires_at
+from resample import RESAMPLE_BASE, resample_bars
+
+# periods smaller than this are served from one fetch of this period; weekly
+# and monthly bars are not widened, so core can resample them from cached daily
+# bars covering just the period asked for
+BASE_PERIOD = {"1d": "1y"}
+PERIOD_ORDER = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "max"]
+
+# seconds an entry is good for while the market is live
+LIVE_TTL = {"quote": core.QUOTE_TTL, "intraday": 30, "daily": core.CACHE_TTL}
+HUB_MAX_BYTES = 256 * 1024 * 1024
+QUOTE_BYTES = 64  # rough size of one cached quote
+# seconds a failed fetch / missing symbol is remembered before it is asked
+# for again, so one failure does not last until the next session
+RETRY_TTL = core.QUOTE_TTL
+
+
+def _covering(period: str) -> str:
+    # "ytd" has no fixed length, one year always covers it
+    return "1y" if period == "ytd" else period
+
+
+def _wider(a: str, b: str) -> str:
+    return a if PERIOD_ORDER.index(a) >= PERIOD_ORDER.index(b) else b
+
+
+def market_ttl(kind: str, interval: str | None = None) -> float:
+    """Live-market TTL for quotes ("quote") or bars of ``interval``."""
+    if kind == "quote":
+        return LIVE_TTL["quote"]
+    if interval and interval[-1] in "mh":
+        return LIVE_TTL["intraday"]
+    return LIVE_TTL["daily"]
+
+
+@dataclass
+class _Entry:
+    value: object
+    period: str | None
+    expires: float
+    nbytes: int
+
+
+class DataAccess:
+    """History / quote access with slicing, in-flight dedup, market-aware
+    expiry and an LRU memory budget."""
+
+    def __init__(
+        self,
+        loader=None,
+        quote_loader=None,
+        ttl: float | None = None,
+        max_bytes: int = HUB_MAX_BYTES,
+    ):
+        self._loader = loader or core.get_history_batch
+        self._quote_loader = quote_loader or core.get_live_prices
+        self.ttl = ttl  # fixed TTL in seconds, None = follow the market calendar
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._inflight: dict[tuple, Future] = {}
+        self._bytes = 0
+        self.fetch_counts: Counter = Counter()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.resampled = 0
+
+    # ---- store ----
+
+    def _expiry(self, now: float, kind: str, interval: str | None, missing: bool = False) -> float:
+        if missing:
+            return now + RETRY_TTL
+        if self.ttl is not None:
+            return now + self.ttl
+        return expires_at(now, market_ttl(kind, interval))
+
+    def _get(self, key: tuple, now: float) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None or now >= entry.expires:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put(self, key: tuple, entry: _Entry) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.nbytes
+        self._entries[key] = entry
+        self._bytes += entry.nbytes
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, dropped = self._entries.popitem(last=False)
+            self._bytes -= dropped.nbytes
+            self.evictions += 1
+
+    def _claim(self, keys: list[tuple], usable) -> tuple[list[tuple], dict[tuple, Future], dict[tuple, _Entry]]:
+        """Split keys into ones this caller must fetch, in-flight ones to wait
+        for and ones with a usable cached entry (returned with the entry)."""
+        now = time.time()
+        mine, waiting, cached = [], {}, {}
+        with self._lock:
+            for key in keys:
+                entry = self._get(key, now)
+                if entry is not None and usable(entry):
+                    self.hits += 1
+                    cached[key] = entry
+                    continue
+                if key in self._inflight:
+                    # someone else is already fetching it, share that fetch
+                    self.coalesced += 1
+                    waiting[key] = self._inflight[key]
+                    continue
+                self.misses += 1
+                self._inflight[key] = Future()
+                mine.append(key)
+        return mine, waiting, cached
+
+    def _release(self, entries: dict[tuple, _Entry]) -> None:
+        """Store fetched entries and hand each to the callers waiting on it."""
+        with self._lock:
+            for key, entry in entries.items():
+                self._put(key, entry)
+                self._inflight.pop(key).set_result(entry)
+
+    def _fetched(self, waiting: dict[tuple, Future], usable) -> tuple[dict, list[tuple]]:
+        """Entries the waited-on fetches produced, and the keys whose fetch
+        was not usable (a narrower period) and must be claimed again. The
+        entry comes from the fetch itself, so an LRU eviction in between
+        does not lose it."""
+        got, again = {}, []
+        for key, fut in waiting.items():
+            entry = fut.result()
+            if usable(entry):
+                got[key] = entry
+            else:
+                again.append(key)
+        return got, again
+
+    # ---- history ----
+
+    def history(
+        self, symbols: list[str], period: str = "6mo", interval: str = "1d"
+    ) -> dict[str, pd.DataFrame | None]:
+        syms = list(dict.fromkeys(s.upper() for s in symbols if s))
+        need = _covering(period)
+        fetch_period = _wider(BASE_PERIOD.get(interval, need), need)
+
+        keys = [("hist", sym, interval) for sym in syms]
+        with timed("hub.history"):
+            return self._history(keys, need, fetch_period, period, interval)
+
+    def _history(self, keys, need, fetch_period, period, interval) -> dict[str, pd.DataFrame | None]:
+        def usable(e: _Entry) -> bool:
+            return _wider(e.period, need) == e.period
+
+        got: dict[tuple, _Entry] = {}
+        pending = keys
+        while pending:
+            mine, waiting, cached = self._claim(pending, usable)
+            got.update(cached)
+            if mine:
+                got.update(self._fetch_history(mine, need, fetch_period, interval))
+            # a shared fetch of a narrower period (1y while we need 5y) is
+            # not enough, claim those keys again
+            done, pending = self._fetched(waiting, usable)
+            got.update(done)
+
+        out = {}
+        for key in keys:
+            df = got[key].value
+            if df is not None:
+                df = core.slice_period(df, period)
+            out[key[1]] = None if df is None or df.empty else df
+        return out
+
+    def _fetch_history(self, mine, need, fetch_period, interval) -> dict[tuple, _Entry]:
+        local = self._resampled([k[1] for k in mine], need, interval)
+        frames = {}
+        entries = {}
+        try:
+            rest = [k[1] for k in mine if k[1] not in local]
+            if rest:
+                frames = self._loader(rest, fetch_period, interval)
+        except Exception:
+            pass
+        finally:
+            now = time.time()
+            for key in mine:
+                if key[1] in local:
+                    df, until = local[key[1]]
+                    entry = _Entry(df, need, until, 0)
+                else:
+                    df = frames.get(key[1])
+                    entry = _Entry(df, fetch_period, self._expiry(now, "bars", interval, df is None), 0)
+                entry.nbytes = int(df.memory_usage(deep=True).sum()) if df is not None else 0
+                entries[key] = entry
+            with self._lock:
+                self.fetch_counts.update(key for key in mine if key[1] not in local)
+            self._release(entries)
+        return entries
+
+    def _resampled(self, syms: list[str], need: str, interval: str) -> dict[str, tuple[pd.DataFrame, float]]:
+        """Bars of ``interval`` built from base bars already in the hub (daily
+        for weekly / monthly, 1m for 2m-90m) that cover ``need``, with the base
+        entry's expiry. Symbols without such an entry are left to the loader."""
+        base = RESAMPLE_BASE.get(interval)
+        if base is None:
+            return {}
+        now = time.time()
+        with self._lock:
+            held = {sym: self._get(("hist", sym, base), now) for sym in syms}
+        out = {}
+        for sym, entry in held.items():
+            if entry is not None and entry.value is not None and _wider(entry.period, need) == entry.period:
+                out[sym] = (resample_bars(entry.value, interval), entry.expires)
+        if out:
+            count("hub.resampled", len(out))
+            with self._lock:
+                self.resampled += len(out)
+        return out
+
+    def history_one(self, symbol: str, period: str = "6mo", interval: str = "1d") -> pd.DataFrame | None:
+        return self.history([symbol], period, interval).get(symbol.upper())
+
+    # ---- quotes ----
+
+    def quotes(self, symbols: list[str]) -> dict[str, float | None]:
+        syms = list(dict.fromkeys(s.upper() for s in symbols if s))
+        keys = [("quote", sym) for sym in syms]
+        with timed("hub.quotes"):
+            return self._quotes(keys)
+
+    def _quotes(self, keys) -> dict[str, float | None]:
+        mine, waiting, got = self._claim(keys, lambda e: True)
+
+        if mine:
+            prices = {}
+            try:
+                prices = self._quote_loader([k[1] for k in mine])
+            except Exception:
+                pass
+            finally:
+                now = time.time()
+                entries = {}
+                for key in mine:
+                    price = prices.get(key[1])
+                    entries[key] = _Entry(price, None, self._expiry(now, "quote", None, price is None), QUOTE_BYTES)
+                with self._lock:
+                    self.fetch_counts.update(mine)
+                self._release(entries)
+                got.update(entries)
+        got.update(self._fetched(waiting, lambda e: True)[0])
+        return {key[1]: got[key].value for key in keys}
+
+    def quote(self, symbol: str) -> float | None:
+        return self.quotes([symbol]).get(symbol.upper())
+
+    # ---- stats ----
+
+    @property
+    def total_fetches(self) -> int:
+        return sum(self.fetch_counts.values())
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+                "resampled": self.resampled,
+                "upstream_fetches": sum(self.fetch_counts.values()),
+            }
+
+
+_shared: DataAccess | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_data() -> DataAccess:
+    """The DataAccess shared by every session of this server process
+    (a cache_resource-style singleton; modules live once per process)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = DataAccess()
+        return _shared
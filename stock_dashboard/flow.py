@@ -0,0 +1,119 @@
+"""Volume-based accumulation / distribution for a whole watchlist panel.
+
+Everything works on aligned dates x symbols frames (see ``panel.Panel``)
+and is vectorized across both axes:
+
+- up / down volume (volume of candles that closed up / down),
+- OBV, the Accumulation/Distribution line and Chaikin money flow,
+- up/down volume ratios over several lookbacks.
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_LOOKBACKS = (10, 20, 50)
+CMF_WINDOW = 20
+FLOW_THRESHOLD = 1.3  # up volume this many times down volume = accumulation
+
+
+def _rolling_sum(arr: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum over ``window`` rows; NaN counts as 0, warm-up rows are NaN."""
+    csum = np.cumsum(np.nan_to_num(arr), axis=0)
+    out = np.full(arr.shape, np.nan)
+    if arr.shape[0] >= window:
+        out[window - 1] = csum[window - 1]
+        out[window:] = csum[window:] - csum[:-window]
+    return out
+
+
+def _money_flow_volume(close: np.ndarray, high: np.ndarray, low: np.ndarray, vol: np.ndarray) -> np.ndarray:
+    rng = high - low
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mfm = np.where(rng > 0, ((close - low) - (high - close)) / rng, 0.0)
+    return mfm * vol
+
+
+def flow_series(
+    close: pd.DataFrame,
+    volume: pd.DataFrame,
+    high: pd.DataFrame | None = None,
+    low: pd.DataFrame | None = None,
+    cmf_window: int = CMF_WINDOW,
+) -> dict[str, pd.DataFrame]:
+    """Full flow history per symbol: up_vol, down_vol, obv and, when high/low
+    are given, ad_line and cmf. Every value is a dates x symbols frame."""
+    c = close.to_numpy(dtype="float64")
+    v = volume.reindex_like(close).to_numpy(dtype="float64")
+    chg = np.vstack([np.full((1, c.shape[1]), np.nan), np.diff(c, axis=0)])
+
+    up = np.where(chg > 0, v, 0.0)
+    down = np.where(chg < 0, v, 0.0)
+    obv = np.cumsum(np.nan_to_num(np.sign(chg) * v), axis=0)
+
+    def frame(arr: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(arr, index=close.index, columns=close.columns)
+
+    out = {"up_vol": frame(up), "down_vol": frame(down), "obv": frame(obv)}
+    if high is not None and low is not None:
+        h = high.reindex_like(close).to_numpy(dtype="float64")
+        lo = low.reindex_like(close).to_numpy(dtype="float64")
+        mfv = _money_flow_volume(c, h, lo, v)
+        out["ad_line"] = frame(np.cumsum(np.nan_to_num(mfv), axis=0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out["cmf"] = frame(_rolling_sum(mfv, cmf_window) / _rolling_sum(v, cmf_window))
+    return out
+
+
+def classify_flow(up_sum: float, down_sum: float) -> str:
+    if up_sum > down_sum * FLOW_THRESHOLD:
+        return "Strong Accumulation 🟢"
+    if down_sum > up_sum * FLOW_THRESHOLD:
+        return "Strong Distribution 🔴"
+    return "Mixed / Neutral"
+
+
+def flow_summary(
+    close: pd.DataFrame,
+    volume: pd.DataFrame,
+    high: pd.DataFrame | None = None,
+    low: pd.DataFrame | None = None,
+    lookbacks: tuple[int, ...] = DEFAULT_LOOKBACKS,
+    primary: int | None = None,
+    cmf_window: int = CMF_WINDOW,
+) -> pd.DataFrame:
+    """One row per symbol: up/down volume ratio for every lookback, latest
+    CMF, OBV change over the primary lookback and a Flow label.
+
+    The label compares up and down volume of the last ``primary`` candles
+    (default: the shortest lookback); symbols with fewer candles than that
+    are marked "Too few candles".
+    """
+    primary = primary or min(lookbacks)
+    series = flow_series(close, volume, high, low, cmf_window)
+    up = series["up_vol"].to_numpy()
+    down = series["down_vol"].to_numpy()
+    n_valid = close.notna().sum(axis=0).to_numpy()
+
+    out = {}
+    sums = {}
+    for lb in sorted(set(lookbacks) | {primary}):
+        up_sum = _rolling_sum(up, lb)[-1]
+        down_sum = _rolling_sum(down, lb)[-1]
+        sums[lb] = (up_sum, down_sum)
+        if lb in lookbacks:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(down_sum > 0, up_sum / down_sum, np.inf)
+            out[f"up_down_{lb}"] = np.where(n_valid > lb, ratio, np.nan)
+
+    obv = series["obv"].to_numpy()
+    if obv.shape[0] > primary:
+        out[f"obv_chg_{primary}"] = obv[-1] - obv[-1 - primary]
+    if "cmf" in series:
+        out["cmf"] = series["cmf"].to_numpy()[-1]
+
+    up_sum, down_sum = sums[primary]
+    out["Flow"] = [
+        classify_flow(u, d) if n > primary else "Too few candles"
+        for u, d, n in zip(up_sum, down_sum, n_valid)
+    ]
+    return pd.DataFrame(out, index=pd.Index(close.columns, name="Symbol"))
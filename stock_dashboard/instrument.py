@@ -0,0 +1,133 @@
+"""Lightweight timing and counters for the fetch / compute / render hot paths.
+
+    with timed("nse.quote", symbol):
+        ...
+    count("nse.failures")
+
+Latencies go into rolling windows per stage and per (stage, symbol), so
+memory stays bounded however long the server runs. The Diagnostics page
+reads p50 / p95 from them. Turned off (``NSE_QUANT_METRICS=0`` or
+``set_enabled(False)``), ``timed`` hands back one shared no-op context and
+``count`` returns at once, so the hooks cost one global lookup.
+
+Stage names are dotted, upstream first: ``nse.quote``, ``yf.download``,
+``disk.read``, ``indicators``, ``hub.history``, then ``page.<page>.fetch``
+/ ``.compute`` / ``.render`` for the pages.
+"""
+
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import nullcontext
+
+import numpy as np
+
+ENABLED = os.environ.get("NSE_QUANT_METRICS", "1") != "0"
+STAGE_WINDOW = 2048  # latest samples kept per stage
+SYMBOL_WINDOW = 64  # latest samples kept per (stage, symbol)
+MAX_SYMBOL_KEYS = 20_000  # per-symbol windows beyond this are not created
+HIST_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+_lock = threading.Lock()
+_stages: dict[str, deque] = {}
+_symbols: dict[tuple[str, str], deque] = {}
+_counters: Counter = Counter()
+_NULL = nullcontext()
+
+
+def set_enabled(on: bool) -> None:
+    global ENABLED
+    ENABLED = bool(on)
+
+
+def record(stage: str, seconds: float, symbol: str | None = None) -> None:
+    with _lock:
+        window = _stages.get(stage)
+        if window is None:
+            window = _stages[stage] = deque(maxlen=STAGE_WINDOW)
+        window.append(seconds)
+        if symbol is not None:
+            key = (stage, symbol)
+            window = _symbols.get(key)
+            if window is None:
+                if len(_symbols) >= MAX_SYMBOL_KEYS:
+                    return
+                window = _symbols[key] = deque(maxlen=SYMBOL_WINDOW)
+            window.append(seconds)
+
+
+class _Timer:
+    __slots__ = ("stage", "symbol", "t0")
+
+    def __init__(self, stage: str, symbol: str | None):
+        self.stage = stage
+        self.symbol = symbol
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.stage, time.perf_counter() - self.t0, self.symbol)
+        return False
+
+
+def timed(stage: str, symbol: str | None = None):
+    """Context manager timing its block into ``stage`` (and ``symbol``)."""
+    if not ENABLED:
+        return _NULL
+    return _Timer(stage, symbol)
+
+
+def count(name: str, n: int = 1) -> None:
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] += n
+
+
+def reset() -> None:
+    with _lock:
+        _stages.clear()
+        _symbols.clear()
+        _counters.clear()
+
+
+# ---- reports ----
+
+
+def _row(samples) -> dict:
+    ms = np.fromiter(samples, dtype="float64") * 1e3
+    p50, p95 = np.percentile(ms, [50, 95])
+    return {"calls": len(ms), "p50_ms": p50, "p95_ms": p95, "max_ms": ms.max(), "total_s": ms.sum() / 1e3}
+
+
+def stage_summary() -> list[dict]:
+    """p50 / p95 / max per stage over its rolling window."""
+    with _lock:
+        windows = {stage: list(w) for stage, w in _stages.items()}
+    return [{"stage": stage, **_row(w)} for stage, w in sorted(windows.items()) if w]
+
+
+def symbol_summary(stage: str | None = None) -> list[dict]:
+    """p50 / p95 / max per (stage, symbol), optionally for one stage."""
+    with _lock:
+        windows = {key: list(w) for key, w in _symbols.items() if stage is None or key[0] == stage}
+    return [{"stage": s, "symbol": sym, **_row(w)} for (s, sym), w in sorted(windows.items()) if w]
+
+
+def histogram(stage: str) -> list[dict]:
+    """Sample counts of ``stage`` in HIST_EDGES_MS latency buckets."""
+    with _lock:
+        samples = list(_stages.get(stage, ()))
+    ms = np.asarray(samples) * 1e3
+    edges = (0,) + HIST_EDGES_MS + (np.inf,)
+    counts, _ = np.histogram(ms, bins=edges)
+    labels = [f"<{hi:g}ms" if np.isfinite(hi) else f">={lo:g}ms" for lo, hi in zip(edges[:-1], edges[1:])]
+    return [{"bucket": label, "count": int(c)} for label, c in zip(labels, counts)]
+
+
+def counters() -> dict[str, int]:
+    with _lock:
+        return dict(sorted(_counters.items()))
@@ -0,0 +1,95 @@
+"""NSE trading calendar: session hours, holidays and cache expiry.
+
+Holidays are read from ``nse_holidays.csv`` next to this file or the file
+named by ``NSE_HOLIDAYS_FILE``: one ``YYYY-MM-DD`` date per line, optionally
+followed by ``,description``; ``#`` starts a comment. The shipped file has
+to be extended with each year's NSE holiday circular. A date missing from
+it (or a missing file) is treated as a trading day: nothing breaks, but
+the hub keeps refreshing through that day as if the market were live and
+after-close data expires at 09:15 on the holiday.
+"""
+
+import os
+from datetime import date, datetime, time, timedelta, timezone
+
+IST = timezone(timedelta(hours=5, minutes=30), "IST")
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+# Yahoo keeps revising the last daily bar for a while after the close
+POST_CLOSE_GRACE = timedelta(minutes=30)
+
+HOLIDAYS_FILE = os.environ.get(
+    "NSE_HOLIDAYS_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "nse_holidays.csv"),
+)
+
+
+def _load_holidays(path: str) -> set[date]:
+    out = set()
+    try:
+        with open(path) as fh:
+            for line in fh:
+                line = line.split("#")[0].strip().split(",")[0]
+                if line:
+                    out.add(date.fromisoformat(line))
+    except (OSError, ValueError):
+        pass
+    return out
+
+
+NSE_HOLIDAYS = _load_holidays(HOLIDAYS_FILE)
+
+
+def now_ist() -> datetime:
+    return datetime.now(IST)
+
+
+def _as_ist(ts: datetime | float | None) -> datetime:
+    if ts is None:
+        return now_ist()
+    if isinstance(ts, (int, float)):
+        return datetime.fromtimestamp(ts, IST)
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=IST)
+    return ts.astimezone(IST)
+
+
+def is_trading_day(d: date) -> bool:
+    return d.weekday() < 5 and d not in NSE_HOLIDAYS
+
+
+def is_market_open(ts: datetime | float | None = None) -> bool:
+    ts = _as_ist(ts)
+    return is_trading_day(ts.date()) and MARKET_OPEN <= ts.time() < MARKET_CLOSE
+
+
+def _in_live_window(ts: datetime) -> bool:
+    """Market hours plus the post-close grace period."""
+    if not is_trading_day(ts.date()):
+        return False
+    opened = datetime.combine(ts.date(), MARKET_OPEN, IST)
+    closed = datetime.combine(ts.date(), MARKET_CLOSE, IST) + POST_CLOSE_GRACE
+    return opened <= ts < closed
+
+
+def next_open(ts: datetime | float | None = None) -> datetime:
+    ts = _as_ist(ts)
+    d = ts.date()
+    if ts.time() >= MARKET_OPEN:
+        d += timedelta(days=1)
+    while not is_trading_day(d):
+        d += timedelta(days=1)
+    return datetime.combine(d, MARKET_OPEN, IST)
+
+
+def expires_at(fetched_at: datetime | float, live_ttl: float) -> float:
+    """Unix time at which data fetched at ``fetched_at`` goes stale.
+
+    While the market is live that is ``live_ttl`` seconds later; data
+    fetched after the close (and its grace period) stays good until the next
+    session opens.
+    """
+    ts = _as_ist(fetched_at)
+    if _in_live_window(ts):
+        return ts.timestamp() + live_ttl
+    return next_open(ts).timestamp()
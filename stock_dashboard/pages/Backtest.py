@@ -1,5 +1,15 @@
+import altair as alt
 import streamlit as st
-from core import get_history, sma_crossover_backtest, DEFAULT_SYMBOL
+import pandas as pd
+from backtest_runner import DEFAULT_WORKERS, run_universe_backtest
+from core import (
+    sma_crossover_backtest,
+    sma_crossover_sweep,
+    DEFAULT_SYMBOL,
+    DEFAULT_WATCHLIST,
+)
+from data_access import shared_data
+from panel import Panel
 
 st.title("📉 SMA Crossover Backtest")
 
@@ -9,7 +19,8 @@ slow = st.sidebar.slider("Slow SMA", 20, 200, 50)
 
 st.write(f"Backtesting **{sym}** for last 1 year with SMA {fast} / {slow}")
 
-h = get_history(sym, "1y", "1d")
+data = shared_data()
+h = data.history_one(sym, "1y", "1d")
 if h is None:
     st.error("No history data for backtest.")
 else:
@@ -31,3 +42,67 @@ else:
             file_name=f"{sym}_backtest.csv",
             mime="text/csv",
         )
+
+st.markdown("---")
+st.subheader("Parameter Sweep (Fast 5-50 x Slow 20-200)")
+
+metric = st.selectbox(
+    "Heatmap metric",
+    ["strategy_return_pct", "max_drawdown_pct", "trades", "exposure_pct"],
+)
+
+if h is not None:
+    grid = sma_crossover_sweep(h, range(5, 51), range(20, 201))
+    if grid is None or grid["strategy_return_pct"].isna().all():
+        st.warning("Not enough candles for a parameter sweep.")
+    else:
+        grid = grid.dropna(subset=["strategy_return_pct"])
+        heat = (
+            alt.Chart(grid)
+            .mark_rect()
+            .encode(
+                x=alt.X("slow:O", axis=alt.Axis(values=list(range(20, 201, 20)))),
+                y=alt.Y("fast:O", sort="descending", axis=alt.Axis(values=list(range(5, 51, 5)))),
+                color=alt.Color(
+                    f"{metric}:Q",
+                    scale=alt.Scale(scheme="redyellowgreen", reverse=metric == "max_drawdown_pct"),
+                ),
+                tooltip=list(grid.columns),
+            )
+            .properties(height=360)
+        )
+        st.altair_chart(heat, use_container_width=True)
+
+        st.write("Top 10 pairs by strategy return")
+        st.dataframe(
+            grid.sort_values("strategy_return_pct", ascending=False).head(10).round(2),
+            use_container_width=True,
+        )
+
+st.markdown("---")
+st.subheader(f"Universe Backtest (SMA {fast} / {slow}, 1 year)")
+
+uni_raw = st.text_area("Universe (comma separated)", DEFAULT_WATCHLIST)
+workers = st.number_input("Worker processes", min_value=1, max_value=64, value=DEFAULT_WORKERS)
+
+if st.button("Run universe backtest"):
+    uni = [s.strip().upper() for s in uni_raw.split(",") if s.strip()]
+    close = Panel.from_frames(data.history(uni, "1y", "1d"), ("Close",)).frame("Close")
+    if close.empty:
+        st.error("No history data for the universe.")
+    else:
+        progress = st.progress(0.0)
+        table_slot = st.empty()
+        rows = []
+        for i, (s, table) in enumerate(run_universe_backtest(close, fast, slow, int(workers)), 1):
+            if not table.empty:
+                rows.append(table.assign(Symbol=s))
+                table_slot.dataframe(
+                    pd.concat(rows, ignore_index=True)
+                    .sort_values("strategy_return_pct", ascending=False)
+                    .round(2),
+                    use_container_width=True,
+                )
+            progress.progress(i / close.shape[1])
+        if not rows:
+            st.warning("Not enough candles in the universe for this parameter combination.")
@@ -1,28 +1,15 @@
 import streamlit as st
-import pandas as pd
-from core import (
-    DEFAULT_WATCHLIST,
-    get_live_price,
-    get_history,
-    detect_breakout,
-)
+from instrument import timed
+from scan_ui import pick_symbols, run_scan
+from scanners import breakout_shard
 
 st.title("📌 Breakout / Breakdown Scanner")
 
-wl_raw = st.sidebar.text_area("Watchlist", DEFAULT_WATCHLIST)
-wl = [s.strip().upper() for s in wl_raw.split(",") if s.strip()]
+wl, universe = pick_symbols()
 
-rows = []
+df = run_scan("breakout", wl, universe, breakout_shard, "6mo")
+if df is None:
+    st.stop()
 
-for sym in wl:
-    live = get_live_price(sym)
-    h = get_history(sym, "6mo", "1d")
-
-    if live is None or h is None:
-        rows.append({"Symbol": sym, "Price": "--", "Breakout Status": "Data Error"})
-        continue
-
-    status = detect_breakout(h)
-    rows.append({"Symbol": sym, "Price": round(live, 2), "Breakout Status": status})
-
-st.dataframe(pd.DataFrame(rows), use_container_width=True)
+with timed("page.breakout.render"):
+    st.dataframe(df, use_container_width=True)
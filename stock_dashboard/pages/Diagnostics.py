@@ -0,0 +1,54 @@
+import streamlit as st
+import pandas as pd
+import instrument
+from data_access import shared_data
+from refresher import live_data
+
+st.title("🩺 Diagnostics – Timings & Cache Stats")
+
+on = st.sidebar.checkbox("Collect timings", instrument.ENABLED)
+instrument.set_enabled(on)
+if st.sidebar.button("Reset timings"):
+    instrument.reset()
+st.sidebar.caption("Process-wide: covers every session of this server.")
+
+st.subheader("Per Stage")
+stages = pd.DataFrame(instrument.stage_summary())
+if stages.empty:
+    st.info("No samples yet. Open a scanner page, then come back here.")
+else:
+    st.dataframe(stages.round(2).sort_values("total_s", ascending=False), use_container_width=True)
+
+    pick = st.selectbox("Latency histogram for", list(stages["stage"]))
+    hist = pd.DataFrame(instrument.histogram(pick)).set_index("bucket")
+    st.bar_chart(hist, height=200, use_container_width=True)
+
+st.markdown("---")
+st.subheader("Per Symbol")
+per_symbol = pd.DataFrame(instrument.symbol_summary())
+if per_symbol.empty:
+    st.info("No per-symbol samples yet.")
+else:
+    stage = st.selectbox("Stage", sorted(per_symbol["stage"].unique()))
+    rows = per_symbol[per_symbol["stage"] == stage].drop(columns="stage")
+    st.dataframe(rows.round(2).sort_values("p95_ms", ascending=False), use_container_width=True)
+
+st.markdown("---")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("Counters")
+    counts = instrument.counters()
+    if counts:
+        st.dataframe(pd.Series(counts, name="count").rename_axis("counter"), use_container_width=True)
+    else:
+        st.write("No counts yet.")
+
+with col2:
+    st.subheader("Data Hub")
+    stats = shared_data().stats()
+    stats["hit_rate"] = None if stats["hit_rate"] is None else round(stats["hit_rate"], 3)
+    st.dataframe(pd.Series({k: str(v) for k, v in stats.items()}, name="value").rename_axis("stat"), use_container_width=True)
+
+    data = live_data()
+    st.caption(f"Refresher: {'running' if data.running else 'stopped'} · {data.as_of_text()}")
@@ -1,43 +1,32 @@
 import streamlit as st
 import pandas as pd
-from core import DEFAULT_WATCHLIST, get_history
+from core import DEFAULT_WATCHLIST
+from panel import Panel
+from refresher import live_data
+from flow import DEFAULT_LOOKBACKS, flow_series
+from scanners import flow_shard
 
 st.title("🏦 Institutional Flow Style View (Volume Based)")
 
 wl_raw = st.sidebar.text_area("Watchlist", DEFAULT_WATCHLIST)
 wl = [s.strip().upper() for s in wl_raw.split(",") if s.strip()]
 
-rows = []
-
-for sym in wl:
-    h = get_history(sym, "3mo", "1d")
-    if h is None:
-        rows.append({"Symbol": sym, "Flow": "No data"})
-        continue
-
-    close = h["Close"]
-    vol = h["Volume"]
-
-    if len(close) < 10:
-        rows.append({"Symbol": sym, "Flow": "Too few candles"})
-        continue
-
-    # simplest approach: last 10 candles up vs down volume
-    df = pd.DataFrame({"close": close, "vol": vol}).dropna().tail(10)
-    df["chg"] = df["close"].diff()
-    df["up_vol"] = df.apply(lambda r: r["vol"] if r["chg"] > 0 else 0, axis=1)
-    df["down_vol"] = df.apply(lambda r: r["vol"] if r["chg"] < 0 else 0, axis=1)
-
-    up_sum = df["up_vol"].sum()
-    down_sum = df["down_vol"].sum()
-
-    if up_sum > down_sum * 1.3:
-        flow = "Strong Accumulation 🟢"
-    elif down_sum > up_sum * 1.3:
-        flow = "Strong Distribution 🔴"
-    else:
-        flow = "Mixed / Neutral"
-
-    rows.append({"Symbol": sym, "Flow": flow})
-
-st.dataframe(pd.DataFrame(rows), use_container_width=True)
+lookback = st.sidebar.selectbox("Flow lookback (candles)", DEFAULT_LOOKBACKS, index=0)
+period = st.sidebar.selectbox("History", ["3mo", "6mo", "1y"], index=0)
+
+data = live_data()
+hist = data.history(wl, period, "1d")
+st.caption(data.as_of_text())
+ok = [sym for sym in wl if hist.get(sym) is not None]
+
+st.dataframe(flow_shard(wl, hist, {}, primary=lookback), use_container_width=True)
+
+if ok:
+    st.markdown("---")
+    st.subheader("Flow History")
+    pick = st.selectbox("Symbol", ok)
+    panel = Panel.from_frames({pick: hist[pick]}, ("Close", "Volume", "High", "Low"))
+    series = flow_series(*(panel.frame(col) for col in ("Close", "Volume", "High", "Low")))
+    hist_df = pd.DataFrame({name: series[name][pick] for name in ("obv", "ad_line")})
+    st.line_chart(hist_df, height=260, use_container_width=True)
+    st.line_chart(series["cmf"][[pick]].rename(columns={pick: "cmf"}), height=160, use_container_width=True)
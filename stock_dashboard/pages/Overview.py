@@ -1,17 +1,21 @@
 import time
+from collections import OrderedDict
+from datetime import datetime
+
 import streamlit as st
 import pandas as pd
 from core import (
-    get_live_price,
-    get_history,
-    calc_sma,
-    calc_ema,
-    calc_rsi,
-    calc_macd,
-    calc_sr,
-    volume_check,
+    compute_snapshot,
+    indicator_frame,
+    IndicatorSpec,
     DEFAULT_SYMBOL,
 )
+from market import IST
+from refresher import live_data
+from streaming import StreamingMACD, StreamingRSI, TickBuffer
+
+TICK_CAPACITY = 2048  # ticks kept per symbol
+TICK_SYMBOLS = 10  # symbols whose ticks are kept per session
 
 st.title("📈 Overview – Live Price & Indicators")
 
@@ -26,50 +30,99 @@ emaF = st.sidebar.slider("EMA Fast", 5, 30, 12)
 emaS = st.sidebar.slider("EMA Slow", 10, 60, 26)
 rsiP = st.sidebar.slider("RSI period", 7, 30, 14)
 
-if auto:
-    time.sleep(sec)
+
+def live_indicators(sym: str, h: pd.DataFrame, rsi_period: int) -> dict:
+    """Streaming RSI/MACD seeded from completed daily bars, cached per session."""
+    close = h["Close"]
+    # today's partial daily bar is what the live tick replaces
+    if close.index[-1].date() == datetime.now(IST).date():
+        close = close.iloc[:-1]
+    key = (close.index[-1], len(close), rsi_period)
+    cache = st.session_state.setdefault("live_ind", {})
+    if sym not in cache or cache[sym]["key"] != key:
+        cache[sym] = {
+            "key": key,
+            "rsi": StreamingRSI.from_series(close, rsi_period),
+            "macd": StreamingMACD.from_series(close),
+        }
+    return cache[sym]
+
+
+def tick_buffer(sym: str) -> TickBuffer:
+    """This session's tick buffer for ``sym``; the least recently viewed
+    symbol's buffer is dropped beyond TICK_SYMBOLS."""
+    buffers = st.session_state.setdefault("ticks", OrderedDict())
+    if sym not in buffers:
+        buffers[sym] = TickBuffer(TICK_CAPACITY)
+    buffers.move_to_end(sym)
+    while len(buffers) > TICK_SYMBOLS:
+        buffers.popitem(last=False)
+    return buffers[sym]
+
 
 col1, col2 = st.columns(2)
 
-# --- live price history state ---
-if "ph" not in st.session_state:
-    st.session_state["ph"] = {}
-if sym not in st.session_state["ph"]:
-    st.session_state["ph"][sym] = []
+data = live_data()
+h = data.history_one(sym, "6mo", "1d")
+st.caption(data.as_of_text())
 
-with col1:
+
+# only this fragment reruns on the refresh timer; the technicals column
+# below is computed on full reruns (sidebar changes) only
+@st.fragment(run_every=sec if auto else None)
+def live_panel():
     st.subheader(f"Live Price: {sym}")
-    lp = get_live_price(sym)
+    lp = data.quote(sym)
+    ticks = tick_buffer(sym)
     if lp is not None:
         st.metric("LTP (₹)", f"{lp:,.2f}")
-        st.session_state["ph"][sym].append(lp)
+        if getattr(lp, "stale", False):
+            # a last-known price the hub serves while NSE fails is not a tick
+            st.warning("NSE is not answering; showing the last known price.")
+        else:
+            ticks.append(data.quotes_as_of or time.time(), lp)
     else:
         st.error("Could not fetch live price.")
 
-    ph = st.session_state["ph"][sym]
-    if len(ph) > 1:
-        st.line_chart(ph, height=260, use_container_width=True)
+    if lp is not None and h is not None and len(h) > 1:
+        live = live_indicators(sym, h, rsiP)
+        lr = live["rsi"].preview(lp)
+        lm, ls = live["macd"].preview(lp)
+        if lr is not None and lm is not None:
+            st.write(f"Intraday RSI({rsiP}): {lr:.2f}")
+            st.write(f"Intraday MACD / Signal: {lm:.2f} / {ls:.2f}")
+
+    if len(ticks) > 1:
+        st.line_chart(ticks.series(), height=260, use_container_width=True)
     else:
         st.info("Waiting for a few ticks...")
 
+    # today's recorded ticks survive the session, as 1-minute bars
+    if data.ticks is not None:
+        bars = data.ticks.bars(sym, "1m")
+        if len(bars) > 1:
+            st.caption("Today, 1-minute bars from the tick store")
+            st.line_chart(bars["Close"], height=200, use_container_width=True)
+
+
+with col1:
+    live_panel()
+
 with col2:
     st.subheader("Daily Technicals (6 Months)")
 
-    h = get_history(sym, "6mo", "1d")
     if h is None:
         st.error("No history available.")
     else:
-        close = h["Close"]
-        vol = h["Volume"]
-
-        sF = calc_sma(close, smaF)
-        sS = calc_sma(close, smaS)
-        eF = calc_ema(close, emaF)
-        eS = calc_ema(close, emaS)
-        rsi = calc_rsi(close, rsiP)
-        mac, sig = calc_macd(close)
-        sp, rs = calc_sr(close)
-        lv, av, rv = volume_check(vol)
+        spec = IndicatorSpec(sma=(smaF, smaS), ema=(emaF, emaS), rsi=rsiP)
+        snap = compute_snapshot(h, spec, sym)
+
+        sF, sS = snap.sma[smaF], snap.sma[smaS]
+        eF, eS = snap.ema[emaF], snap.ema[emaS]
+        rsi = snap.rsi
+        mac, sig = snap.macd, snap.signal
+        sp, rs = snap.support, snap.resistance
+        lv, av, rv = snap.last_vol, snap.avg_vol, snap.rel_vol
 
         def f(x):
             return f"{x:.2f}" if x is not None else "--"
@@ -111,3 +164,13 @@ with col2:
             f"<h2 style='text-align:center;color:{col}'>{signal}</h2>",
             unsafe_allow_html=True,
         )
+
+        st.markdown("---")
+        st.subheader("Indicator History")
+
+        # same memoised frame the snapshot above was read from
+        frame = indicator_frame(h, spec, sym)
+        price_cols = list(dict.fromkeys(["close", f"sma{smaF}", f"sma{smaS}"]))
+        st.line_chart(frame[price_cols], height=220, use_container_width=True)
+        st.line_chart(frame[[f"rsi{rsiP}"]], height=140, use_container_width=True)
+        st.line_chart(frame[["macd", "signal"]], height=140, use_container_width=True)
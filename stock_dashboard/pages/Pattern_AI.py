@@ -1,6 +1,16 @@
 import streamlit as st
 import pandas as pd
-from core import DEFAULT_WATCHLIST, get_history
+from core import DEFAULT_WATCHLIST
+from panel import Panel
+from refresher import live_data
+from patterns import (
+    DEFAULT_HORIZONS,
+    NO_PATTERN,
+    PatternParams,
+    latest_patterns,
+    pattern_stats,
+    scan_patterns,
+)
 
 st.title("🧠 Pattern Style Hints (Very Simple)")
 
@@ -9,41 +19,48 @@ st.caption("Simple heuristic checks (NOT real pattern AI, but good for project d
 wl_raw = st.sidebar.text_area("Watchlist", DEFAULT_WATCHLIST)
 wl = [s.strip().upper() for s in wl_raw.split(",") if s.strip()]
 
+st.sidebar.markdown("---")
+period = st.sidebar.selectbox("History for hit rates", ["6mo", "1y", "2y", "5y"], index=2)
+window = st.sidebar.slider("Pattern window (candles)", 20, 80, 40)
+tol = st.sidebar.slider("Low/high tolerance %", 1, 10, 5)
+params = PatternParams(window=window, tolerance=tol / 100)
+
+data = live_data()
+hist = data.history(wl, period, "1d")
+st.caption(data.as_of_text())
+ok = {sym: h for sym, h in hist.items() if h is not None}
+
 rows = []
+stats = pd.DataFrame()
+if ok:
+    close = Panel.from_frames(ok, ("Close",)).frame("Close")
+    hints = latest_patterns(close, params)
+    occ = scan_patterns(close, params)
+    stats = pattern_stats(occ)
+    hit = {r["Pattern"]: r for r in stats.to_dict("records")}
 
 for sym in wl:
-    h = get_history(sym, "6mo", "1d")
-    if h is None:
+    if sym not in ok:
         rows.append({"Symbol": sym, "Pattern Hint": "No data"})
         continue
-
-    close = h["Close"]
-    if len(close) < 40:
+    if ok[sym]["Close"].count() < window:
         rows.append({"Symbol": sym, "Pattern Hint": "Too few candles"})
         continue
 
-    recent = close.tail(40).reset_index(drop=True)
-
-    # crude W-pattern check: 2 lows separated by higher middle
-    low1 = recent[:15].min()
-    low2 = recent[20:35].min()
-    mid = recent[15:25].max()
-    last = recent.iloc[-1]
+    hint = hints[sym]
+    row = {"Symbol": sym, "Pattern Hint": hint}
+    if hint != NO_PATTERN and hint in hit:
+        h = max(DEFAULT_HORIZONS)
+        row[f"Hit Rate {h}D %"] = round(hit[hint][f"hit_{h}"], 1)
+        row["Seen"] = hit[hint]["Count"]
+    rows.append(row)
 
-    hint = "No clear pattern"
-
-    if low1 and low2 and mid:
-        if abs(low1 - low2) / low1 < 0.05 and mid > low1 * 1.05 and last > mid * 0.98:
-            hint = "Possible W / Double Bottom pattern 🟢"
-
-    # crude double top
-    high1 = recent[:15].max()
-    high2 = recent[20:35].max()
-    mid2 = recent[15:25].min()
-    if high1 and high2 and mid2:
-        if abs(high1 - high2) / high1 < 0.05 and mid2 < high1 * 0.97 and last < mid2 * 1.02:
-            hint = "Possible Double Top pattern 🔴"
+st.dataframe(pd.DataFrame(rows), use_container_width=True)
 
-    rows.append({"Symbol": sym, "Pattern Hint": hint})
+if not stats.empty:
+    st.markdown("---")
+    st.subheader(f"Pattern Track Record ({period}, whole watchlist)")
+    st.dataframe(stats.round(2), use_container_width=True)
 
-st.dataframe(pd.DataFrame(rows), use_container_width=True)
+    with st.expander("All occurrences"):
+        st.dataframe(occ.round({c: 2 for c in occ.select_dtypes("number")}), use_container_width=True)
@@ -1,49 +1,61 @@
 import streamlit as st
-import pandas as pd
-from core import (
-    DEFAULT_WATCHLIST,
-    get_live_price,
-    get_history,
-    rank_score,
-)
+from core import DEFAULT_WEIGHTS, RankWeights
+from instrument import timed
+from ranking import RankingService
+from scan_ui import pick_symbols, run_scan
+
+WEIGHT_LABELS = {
+    "sma_trend": "SMA5 > SMA20",
+    "ema_trend": "EMA12 > EMA26",
+    "macd": "MACD above signal",
+    "rsi_sweet": "RSI 45-60",
+    "rsi_strong": "RSI 60-70",
+    "near_support": "Near support",
+    "volume": "RelVol ≥ 1.2",
+    "weekly_trend": "Weekly close > 10w SMA",
+}
 
 st.title("🏆 Smart Stock Ranking Engine")
 
-wl_raw = st.sidebar.text_area("Watchlist (comma separated)", DEFAULT_WATCHLIST)
-wl = [s.strip().upper() for s in wl_raw.split(",") if s.strip()]
-
-rankings = []
-
-for sym in wl:
-    live = get_live_price(sym)
-    h = get_history(sym, "6mo", "1d")
-
-    if live is None or h is None:
-        rankings.append(
-            {
-                "Symbol": sym,
-                "LTP": None,
-                "Score": 0,
-                "Grade": "Data Error",
-                "RSI": None,
-                "RelVol": None,
-            }
-        )
-        continue
-
-    info = rank_score(sym, h, live)
-    rankings.append(info)
-
-df = pd.DataFrame(rankings)
-df = df.sort_values(by="Score", ascending=False)
-
-st.subheader("Full Ranking Table")
-st.dataframe(df, use_container_width=True)
-
-st.markdown("---")
-best = df[df["Score"] >= 70]
-if not best.empty:
-    st.success("📌 Top Ranked Stocks (Score ≥ 70):")
-    st.table(best[["Symbol", "Score", "Grade"]])
-else:
-    st.info("No strong bullish stocks at the moment based on current ranking model.")
+wl, universe = pick_symbols("Watchlist (comma separated)")
+
+with st.sidebar.expander("Scoring weights"):
+    weights = RankWeights(
+        **{
+            name: st.number_input(label, 0, 100, getattr(DEFAULT_WEIGHTS, name), step=5, key=f"weight_{name}")
+            for name, label in WEIGHT_LABELS.items()
+        }
+    )
+    st.caption(f"Max score: {weights.max_points}")
+top_k = st.sidebar.slider("Top K", 5, 100, 20)
+
+# scores persist across reruns; only symbols whose bars or quote moved are re-scored
+sig = universe or tuple(wl)
+held = st.session_state.get("ranking")
+if held is None or held[0] != sig:
+    held = st.session_state["ranking"] = (sig, RankingService(weights))
+service = held[1]
+service.set_weights(weights)
+
+if run_scan("ranking", wl, universe, service.update, "6mo", sort_by="Score") is None:
+    st.stop()
+
+with timed("page.ranking.render"):
+    counts = service.grade_counts()
+    if counts:
+        for col, (grade, n) in zip(st.columns(len(counts)), counts.items()):
+            col.metric(grade, n)
+
+    st.subheader(f"Top {top_k}")
+    st.dataframe(service.top(top_k), use_container_width=True)
+
+    st.markdown("---")
+    best = service.at_least(70)
+    if not best.empty:
+        st.success("📌 Top Ranked Stocks (Score ≥ 70):")
+        st.table(best[["Symbol", "Score", "Grade"]])
+    else:
+        st.info("No strong bullish stocks at the moment based on current ranking model.")
+
+    with st.expander(f"Full Ranking Table ({len(service)} symbols)"):
+        st.dataframe(service.table(), use_container_width=True)
@@ -0,0 +1,142 @@
+"""Compact dates x symbols storage for universe-sized history.
+
+A dict of yfinance frames keeps Open/High/Low/Close/Adj Close/Volume as
+float64 for every symbol, each frame with its own copy of the date index,
+while most pages only read Close and Volume. ``Panel`` keeps just the
+columns asked for: prices as float32, volume as uint32 (int64 when a value
+does not fit) plus a mask of the bars that have one, one shared date index
+and an integer position per symbol. Each column is one symbol-major block,
+so a symbol's bars are a contiguous row and price ``series`` / ``frame``
+hand out views, not copies. Volume has no NaN, so its frames and series are
+float64 copies with NaN where the mask is unset.
+
+float32 keeps about seven significant digits, plenty for prices quoted to
+0.05 in analytics over history (flow, patterns, backtests). Scores that
+compare indicators with a live price exactly, e.g. LTP at the support
+level, use ``core.build_panel``'s float64 panels instead.
+"""
+
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from core import flatten_columns
+
+PRICE_DTYPE = np.float32
+DEFAULT_COLUMNS = ("Close", "Volume")
+COUNT_COLUMNS = ("Volume",)  # stored as integers with a presence mask
+
+
+def _volume_dtype(frames: list[pd.DataFrame]) -> np.dtype:
+    top = max((df["Volume"].max() for df in frames if "Volume" in df), default=0)
+    return np.dtype(np.uint32) if not top > np.iinfo(np.uint32).max else np.dtype(np.int64)
+
+
+class Panel:
+    """Aligned columns of many symbols; ``column[pos]`` is one symbol's bars."""
+
+    def __init__(
+        self,
+        dates: pd.DatetimeIndex,
+        symbols: list[str],
+        columns: dict[str, np.ndarray],
+        present: dict[str, np.ndarray] | None = None,
+    ):
+        self.dates = dates
+        self.symbols = list(symbols)
+        self._pos = {sym: i for i, sym in enumerate(self.symbols)}
+        self._cols = columns
+        self._present = present or {}  # COUNT_COLUMNS -> bool mask of real values
+
+    @classmethod
+    def from_frames(
+        cls, frames: dict[str, pd.DataFrame | None], columns: tuple[str, ...] = DEFAULT_COLUMNS
+    ) -> "Panel":
+        """Copy ``columns`` of every non-empty frame into one panel; the other
+        columns are never touched. Dates missing for a symbol are NaN, or
+        unset in the mask for volume."""
+        frames = {sym: flatten_columns(df) for sym, df in frames.items() if df is not None and not df.empty}
+        indexes = [df.index for df in frames.values()]
+        if not indexes:
+            dates = pd.DatetimeIndex([])
+        else:
+            # common case: one exchange calendar, every index is the same
+            dates = reduce(lambda a, b: a if b.equals(a) else a.union(b), indexes[1:], indexes[0])
+            if not dates.is_monotonic_increasing:
+                dates = dates.sort_values()
+
+        out, present = {}, {}
+        shape = (len(frames), len(dates))
+        for col in columns:
+            counts = col in COUNT_COLUMNS
+            if counts:
+                arr = np.zeros(shape, dtype=_volume_dtype(list(frames.values())))
+                mask = present[col] = np.zeros(shape, dtype=bool)
+            else:
+                arr = np.full(shape, np.nan, dtype=PRICE_DTYPE)
+            for i, df in enumerate(frames.values()):
+                if col not in df:
+                    continue
+                values = df[col].to_numpy()
+                rows = slice(None) if df.index.equals(dates) else dates.get_indexer(df.index)
+                if counts:
+                    have = ~pd.isna(values)
+                    mask[i, rows] = have
+                    values = np.where(have, values, 0)
+                arr[i, rows] = values
+            out[col] = arr
+        return cls(dates, list(frames), out, present)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._pos
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._cols)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [*self._cols.values(), *self._present.values()]
+        return sum(a.nbytes for a in arrays) + self.dates.nbytes
+
+    def values(self, column: str = "Close") -> np.ndarray:
+        """The symbols x dates block of ``column`` (no copy); volume is 0
+        where ``present(column)`` is unset."""
+        return self._cols[column]
+
+    def present(self, column: str) -> np.ndarray:
+        """Where ``column`` holds a real value, symbols x dates."""
+        if column in self._present:
+            return self._present[column]
+        return ~np.isnan(self._cols[column])
+
+    def _block(self, column: str, rows=slice(None)) -> np.ndarray:
+        arr = self._cols[column][rows]
+        if column not in self._present:
+            return arr
+        return np.where(self._present[column][rows], arr, np.nan)
+
+    def series(self, symbol: str, column: str = "Close") -> pd.Series:
+        """One symbol's ``column``; prices view the panel's row."""
+        row = self._block(column, self._pos[symbol])
+        return pd.Series(row, index=self.dates, name=symbol, copy=False)
+
+    def frame(self, column: str = "Close") -> pd.DataFrame:
+        """Dates x symbols frame of ``column`` (the ``core.build_panel``
+        layout); prices view the panel's block."""
+        return pd.DataFrame(self._block(column).T, index=self.dates, columns=self.symbols, copy=False)
+
+    def take(self, symbols: list[str]) -> "Panel":
+        """A panel of just ``symbols`` (copies their rows)."""
+        keep = [s for s in symbols if s in self._pos]
+        rows = [self._pos[s] for s in keep]
+        return Panel(
+            self.dates,
+            keep,
+            {col: arr[rows] for col, arr in self._cols.items()},
+            {col: mask[rows] for col, mask in self._present.items()},
+        )
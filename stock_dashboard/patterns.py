@@ -0,0 +1,151 @@
+"""Double bottom / double top detection over every window of every symbol.
+
+The checks are the same crude ones Pattern_AI always used on its last 40
+candles (two lows/highs in the first and second part of the window, a
+higher/lower middle, last close near the middle level), but scaled to any
+window length and run on strided sliding-window views of the whole
+dates x symbols close panel, so the full history of a universe is scanned
+in one batched pass. Each occurrence carries its forward returns, which
+turns the hints into hit-rate statistics.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+DOUBLE_BOTTOM = "Possible W / Double Bottom pattern 🟢"
+DOUBLE_TOP = "Possible Double Top pattern 🔴"
+NO_PATTERN = "No clear pattern"
+
+DEFAULT_HORIZONS = (5, 10, 20)
+CHUNK_CELLS = 20_000_000  # window elements materialised per reduction
+
+
+@dataclass(frozen=True)
+class PatternParams:
+    window: int = 40
+    tolerance: float = 0.05  # max relative gap between the two lows / highs
+    bounce: float = 0.05  # middle high above the first low (double bottom)
+    pullback: float = 0.03  # middle low below the first high (double top)
+    confirm: float = 0.02  # last close within this of the middle level
+
+    def segments(self) -> tuple[slice, slice, slice]:
+        """First leg, middle and second leg; 0:15, 15:25 and 20:35 of 40 bars."""
+        w = self.window
+        return (
+            slice(0, round(w * 15 / 40)),
+            slice(round(w * 15 / 40), round(w * 25 / 40)),
+            slice(round(w * 20 / 40), round(w * 35 / 40)),
+        )
+
+
+DEFAULT_PARAMS = PatternParams()
+
+
+def _detect(arr: np.ndarray, params: PatternParams) -> tuple[np.ndarray, np.ndarray]:
+    """Boolean (windows x symbols) masks for double bottom and double top,
+    window i covering rows i .. i + window - 1."""
+    first, mid, second = params.segments()
+    n_win = arr.shape[0] - params.window + 1
+    bottom = np.zeros((n_win, arr.shape[1]), dtype=bool)
+    top = np.zeros_like(bottom)
+
+    cols_per_chunk = max(1, CHUNK_CELLS // max(1, n_win * params.window))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for lo in range(0, arr.shape[1], cols_per_chunk):
+            hi = min(lo + cols_per_chunk, arr.shape[1])
+            # (windows, symbols, window) view, no copy
+            win = sliding_window_view(arr[:, lo:hi], params.window, axis=0)
+            last = win[..., -1]
+
+            low1 = win[..., first].min(axis=-1)
+            low2 = win[..., second].min(axis=-1)
+            mid_hi = win[..., mid].max(axis=-1)
+            bottom[:, lo:hi] = (
+                (np.abs(low1 - low2) / low1 < params.tolerance)
+                & (mid_hi > low1 * (1 + params.bounce))
+                & (last > mid_hi * (1 - params.confirm))
+            )
+
+            high1 = win[..., first].max(axis=-1)
+            high2 = win[..., second].max(axis=-1)
+            mid_lo = win[..., mid].min(axis=-1)
+            top[:, lo:hi] = (
+                (np.abs(high1 - high2) / high1 < params.tolerance)
+                & (mid_lo < high1 * (1 - params.pullback))
+                & (last < mid_lo * (1 + params.confirm))
+            )
+    # the old page let a double top override a double bottom
+    bottom &= ~top
+    return bottom, top
+
+
+def latest_patterns(close: pd.DataFrame, params: PatternParams = DEFAULT_PARAMS) -> pd.Series:
+    """Pattern hint for the most recent window of every symbol."""
+    arr = close.to_numpy(dtype="float64")
+    hints = pd.Series(NO_PATTERN, index=close.columns, name="Pattern Hint")
+    if arr.shape[0] < params.window:
+        return hints
+    bottom, top = _detect(arr[-params.window :], params)
+    hints[bottom[-1]] = DOUBLE_BOTTOM
+    hints[top[-1]] = DOUBLE_TOP
+    return hints
+
+
+def scan_patterns(
+    close: pd.DataFrame,
+    params: PatternParams = DEFAULT_PARAMS,
+    horizons: tuple[int, ...] = DEFAULT_HORIZONS,
+) -> pd.DataFrame:
+    """Every pattern occurrence across the panel's full history.
+
+    A run of consecutive matching windows counts once, dated at its first
+    window's last bar. ``fwd_<h>`` is the close-to-close return (%) ``h``
+    bars later, NaN when the history ends first.
+    """
+    arr = close.to_numpy(dtype="float64")
+    cols = ["Symbol", "Date", "Pattern", "Close"] + [f"fwd_{h}" for h in horizons]
+    if arr.shape[0] < params.window:
+        return pd.DataFrame(columns=cols)
+
+    bottom, top = _detect(arr, params)
+    frames = []
+    for name, mask in ((DOUBLE_BOTTOM, bottom), (DOUBLE_TOP, top)):
+        onset = mask & ~np.vstack([np.zeros((1, mask.shape[1]), dtype=bool), mask[:-1]])
+        win_idx, sym_idx = np.nonzero(onset)
+        end = win_idx + params.window - 1
+        entry = arr[end, sym_idx]
+        data = {
+            "Symbol": close.columns.to_numpy()[sym_idx],
+            "Date": close.index.to_numpy()[end],
+            "Pattern": name,
+            "Close": entry,
+        }
+        for h in horizons:
+            later = end + h
+            ok = later < arr.shape[0]
+            exit_ = np.full(end.shape, np.nan)
+            exit_[ok] = arr[later[ok], sym_idx[ok]]
+            data[f"fwd_{h}"] = (exit_ / entry - 1) * 100
+        frames.append(pd.DataFrame(data))
+    return pd.concat(frames, ignore_index=True).sort_values(["Symbol", "Date"], ignore_index=True)
+
+
+def pattern_stats(occurrences: pd.DataFrame, horizons: tuple[int, ...] = DEFAULT_HORIZONS) -> pd.DataFrame:
+    """Per pattern: occurrence count, hit rate (%) and mean forward return.
+
+    A double bottom hits when the forward return is positive, a double top
+    when it is negative; occurrences too recent for a horizon are skipped.
+    """
+    rows = []
+    for name, grp in occurrences.groupby("Pattern"):
+        row = {"Pattern": name, "Count": len(grp)}
+        sign = 1 if name == DOUBLE_BOTTOM else -1
+        for h in horizons:
+            fwd = grp[f"fwd_{h}"].dropna()
+            row[f"hit_{h}"] = float((fwd * sign > 0).mean() * 100) if len(fwd) else np.nan
+            row[f"avg_{h}"] = float(fwd.mean()) if len(fwd) else np.nan
+        rows.append(row)
+    return pd.DataFrame(rows)
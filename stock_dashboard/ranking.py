@@ -0,0 +1,218 @@
+"""Incremental ranking: scores kept between reruns, re-scored per change.
+
+``RankingService.update`` has the scanner shard signature. It recomputes
+indicators only for symbols whose bars changed and, for symbols whose
+price alone moved, just the price-dependent component (LTP near support)
+and the score. Scores live in a sorted index of ``(-score, symbol)`` keys
+and a set per grade, both patched in place, so the top K and the grade
+counts never need a full sort. New weights re-score everything from the
+stored components without touching the indicators.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+
+import numpy as np
+import pandas as pd
+
+from core import (
+    DEFAULT_WEIGHTS,
+    RANK_COMPONENTS,
+    RankWeights,
+    bars_key,
+    build_panel,
+    indicator_panel,
+    rank_components,
+    rank_grade,
+)
+from instrument import count, timed
+
+IND_COLS = (
+    "sma5",
+    "sma20",
+    "ema12",
+    "ema26",
+    "macd",
+    "signal",
+    "rsi14",
+    "support",
+    "resistance",
+    "rel_vol",
+    "wk_close",
+    "wk_sma10",
+)
+DATA_ERROR = "Data Error"
+GRADES = ("🔥 STRONG BUY", "BUY", "HOLD", "WEAK", "BEARISH", DATA_ERROR)
+COLUMNS = ["Symbol", "LTP", "Score", "Grade", "RSI", "RelVol"]
+
+_UNSEEN = object()
+
+
+class RankingService:
+    def __init__(self, weights: RankWeights = DEFAULT_WEIGHTS, capacity: int = 256):
+        self.weights = weights
+        self._pos: dict[str, int] = {}
+        self._syms: list[str] = []
+        self._ind = np.full((capacity, len(IND_COLS)), np.nan)
+        self._comp = np.zeros((capacity, len(RANK_COMPONENTS)), dtype=bool)
+        self._ltp = np.full(capacity, np.nan)
+        self._score = np.zeros(capacity, dtype=np.int64)
+        self._ok = np.zeros(capacity, dtype=bool)
+        self._frames: dict[str, pd.DataFrame | None] = {}
+        self._bar_key: dict[str, tuple | None] = {}
+        self._live: dict[str, float | None] = {}
+        self._grade: dict[str, str] = {}
+        self._index: list[tuple[int, str]] = []  # (-score, symbol), ranked symbols only
+        self._indexed: dict[str, int] = {}  # score each symbol is filed under in _index
+        self._buckets: dict[str, set[str]] = {g: set() for g in GRADES}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._syms)
+
+    def _slot(self, sym: str) -> int:
+        pos = self._pos.get(sym)
+        if pos is None:
+            pos = self._pos[sym] = len(self._syms)
+            self._syms.append(sym)
+            if pos >= len(self._ltp):
+                grow = len(self._ltp)
+                self._ind = np.vstack([self._ind, np.full_like(self._ind, np.nan)])
+                self._comp = np.vstack([self._comp, np.zeros_like(self._comp)])
+                self._ltp = np.concatenate([self._ltp, np.full(grow, np.nan)])
+                self._score = np.concatenate([self._score, np.zeros(grow, dtype=np.int64)])
+                self._ok = np.concatenate([self._ok, np.zeros(grow, dtype=bool)])
+        return pos
+
+    # ---- updates ----
+
+    def update(self, symbols: list[str], hist: dict, prices: dict) -> pd.DataFrame:
+        """Take new bars / prices for ``symbols``; returns the re-scored rows."""
+        with self._lock, timed("ranking.update"):
+            bars, moved = [], []
+            for sym in symbols:
+                h = hist.get(sym)
+                live = prices.get(sym)
+                live = None if live is None else float(live)
+                if h is not None and h is self._frames.get(sym):
+                    # the refresher hands back the same frame until its bars change
+                    if self._live[sym] == live:
+                        continue
+                    moved.append(sym)
+                    self._live[sym] = live
+                    continue
+
+                key = bars_key(h)
+                if self._bar_key.get(sym, _UNSEEN) != key:
+                    bars.append(sym)
+                elif self._live.get(sym, _UNSEEN) != live:
+                    moved.append(sym)
+                self._slot(sym)
+                self._frames[sym] = h
+                self._bar_key[sym] = key
+                self._live[sym] = live
+
+            fresh = {s: hist[s] for s in bars if self._bar_key[s] is not None}
+            if fresh:
+                ind = indicator_panel(build_panel(fresh, "Close"), build_panel(fresh, "Volume"))
+                rows = [self._pos[s] for s in ind.index]
+                self._ind[rows] = ind[list(IND_COLS)].to_numpy()
+            for s in bars:
+                if self._bar_key[s] is None:
+                    self._ind[self._pos[s]] = np.nan
+
+            changed = bars + moved
+            count("ranking.bars", len(bars))
+            count("ranking.rescored", len(changed))
+            if not changed:
+                return pd.DataFrame(columns=COLUMNS)
+            pos = np.fromiter((self._pos[s] for s in changed), dtype=np.intp, count=len(changed))
+            self._ltp[pos] = [np.nan if self._live[s] is None else self._live[s] for s in changed]
+            self._ok[pos] = [self._bar_key[s] is not None and self._live[s] is not None for s in changed]
+            ind = pd.DataFrame(self._ind[pos], columns=IND_COLS)
+            self._comp[pos] = rank_components(ind, pd.Series(self._ltp[pos])).to_numpy()
+            self._rescore(pos)
+            return self._frame(pos)
+
+    def _rescore(self, pos: np.ndarray) -> None:
+        self._score[pos] = np.where(self._ok[pos], self._comp[pos] @ self.weights.vector(), 0)
+        for p in pos:
+            sym = self._syms[p]
+            old = self._grade.get(sym)
+            if old is not None:
+                self._buckets[old].discard(sym)
+            prev = self._indexed.pop(sym, None)
+            if prev is not None:
+                del self._index[bisect_left(self._index, (-prev, sym))]
+            if self._ok[p]:
+                score = int(self._score[p])
+                insort(self._index, (-score, sym))
+                self._indexed[sym] = score
+                grade = rank_grade(score, self.weights)
+            else:
+                grade = DATA_ERROR
+            self._grade[sym] = grade
+            self._buckets[grade].add(sym)
+
+    def set_weights(self, weights: RankWeights) -> None:
+        """Re-score every symbol with new weights from the stored components."""
+        with self._lock:
+            if weights == self.weights:
+                return
+            self.weights = weights
+            n = len(self._syms)
+            self._score[:n] = np.where(self._ok[:n], self._comp[:n] @ weights.vector(), 0)
+            ranked = np.flatnonzero(self._ok[:n])
+            self._index = sorted((-int(self._score[p]), self._syms[p]) for p in ranked)
+            self._indexed = {self._syms[p]: int(self._score[p]) for p in ranked}
+            self._buckets = {g: set() for g in GRADES}
+            for p, sym in enumerate(self._syms):
+                grade = rank_grade(self._score[p], weights) if self._ok[p] else DATA_ERROR
+                self._grade[sym] = grade
+                self._buckets[grade].add(sym)
+
+    # ---- reads ----
+
+    def _frame(self, pos) -> pd.DataFrame:
+        pos = np.asarray(pos, dtype=np.intp)
+        ok = self._ok[pos]
+        rsi = self._ind[pos, IND_COLS.index("rsi14")]
+        relv = self._ind[pos, IND_COLS.index("rel_vol")]
+        return pd.DataFrame(
+            {
+                "Symbol": [self._syms[p] for p in pos],
+                "LTP": np.where(ok, self._ltp[pos], np.nan).round(2),
+                "Score": self._score[pos],
+                "Grade": [self._grade[self._syms[p]] for p in pos],
+                "RSI": np.where(ok, rsi, np.nan).round(2),
+                "RelVol": np.where(ok, relv, np.nan).round(2),
+            },
+            columns=COLUMNS,
+        )
+
+    def top(self, k: int = 20) -> pd.DataFrame:
+        """The ``k`` best scores, best first (ties by symbol)."""
+        with self._lock:
+            return self._frame([self._pos[sym] for _, sym in self._index[:k]])
+
+    def table(self) -> pd.DataFrame:
+        """Every symbol, ranked ones by score then the data errors."""
+        with self._lock:
+            ranked = [self._pos[sym] for _, sym in self._index]
+            errors = sorted(self._pos[s] for s in self._buckets[DATA_ERROR])
+            return self._frame(ranked + errors)
+
+    def at_least(self, score: int) -> pd.DataFrame:
+        """Every symbol scoring ``score`` or more, best first."""
+        with self._lock:
+            end = bisect_right(self._index, (-score, "\U0010ffff"))
+            return self._frame([self._pos[sym] for _, sym in self._index[:end]])
+
+    def grade_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {g: len(self._buckets[g]) for g in GRADES if self._buckets[g]}
+
+    def bucket(self, grade: str) -> list[str]:
+        """Symbols in one grade, best score first."""
+        with self._lock:
+            return sorted(self._buckets.get(grade, ()), key=lambda s: (-self._score[self._pos[s]], s))
@@ -0,0 +1,264 @@
+"""Background market-data refresher, decoupled from page rendering.
+
+One ``Refresher`` thread per server process keeps quotes and daily bars of
+every watched symbol fresh in a local store on a schedule. Pages read only
+from that store, so a render costs no network I/O and shows how old the
+data is. The only blocking is the first time a symbol is seen, and that is
+bounded by ``cold_wait``. Symbols no page has asked for within
+``watch_idle`` seconds stop being refreshed and their data is dropped.
+
+The data source is anything with ``history(symbols, period, interval)``
+and ``quotes(symbols)`` methods, by default the shared ``DataAccess`` hub;
+tests plug in a local stub. With a ``TickStore`` attached, every quote
+poll made while the market is open is also recorded as intraday ticks.
+"""
+
+import atexit
+import threading
+import time
+
+import pandas as pd
+
+import core
+from market import is_market_open
+
+QUOTE_EVERY = 5  # seconds between quote refreshes while the market is live
+BARS_EVERY = 60  # seconds between bar refreshes while the market is live
+CLOSED_EVERY = 600  # seconds between refreshes of either kind after the close
+COLD_WAIT = 15  # max seconds a page waits for a symbol it asks for first
+WATCH_IDLE = 900  # seconds a symbol stays watched after a page last asked for it
+
+
+class Refresher:
+    def __init__(
+        self,
+        source=None,
+        period: str = "1y",
+        interval: str = "1d",
+        quote_every: float = QUOTE_EVERY,
+        bars_every: float = BARS_EVERY,
+        closed_every: float = CLOSED_EVERY,
+        cold_wait: float = COLD_WAIT,
+        watch_idle: float = WATCH_IDLE,
+        ticks=None,
+    ):
+        if source is None:
+            from data_access import shared_data
+
+            source = shared_data()
+        self.source = source
+        self.period = period
+        self.interval = interval
+        self.quote_every = quote_every
+        self.bars_every = bars_every
+        self.closed_every = closed_every
+        self.cold_wait = cold_wait
+        self.watch_idle = watch_idle
+        self.ticks = ticks  # optional TickStore that records every live quote poll
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._watched: dict[str, float] = {}  # symbol -> when a page last asked for it
+        self._pending: set[str] = set()
+        self._bars: dict[str, pd.DataFrame | None] = {}
+        # (symbol, period) -> (stored frame, its slice): a symbol whose bars
+        # did not change comes back as the very same object
+        self._slices: dict[tuple[str, str], tuple[pd.DataFrame, pd.DataFrame]] = {}
+        self._quotes: dict[str, float | None] = {}
+        self.bars_as_of: float | None = None
+        self.quotes_as_of: float | None = None
+        self.last_error: str | None = None
+
+    # ---- lifecycle ----
+
+    def start(self) -> "Refresher":
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="market-refresher", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5) -> bool:
+        """Stop the thread; True when it exited within ``timeout``."""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ---- refresh loop ----
+
+    def _every(self, live_every: float) -> float:
+        return live_every if is_market_open() else max(live_every, self.closed_every)
+
+    def _refresh_bars(self, symbols: list[str]) -> None:
+        frames = self.source.history(symbols, self.period, self.interval)
+        with self._changed:
+            self._bars.update({s: frames.get(s) for s in symbols})
+            self.bars_as_of = time.time()
+            self._changed.notify_all()
+
+    def _refresh_quotes(self, symbols: list[str]) -> None:
+        prices = self.source.quotes(symbols)
+        now = time.time()
+        with self._changed:
+            self._quotes.update({s: prices.get(s) for s in symbols})
+            self.quotes_as_of = now
+            self._changed.notify_all()
+        if self.ticks is not None and is_market_open(now):
+            # a stale last-known-good price is not a new tick
+            fresh = {s: prices.get(s) for s in symbols if not getattr(prices.get(s), "stale", False)}
+            self.ticks.append_quotes(fresh, now)
+
+    def _expire(self, now: float) -> None:
+        """Stop watching symbols nobody asked for within ``watch_idle``."""
+        idle = [s for s, seen in self._watched.items() if now - seen > self.watch_idle]
+        for sym in idle:
+            del self._watched[sym]
+            self._pending.discard(sym)
+            self._bars.pop(sym, None)
+            self._quotes.pop(sym, None)
+        if idle:
+            self._slices = {k: v for k, v in self._slices.items() if k[0] in self._watched}
+
+    def _run(self) -> None:
+        next_bars = next_quotes = 0.0
+        while not self._stop.is_set():
+            with self._lock:
+                self._expire(time.time())
+                watched = sorted(self._watched)
+                pending = sorted(self._pending)
+                self._pending.clear()
+            try:
+                now = time.time()
+                # newly watched symbols jump the schedule
+                if watched and now >= next_bars:
+                    self._refresh_bars(watched)
+                    next_bars = time.time() + self._every(self.bars_every)
+                elif pending:
+                    self._refresh_bars(pending)
+                if watched and now >= next_quotes:
+                    self._refresh_quotes(watched)
+                    next_quotes = time.time() + self._every(self.quote_every)
+                elif pending:
+                    self._refresh_quotes(pending)
+                self.last_error = None
+            except Exception as exc:  # keep the daemon alive, show the error
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                next_bars = next_quotes = time.time() + self.quote_every
+
+            timeout = max(0.05, min(next_bars, next_quotes) - time.time())
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    # ---- page API ----
+
+    def watch(self, symbols: list[str]) -> None:
+        syms = {s.upper() for s in symbols if s}
+        now = time.time()
+        with self._lock:
+            new = syms - self._watched.keys()
+            self._watched.update(dict.fromkeys(syms, now))
+            self._pending |= new
+        if new:
+            self._wake.set()
+
+    def _wait_for(self, store: dict, syms: list[str]) -> None:
+        if not self.running:
+            return
+        deadline = time.time() + self.cold_wait
+        with self._changed:
+            while any(s not in store for s in syms):
+                left = deadline - time.time()
+                if left <= 0:
+                    break
+                self._changed.wait(left)
+
+    def history(
+        self, symbols: list[str], period: str = "6mo", interval: str = "1d"
+    ) -> dict[str, pd.DataFrame | None]:
+        """Stored bars sliced to ``period``; other intervals, or periods wider
+        than the refreshed one, go to the source directly."""
+        syms = list(dict.fromkeys(s.upper() for s in symbols if s))
+        if interval != self.interval or _longer(period, self.period):
+            return self.source.history(syms, period, interval)
+
+        self.watch(syms)
+        self._wait_for(self._bars, syms)
+        with self._lock:
+            frames = {s: self._bars.get(s) for s in syms}
+            hits = {s: self._slices.get((s, period)) for s in syms}
+        out, fresh = {}, {}
+        for sym, df in frames.items():
+            if df is not None:
+                hit = hits[sym]
+                if hit is not None and hit[0] is df:
+                    df = hit[1]
+                else:
+                    sliced = core.slice_period(df, period)
+                    fresh[(sym, period)] = (df, sliced)
+                    df = sliced
+            out[sym] = None if df is None or df.empty else df
+        if fresh:
+            with self._lock:  # the refresh thread prunes _slices in _expire
+                self._slices.update((k, v) for k, v in fresh.items() if k[0] in self._watched)
+        return out
+
+    def history_one(self, symbol: str, period: str = "6mo", interval: str = "1d") -> pd.DataFrame | None:
+        return self.history([symbol], period, interval).get(symbol.upper())
+
+    def quotes(self, symbols: list[str]) -> dict[str, float | None]:
+        syms = list(dict.fromkeys(s.upper() for s in symbols if s))
+        self.watch(syms)
+        self._wait_for(self._quotes, syms)
+        with self._lock:
+            return {s: self._quotes.get(s) for s in syms}
+
+    def quote(self, symbol: str) -> float | None:
+        return self.quotes([symbol]).get(symbol.upper())
+
+    def as_of_text(self) -> str:
+        def age(ts: float | None) -> str:
+            if ts is None:
+                return "never"
+            secs = int(time.time() - ts)
+            return f"{secs}s ago" if secs < 120 else f"{secs // 60}m ago"
+
+        text = f"Quotes: {age(self.quotes_as_of)} · Bars: {age(self.bars_as_of)}"
+        if self.last_error:
+            text += f" · last refresh failed ({self.last_error})"
+        return text
+
+
+def _longer(a: str, b: str) -> bool:
+    from data_access import PERIOD_ORDER
+
+    a = "1y" if a == "ytd" else a
+    return PERIOD_ORDER.index(a) > PERIOD_ORDER.index(b)
+
+
+_refresher: Refresher | None = None
+_refresher_lock = threading.Lock()
+
+
+def live_data() -> Refresher:
+    """The running Refresher of this server process, started on first use."""
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            from tick_store import TickStore
+
+            _refresher = Refresher(ticks=TickStore())
+            atexit.register(_refresher.stop)
+        return _refresher.start()
@@ -0,0 +1,112 @@
+"""Coarser bars built locally from finer cached ones.
+
+Weekly and monthly bars come from daily bars, 2m-90m bars from 1-minute
+bars, so a page asking for another interval does not need another
+download while the base data is cached. Aggregation is the usual OHLCV
+one: first open, highest high, lowest low, last close, summed volume.
+
+Weekly bars are labelled with their Monday and monthly bars with the 1st,
+as yfinance does. Intraday buckets are anchored at the 09:15 IST open and
+never cross a session: the last bucket of a day is cut at 15:30 (60m gives
+09:15, 10:15, ... 15:15) and bars outside the session are dropped. Naive
+intraday timestamps are taken as IST.
+"""
+
+import numpy as np
+import pandas as pd
+
+from market import IST, MARKET_CLOSE, MARKET_OPEN
+
+# interval -> the finer cached interval it is built from
+RESAMPLE_BASE = {
+    "1wk": "1d",
+    "1mo": "1d",
+    "2m": "1m",
+    "5m": "1m",
+    "15m": "1m",
+    "30m": "1m",
+    "60m": "1m",
+    "90m": "1m",
+    "1h": "1m",
+}
+MINUTES = {"2m": 2, "5m": 5, "15m": 15, "30m": 30, "60m": 60, "90m": 90, "1h": 60}
+
+NS_PER_DAY = 86_400 * 10**9
+NS_PER_MIN = 60 * 10**9
+OPEN_MIN = MARKET_OPEN.hour * 60 + MARKET_OPEN.minute
+CLOSE_MIN = MARKET_CLOSE.hour * 60 + MARKET_CLOSE.minute
+
+
+def _wall_ns(index: pd.DatetimeIndex, intraday: bool) -> np.ndarray:
+    """Local wall-clock nanoseconds (IST for intraday bars)."""
+    if index.tz is not None:
+        index = (index.tz_convert(IST) if intraday else index).tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+def bucket_keys(index: pd.DatetimeIndex, interval: str) -> np.ndarray:
+    """Bar number of every row in ``interval``: rows sharing a key form one
+    bar, -1 marks intraday rows outside the session."""
+    intraday = interval in MINUTES
+    wall = _wall_ns(index, intraday)
+    days = wall // NS_PER_DAY
+    if interval == "1wk":
+        # 1970-01-01 was a Thursday; this is the day number of the Monday
+        return days - (days + 3) % 7
+    if interval == "1mo":
+        dates = wall.astype("datetime64[ns]").astype("datetime64[M]")
+        return dates.astype(np.int64)
+    if not intraday:
+        raise ValueError(f"Cannot resample to {interval}")
+    minute = (wall // NS_PER_MIN) % 1440 - OPEN_MIN
+    keys = days * 1440 + minute // MINUTES[interval]
+    return np.where((minute >= 0) & (minute < CLOSE_MIN - OPEN_MIN), keys, -1)
+
+
+def _labels(keys: np.ndarray, interval: str, tz) -> pd.DatetimeIndex:
+    if interval == "1wk":
+        ns = keys * NS_PER_DAY
+    elif interval == "1mo":
+        ns = keys.astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
+    else:
+        step = MINUTES[interval]
+        days, bucket = np.divmod(keys, 1440)
+        ns = days * NS_PER_DAY + (OPEN_MIN + bucket * step) * NS_PER_MIN
+        index = pd.DatetimeIndex(ns.astype("datetime64[ns]"))
+        # the keys are IST wall times, hand the labels back in the input's zone
+        return index.tz_localize(IST).tz_convert(tz) if tz is not None else index
+    index = pd.DatetimeIndex(ns.astype("datetime64[ns]"))
+    return index.tz_localize(tz) if tz is not None else index
+
+
+def resample_bars(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """``df``'s bars aggregated to ``interval`` (a key of RESAMPLE_BASE)."""
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    keys = bucket_keys(df.index, interval)
+    keep = (keys >= 0) & df["Close"].notna().to_numpy()
+    if not keep.all():
+        df, keys = df[keep], keys[keep]
+    if df.empty:
+        return df.iloc[:0]
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    cols = {}
+    for col in df.columns:
+        arr = df[col].to_numpy(dtype="float64")
+        if col == "Open":
+            cols[col] = arr[starts]
+        elif col == "High":
+            cols[col] = np.fmax.reduceat(arr, starts)
+        elif col == "Low":
+            cols[col] = np.fmin.reduceat(arr, starts)
+        elif col == "Volume":
+            cols[col] = np.add.reduceat(np.nan_to_num(arr), starts)
+        else:  # Close, Adj Close
+            cols[col] = arr[ends]
+    out = pd.DataFrame(cols, index=_labels(keys[starts], interval, df.index.tz))
+    if "Volume" in out and df["Volume"].dtype.kind in "iu":
+        out["Volume"] = out["Volume"].astype(df["Volume"].dtype)
+    out.index.name = df.index.name
+    return out
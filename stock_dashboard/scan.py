@@ -0,0 +1,120 @@
+"""Headless batch scanner: the dashboard's scanners over a universe, no UI.
+
+    python -m stock_dashboard.scan --universe nifty50 --out scans/
+    python stock_dashboard/scan.py --symbols RELIANCE,TCS --scans ranking,picks --format csv
+
+Writes one ``<scan>.parquet`` (or ``.csv``) per scanner. By default prices
+are the last daily close, which is what a nightly job after the close
+wants; ``--quotes live`` asks NSE instead.
+
+Starting up is cheap: this module imports only the standard library, and
+pandas, numpy and the dashboard modules load inside ``main`` once the
+arguments are known (yfinance / requests only on a network fetch).
+``IMPORT_BUDGET`` and ``STARTUP_BUDGET`` are checked by
+``benchmarks/bench_startup.py``.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# the dashboard modules import each other flat, as Streamlit runs them
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+SCAN_NAMES = ("ranking", "screener", "breakout", "alerts", "flow", "picks")
+IMPORT_BUDGET = 0.05  # seconds to import this module in a fresh interpreter
+STARTUP_BUDGET = 5.0  # seconds for a whole offline run over 50 symbols, process start to files written
+
+
+def _parse(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m stock_dashboard.scan", description=__doc__.split("\n")[0])
+    which = parser.add_mutually_exclusive_group(required=True)
+    which.add_argument("--universe", help="universe name (CSV stem in universes/) or path to a CSV")
+    which.add_argument("--symbols", help="comma separated NSE symbols")
+    parser.add_argument("--scans", default=",".join(SCAN_NAMES), help=f"comma separated, from {', '.join(SCAN_NAMES)}")
+    parser.add_argument("--out", default="scan_output", help="output directory")
+    parser.add_argument("--format", choices=("parquet", "csv"), default="parquet")
+    parser.add_argument("--quotes", choices=("close", "live"), default="close", help="price source for LTP")
+    parser.add_argument("--shard-size", type=int, default=100)
+    parser.add_argument("--synthetic", action="store_true", help="offline synthetic bars (smoke tests, startup budget)")
+    args = parser.parse_args(argv)
+    args.scans = [s.strip() for s in args.scans.split(",") if s.strip()]
+    unknown = set(args.scans) - set(SCAN_NAMES)
+    if unknown:
+        parser.error(f"unknown scans: {', '.join(sorted(unknown))}")
+    return args
+
+
+def _with_close_prices(fn):
+    """Run ``fn`` with each symbol's last daily close as its price."""
+
+    def shard(syms, hist, prices):
+        closes = {s: float(h["Close"].iloc[-1]) for s, h in hist.items() if h is not None and not h.empty}
+        return fn(syms, hist, closes)
+
+    return shard
+
+
+def _writable(df):
+    # "--" marks a missing value on the pages; Parquet needs one type per column
+    return df.replace("--", None).infer_objects()
+
+
+def main(argv: list[str] | None = None) -> int:
+    started = time.perf_counter()
+    args = _parse(argv)
+
+    from scanners import SCANNERS
+    from universe import load_universe, scan_universe
+
+    if args.universe:
+        symbols = load_universe(args.universe)
+    else:
+        symbols = list(dict.fromkeys(s.strip().upper() for s in args.symbols.split(",") if s.strip()))
+    if not symbols:
+        print("No symbols to scan.", file=sys.stderr)
+        return 1
+
+    if args.synthetic:
+        from benchmarks.synthetic import SyntheticSource
+
+        source = SyntheticSource()
+    else:
+        from data_access import shared_data
+
+        source = shared_data()
+
+    import pandas as pd
+
+    os.makedirs(args.out, exist_ok=True)
+    live = args.quotes == "live"
+    for name in args.scans:
+        scanner = SCANNERS[name]
+        fn = scanner.fn if live else _with_close_prices(scanner.fn)
+        t0 = time.perf_counter()
+        parts = []
+        for res in scan_universe(
+            symbols, fn, source, scanner.period, quotes=live, shard_size=args.shard_size
+        ):
+            parts.append(res.rows)
+            print(f"{name}: {res.done}/{res.total}", file=sys.stderr)
+        df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        if scanner.sort_by and scanner.sort_by in df.columns:
+            df = df.sort_values(scanner.sort_by, ascending=False, ignore_index=True)
+
+        path = os.path.join(args.out, f"{name}.{args.format}")
+        if args.format == "parquet":
+            _writable(df).to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+        print(f"{name}: {len(df)} rows -> {path} ({time.perf_counter() - t0:.1f}s)")
+
+    print(f"done in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
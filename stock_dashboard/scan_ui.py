@@ -0,0 +1,116 @@
+"""Sidebar watchlist / universe picker and the streaming scan runner the
+scanner pages share.
+
+A page writes its per-symbol logic once as ``scan_shard(symbols, history,
+prices) -> DataFrame``. ``run_scan`` calls it once on the watchlist from the
+refresher's store, or shard by shard over a universe with live progress,
+a partial table that fills in and a Stop button.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from core import DEFAULT_WATCHLIST
+from instrument import timed
+from universe import list_universes, load_universe, scan_universe
+
+
+def pick_symbols(label: str = "Watchlist") -> tuple[list[str], str | None]:
+    """Symbols to scan and the universe name (None for the typed watchlist)."""
+    universes = list_universes()
+    mode = "Watchlist"
+    if universes:
+        mode = st.sidebar.radio("Scan", ["Watchlist", "Universe"], horizontal=True)
+    if mode == "Universe":
+        name = st.sidebar.selectbox("Universe", list(universes))
+        syms = load_universe(universes[name])
+        st.sidebar.caption(f"{len(syms)} symbols")
+        return syms, name
+
+    wl_raw = st.sidebar.text_area(label, DEFAULT_WATCHLIST)
+    return [s.strip().upper() for s in wl_raw.split(",") if s.strip()], None
+
+
+def _sorted(df: pd.DataFrame, sort_by: str | None) -> pd.DataFrame:
+    if sort_by and sort_by in df.columns:
+        return df.sort_values(sort_by, ascending=False, ignore_index=True)
+    return df
+
+
+def run_scan(
+    key: str,
+    symbols: list[str],
+    universe: str | None,
+    scan_shard,
+    period: str = "6mo",
+    quotes: bool = True,
+    sort_by: str | None = None,
+) -> pd.DataFrame | None:
+    """``scan_shard`` over ``symbols``; None while a universe scan has not
+    been started yet.
+
+    Universe results are kept in session state, so they survive reruns and
+    a stopped scan still shows what it got through.
+    """
+    if universe is None:
+        from refresher import live_data
+
+        data = live_data()
+        with timed(f"page.{key}.fetch"):
+            hist = data.history(symbols, period, "1d")
+            prices = data.quotes(symbols) if quotes else {}
+        st.caption(data.as_of_text())
+        stale = [s for s, p in prices.items() if getattr(p, "stale", False)]
+        if stale:
+            st.warning(f"NSE is not answering; last known prices for {', '.join(stale)}.")
+        with timed(f"page.{key}.compute"):
+            return scan_shard(symbols, hist, prices)
+
+    scans = st.session_state.setdefault("scans", {})
+    sig = (universe, tuple(symbols), period)
+    prev = scans.get(key)
+    if prev is not None and prev["sig"] != sig:
+        prev = None
+
+    col1, col2, _ = st.columns([1, 1, 4])
+    start = col1.button("▶ Start scan", key=f"{key}_start")
+    # any click reruns the page, which interrupts a running scan
+    col2.button("■ Stop", key=f"{key}_stop")
+
+    if not start:
+        if prev is None:
+            st.info(f"{universe}: {len(symbols)} symbols. Press Start to scan.")
+            return None
+        note = "" if prev["finished"] else " (stopped)"
+        st.caption(f"{universe}: scanned {prev['done']}/{prev['total']} symbols{note} in {prev['elapsed']:.0f}s")
+        return prev["rows"] if prev["done"] else None
+
+    entry = scans[key] = {
+        "sig": sig,
+        "rows": pd.DataFrame(),
+        "done": 0,
+        "total": len(symbols),
+        "elapsed": 0.0,
+        "finished": False,
+    }
+    def timed_shard(syms, hist, prices):
+        with timed(f"page.{key}.compute"):
+            return scan_shard(syms, hist, prices)
+
+    progress = st.progress(0.0, text=f"Scanning {len(symbols)} symbols...")
+    table = st.empty()
+    parts = []
+    for res in scan_universe(symbols, timed_shard, period=period, quotes=quotes):
+        parts.append(res.rows)
+        entry.update(
+            rows=_sorted(pd.concat(parts, ignore_index=True), sort_by),
+            done=res.done,
+            elapsed=res.elapsed,
+        )
+        progress.progress(res.done / res.total, text=f"{res.done}/{res.total} symbols · {res.elapsed:.0f}s")
+        table.dataframe(entry["rows"], use_container_width=True)
+    entry["finished"] = True
+    progress.empty()
+    table.empty()
+    st.caption(f"{universe}: scanned {entry['done']} symbols in {entry['elapsed']:.0f}s")
+    return entry["rows"]
@@ -0,0 +1,254 @@
+"""Scanner logic shared by the Streamlit pages and the batch CLI.
+
+Every scanner is a shard function ``fn(symbols, history, prices) ->
+DataFrame``. It turns one shard's daily bars and live prices into result
+rows and has no UI code, so a page can render the rows and ``scan.py`` can
+write them out. ``SCANNERS`` lists them with the history period each one
+reads and the column its results are ranked by.
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from alert_rules import DEFAULT_RULES, compile_rule, evaluate_rules, parse_rules
+from core import (
+    DEFAULT_SPEC,
+    build_panel,
+    compute_snapshot,
+    detect_breakout,
+    indicator_panel,
+    rank_panel,
+    slice_period,
+)
+from panel import Panel
+
+
+# ------------------ RANKING ------------------
+
+
+def rank_shard(syms: list[str], hist: dict, prices: dict) -> pd.DataFrame:
+    ok = {sym: hist[sym] for sym in syms if hist.get(sym) is not None and prices.get(sym) is not None}
+
+    rankings = []
+    if ok:
+        ind = indicator_panel(build_panel(ok, "Close"), build_panel(ok, "Volume"))
+        rankings.append(rank_panel(ind, {sym: prices[sym] for sym in ok}))
+
+    errors = [
+        {
+            "Symbol": sym,
+            "LTP": None,
+            "Score": 0,
+            "Grade": "Data Error",
+            "RSI": None,
+            "RelVol": None,
+        }
+        for sym in syms
+        if sym not in ok
+    ]
+    if errors:
+        rankings.append(pd.DataFrame(errors))
+
+    if not rankings:
+        return pd.DataFrame(columns=["Symbol", "Score", "Grade"])
+    return pd.concat(rankings, ignore_index=True)
+
+
+# ------------------ SCREENER ------------------
+
+TREND_COLS = ["Symbol", "Price", "SMA5>SMA20", "View"]
+
+
+def screen_shard(syms: list[str], hist6: dict, prices: dict) -> pd.DataFrame:
+    """Trend row per symbol (last 3 months) plus the swing-pick columns
+    (last 6 months) for the symbols that qualify."""
+    rows = []
+
+    for sym in syms:
+        lp = prices.get(sym)
+        h = hist6.get(sym)
+
+        if lp is None or h is None:
+            rows.append({"Symbol": sym, "Price": "--", "SMA5>SMA20": "--", "View": "Data Error"})
+            continue
+
+        snap = compute_snapshot(slice_period(h, "3mo"), DEFAULT_SPEC, sym)
+        s5 = snap.sma[5]
+        s20 = snap.sma[20]
+
+        if s5 is not None and s20 is not None:
+            if s5 > s20:
+                stat = "Yes"
+                view = "Bullish"
+            elif s5 < s20:
+                stat = "No"
+                view = "Bearish"
+            else:
+                stat = "Equal"
+                view = "Sideways"
+        else:
+            stat = "--"
+            view = "Weak / Insufficient"
+
+        rows.append(
+            {
+                "Symbol": sym,
+                "Price": round(lp, 2),
+                "SMA5>SMA20": stat,
+                "View": view,
+            }
+        )
+
+    df = pd.DataFrame(rows, columns=TREND_COLS)
+    df["Swing"] = False
+    df["RSI14"] = None
+
+    ok = {sym: hist6[sym] for sym in syms if hist6.get(sym) is not None and prices.get(sym) is not None}
+    if ok:
+        ind = indicator_panel(build_panel(ok, "Close"))
+
+        cond_sma = ind["sma5"] > ind["sma20"]
+        cond_rsi = ind["rsi14"].between(45, 60)
+        cond_macd = ind["macd"] > ind["signal"]
+
+        swing = ind[cond_sma & cond_rsi & cond_macd]
+        hit = df["Symbol"].isin(swing.index)
+        df.loc[hit, "Swing"] = True
+        df.loc[hit, "RSI14"] = swing["rsi14"].round(2).reindex(df.loc[hit, "Symbol"]).to_numpy()
+    return df
+
+
+# ------------------ BREAKOUT ------------------
+
+
+def breakout_shard(syms: list[str], hist: dict, prices: dict) -> pd.DataFrame:
+    rows = []
+    for sym in syms:
+        live = prices.get(sym)
+        h = hist.get(sym)
+
+        if live is None or h is None:
+            rows.append({"Symbol": sym, "Price": "--", "Breakout Status": "Data Error"})
+            continue
+
+        status = detect_breakout(h)
+        rows.append({"Symbol": sym, "Price": round(live, 2), "Breakout Status": status})
+    return pd.DataFrame(rows)
+
+
+# ------------------ ALERTS ------------------
+
+
+def alerts_shard(syms: list[str], hist: dict, prices: dict) -> pd.DataFrame:
+    """DEFAULT_RULES that hold on each symbol's latest bar (crosses only on
+    the bar they happen); the Alerts page adds edge-triggered state on top."""
+    rules, _ = parse_rules(DEFAULT_RULES)
+    ok = {sym: hist[sym] for sym in syms if hist.get(sym) is not None and prices.get(sym) is not None}
+    names, hits = evaluate_rules([compile_rule(r.expr) for r in rules], ok, prices)
+
+    alerts = []
+    for j, sym in enumerate(names):
+        note_list = [rules[i].name for i in np.flatnonzero(hits[:, j])]
+        if note_list:
+            alerts.append(
+                {
+                    "Symbol": sym,
+                    "Price": round(prices[sym], 2),
+                    "Alerts": " | ".join(note_list),
+                }
+            )
+    return pd.DataFrame(alerts)
+
+
+# ------------------ TOMORROW PICKS ------------------
+
+
+def picks_shard(syms: list[str], hist_all: dict, prices: dict) -> pd.DataFrame:
+    picks = []
+    for sname in syms:
+        live = prices.get(sname)
+        hist = hist_all.get(sname)
+
+        if live is None or hist is None:
+            continue
+
+        snap  = compute_snapshot(hist, DEFAULT_SPEC, sname)
+        rsi   = snap.rsi
+        s5    = snap.sma[5]
+        s20   = snap.sma[20]
+        mac, sig = snap.macd, snap.signal
+
+        if any(v is None for v in [rsi, s5, s20, mac, sig]):
+            continue
+
+        # Conditions
+        cond_trend = s5 > s20           # uptrend
+        cond_rsi_good = 45 <= rsi <= 65 # thoda wide range
+        cond_macd = mac > sig           # momentum
+
+        # Score system instead of strict AND
+        score = 0
+        if cond_trend:
+            score += 40
+        if cond_rsi_good:
+            score += 30
+        if cond_macd:
+            score += 30
+
+        # 50+ ko hi pick karo (you can adjust)
+        if score >= 50:
+            picks.append({
+                "Symbol": sname,
+                "LTP": round(live, 2),
+                "RSI(14)": round(rsi, 2),
+                "SMA5>SMA20": "Yes" if cond_trend else "No",
+                "MACD>Signal": "Yes" if cond_macd else "No",
+                "Score": score,
+            })
+    return pd.DataFrame(picks)
+
+
+# ------------------ FLOW ------------------
+
+
+def flow_shard(syms: list[str], hist: dict, prices: dict, primary: int | None = None) -> pd.DataFrame:
+    """``flow.flow_summary`` rows for the shard; prices are not used."""
+    from flow import DEFAULT_LOOKBACKS, flow_summary
+
+    ok = {sym: hist[sym] for sym in syms if hist.get(sym) is not None}
+    rows = [{"Symbol": sym, "Flow": "No data"} for sym in syms if sym not in ok]
+    if ok:
+        panel = Panel.from_frames(ok, ("Close", "Volume", "High", "Low"))
+        summary = flow_summary(
+            panel.frame("Close"),
+            panel.frame("Volume"),
+            panel.frame("High"),
+            panel.frame("Low"),
+            DEFAULT_LOOKBACKS,
+            primary=primary,
+        )
+        rows = summary.reset_index().round(2).to_dict("records") + rows
+    return pd.DataFrame(rows)
+
+
+# ------------------ REGISTRY ------------------
+
+
+@dataclass(frozen=True)
+class Scanner:
+    fn: Callable[[list[str], dict, dict], pd.DataFrame]
+    period: str  # daily history the scanner reads
+    sort_by: str | None = None
+
+
+SCANNERS = {
+    "ranking": Scanner(rank_shard, "6mo", "Score"),
+    "screener": Scanner(screen_shard, "6mo"),
+    "breakout": Scanner(breakout_shard, "6mo"),
+    "alerts": Scanner(alerts_shard, "6mo"),
+    "flow": Scanner(flow_shard, "3mo"),
+    "picks": Scanner(picks_shard, "6mo", "Score"),
+}
@@ -0,0 +1,288 @@
+"""O(1) streaming versions of the core indicators for the live tick feed.
+
+Every indicator is seeded once from the daily history and then moved along
+in constant time:
+
+- ``update(x)`` commits ``x`` as a new bar and returns the new value,
+- ``preview(x)`` returns the value as if the current bar closed at ``x``
+  without committing it, which is what a live tick inside the session is.
+
+Values are None until the same number of bars the batch functions in
+``core`` need, and otherwise match them to floating-point tolerance.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+class StreamingSMA:
+    """Simple moving average over a fixed ring buffer."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._buf = np.zeros(window)
+        self._pos = 0
+        self._count = 0
+        self._total = 0.0
+
+    @classmethod
+    def from_series(cls, series, window: int) -> "StreamingSMA":
+        ind = cls(window)
+        for x in np.asarray(series, dtype="float64"):
+            ind.update(x)
+        return ind
+
+    def _next_total(self, x: float) -> float:
+        oldest = self._buf[self._pos] if self._count >= self.window else 0.0
+        return self._total - oldest + x
+
+    def preview(self, x: float) -> float | None:
+        if self._count + 1 < self.window:
+            return None
+        return self._next_total(x) / self.window
+
+    def update(self, x: float) -> float | None:
+        self._total = self._next_total(x)
+        self._buf[self._pos] = x
+        self._pos = (self._pos + 1) % self.window
+        self._count += 1
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        if self._count < self.window:
+            return None
+        return self._total / self.window
+
+
+class StreamingEMA:
+    """ewm(span=window, adjust=False), valid once ``window`` bars were seen."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.alpha = 2.0 / (window + 1)
+        self._ema: float | None = None
+        self._count = 0
+
+    @classmethod
+    def from_series(cls, series, window: int) -> "StreamingEMA":
+        ind = cls(window)
+        for x in np.asarray(series, dtype="float64"):
+            ind.update(x)
+        return ind
+
+    def _next(self, x: float) -> float:
+        if self._ema is None:
+            return x
+        return self.alpha * x + (1 - self.alpha) * self._ema
+
+    def preview(self, x: float) -> float | None:
+        if self._count + 1 < self.window:
+            return None
+        return self._next(x)
+
+    def update(self, x: float) -> float | None:
+        self._ema = self._next(x)
+        self._count += 1
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        if self._count < self.window:
+            return None
+        return self._ema
+
+
+class StreamingRSI:
+    """Wilder RSI, seeded with the mean of the first ``period`` moves."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._prev: float | None = None
+        self._moves = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    @classmethod
+    def from_series(cls, series, period: int = 14) -> "StreamingRSI":
+        ind = cls(period)
+        for x in np.asarray(series, dtype="float64"):
+            ind.update(x)
+        return ind
+
+    def _next(self, x: float) -> tuple[int, float, float]:
+        if self._prev is None:
+            return 0, 0.0, 0.0
+        delta = x - self._prev
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
+        moves = self._moves + 1
+        p = self.period
+        if moves <= p:
+            return moves, self._avg_gain + gain / p, self._avg_loss + loss / p
+        return (
+            moves,
+            (self._avg_gain * (p - 1) + gain) / p,
+            (self._avg_loss * (p - 1) + loss) / p,
+        )
+
+    def _rsi(self, moves: int, avg_gain: float, avg_loss: float) -> float | None:
+        if moves < self.period:
+            return None
+        if avg_loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+    def preview(self, x: float) -> float | None:
+        return self._rsi(*self._next(x))
+
+    def update(self, x: float) -> float | None:
+        self._moves, self._avg_gain, self._avg_loss = self._next(x)
+        self._prev = x
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        return self._rsi(self._moves, self._avg_gain, self._avg_loss)
+
+
+class StreamingMACD:
+    """MACD(12, 26) line and 9-period signal, valid after 35 bars."""
+
+    WARMUP = 35
+
+    def __init__(self):
+        self._fast = StreamingEMA(12)
+        self._slow = StreamingEMA(26)
+        self._signal = StreamingEMA(9)
+        self._count = 0
+
+    @classmethod
+    def from_series(cls, series) -> "StreamingMACD":
+        ind = cls()
+        for x in np.asarray(series, dtype="float64"):
+            ind.update(x)
+        return ind
+
+    def preview(self, x: float) -> tuple[float | None, float | None]:
+        if self._count + 1 < self.WARMUP:
+            return None, None
+        macd = self._fast._next(x) - self._slow._next(x)
+        return macd, self._signal._next(macd)
+
+    def update(self, x: float) -> tuple[float | None, float | None]:
+        self._fast.update(x)
+        self._slow.update(x)
+        self._signal.update(self._fast._ema - self._slow._ema)
+        self._count += 1
+        return self.value
+
+    @property
+    def value(self) -> tuple[float | None, float | None]:
+        if self._count < self.WARMUP:
+            return None, None
+        return self._fast._ema - self._slow._ema, self._signal._ema
+
+
+class RollingMinMax:
+    """Rolling support (min) / resistance (max) with monotonic deques."""
+
+    def __init__(self, window: int = 30):
+        self.window = window
+        self._n = 0
+        self._mins: deque = deque()  # (index, value), values increasing
+        self._maxs: deque = deque()  # (index, value), values decreasing
+
+    @classmethod
+    def from_series(cls, series, window: int = 30) -> "RollingMinMax":
+        ind = cls(window)
+        for x in np.asarray(series, dtype="float64"):
+            ind.update(x)
+        return ind
+
+    def _survivor(self, dq: deque) -> float | None:
+        # extreme of the bars that stay in the window once one more is added
+        first_kept = self._n + 1 - self.window
+        for i, value in dq:
+            if i >= first_kept:
+                return value
+        return None
+
+    def preview(self, x: float) -> tuple[float | None, float | None]:
+        if self._n + 1 < self.window:
+            return None, None
+        lo = self._survivor(self._mins)
+        hi = self._survivor(self._maxs)
+        return (x if lo is None else min(lo, x)), (x if hi is None else max(hi, x))
+
+    def update(self, x: float) -> tuple[float | None, float | None]:
+        i = self._n
+        while self._mins and self._mins[-1][1] >= x:
+            self._mins.pop()
+        self._mins.append((i, x))
+        while self._maxs and self._maxs[-1][1] <= x:
+            self._maxs.pop()
+        self._maxs.append((i, x))
+
+        self._n += 1
+        first_kept = self._n - self.window
+        while self._mins[0][0] < first_kept:
+            self._mins.popleft()
+        while self._maxs[0][0] < first_kept:
+            self._maxs.popleft()
+        return self.value
+
+    @property
+    def value(self) -> tuple[float | None, float | None]:
+        if self._n < self.window:
+            return None, None
+        return self._mins[0][1], self._maxs[0][1]
+
+
+class TickBuffer:
+    """Last ``capacity`` (timestamp, price) ticks in two fixed NumPy arrays.
+
+    Appending past capacity overwrites the oldest tick, so memory stays
+    constant however long the session runs. Ticks must arrive in time
+    order; one not newer than the last is dropped (a quote the feed has
+    already delivered).
+    """
+
+    def __init__(self, capacity: int = 2048):
+        self.capacity = capacity
+        self._ts = np.zeros(capacity)
+        self._px = np.zeros(capacity)
+        self._pos = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def last_ts(self) -> float | None:
+        return float(self._ts[self._pos - 1]) if self._count else None
+
+    def append(self, ts: float, price: float) -> bool:
+        if self._count and ts <= self._ts[self._pos - 1]:
+            return False
+        self._ts[self._pos] = ts
+        self._px[self._pos] = price
+        self._pos = (self._pos + 1) % self.capacity
+        self._count += 1
+        return True
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """(timestamps, prices), oldest first."""
+        if self._count <= self.capacity:
+            return self._ts[: self._count].copy(), self._px[: self._count].copy()
+        order = np.r_[self._pos : self.capacity, 0 : self._pos]
+        return self._ts[order], self._px[order]
+
+    def series(self, tz: str = "Asia/Kolkata"):
+        """Prices as a pandas Series on a tz-aware DatetimeIndex."""
+        import pandas as pd
+
+        ts, px = self.arrays()
+        index = pd.to_datetime(ts, unit="s", utc=True).tz_convert(tz)
+        return pd.Series(px, index=index, name="LTP")
@@ -0,0 +1,101 @@
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import core  # noqa: E402
+
+
+def make_bars(n: int = 300, end=None, seed: int = 0) -> pd.DataFrame:
+    """Daily OHLCV bars in yfinance's column layout, ending today by default."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=end or pd.Timestamp.now().normalize(), periods=n)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": rng.integers(100_000, 1_000_000, n),
+        },
+        index=index,
+    )
+
+
+class FakeYF:
+    """Stands in for ``yf.download``: serves ``bars`` per ticker and records
+    every call with the bytes it returned."""
+
+    def __init__(self, bars: dict[str, pd.DataFrame], fail: set[str] = frozenset()):
+        self.bars = bars
+        self.fail = fail
+        self.calls: list[dict] = []
+        self.bytes = 0
+
+    def __call__(self, tickers, **kwargs):
+        self.calls.append({"tickers": list(tickers), **kwargs})
+        syms = [t.removesuffix(".NS") for t in tickers]
+        if any(s in self.fail for s in syms):
+            raise ConnectionError("upstream failed")
+        frames = {}
+        for sym in syms:
+            df = self.bars.get(sym)
+            if df is None:
+                continue
+            if "start" in kwargs:
+                df = df[df.index >= pd.Timestamp(kwargs["start"]).tz_localize(None)]
+            else:
+                df = core.slice_period(df, kwargs["period"])
+            frames[sym + ".NS"] = df
+        if not frames:
+            return pd.DataFrame()
+        raw = pd.concat(frames, axis=1)
+        self.bytes += int(raw.memory_usage(deep=False).sum())
+        return raw
+
+
+class StubLoaders:
+    """History / quote loaders that count the symbols asked for and take
+    long enough for concurrent callers to overlap."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.history_calls: Counter = Counter()
+        self.quote_calls: Counter = Counter()
+        self.periods: list[str] = []
+        self._lock = threading.Lock()
+
+    def history(self, symbols, period, interval):
+        with self._lock:
+            self.history_calls.update((s, interval) for s in symbols)
+            self.periods.append(period)
+        time.sleep(self.delay)
+        return {s: make_bars(260, seed=len(s)) for s in symbols}
+
+    def quotes(self, symbols):
+        with self._lock:
+            self.quote_calls.update(symbols)
+        time.sleep(self.delay)
+        return {s: 100.0 for s in symbols}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def fake_yf(cache_dir, monkeypatch):
+    fake = FakeYF({sym: make_bars(seed=i) for i, sym in enumerate(["RELIANCE", "TCS", "SBIN"])})
+    monkeypatch.setattr(core, "_download", fake)
+    return fake
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alert_rules import AlertEngine, Rule, _ema_last, _rsi_last, compile_rule, parse_rules
+from conftest import make_bars
+from core import _wilder_rsi_2d, ema_2d, rsi_series
+
+
+def test_parse_rules_reports_bad_lines():
+    rules, errors = parse_rules("Oversold: rsi14 < 30\nBad: rsi < 30\n# comment\n")
+
+    assert rules == [Rule("Oversold", "rsi14 < 30")]
+    assert len(errors) == 1 and errors[0].startswith("line 2")
+
+
+def test_alerts_fire_once_and_on_volume_revision():
+    df = make_bars(60)
+    engine = AlertEngine([Rule("Volume spike", "rel_vol > 3")])
+    price = {"TCS": float(df["Close"].iloc[-1])}
+
+    assert engine.evaluate(["TCS"], {"TCS": df}, price).empty
+    # same frame, same price: nothing to re-evaluate
+    assert engine.evaluate(["TCS"], {"TCS": df}, price).empty
+
+    spiked = df.copy()
+    spiked.iloc[-1, spiked.columns.get_loc("Volume")] *= 10
+    fired = engine.evaluate(["TCS"], {"TCS": spiked}, price)
+    assert len(fired) == 1
+
+    assert engine.evaluate(["TCS"], {"TCS": spiked.copy()}, price).empty
+
+
+def test_compiled_rule_lists_its_features():
+    rule = compile_rule("sma5 crosses_above sma20 and (rel_vol > 1.5 or price > resistance)")
+
+    assert rule.features == {"sma5", "sma20", "rel_vol", "price", "resistance"}
+
+
+def test_crosses_fire_on_the_crossing_bar_only():
+    # down 30 bars, up 30, down 30: sma5 crosses sma20 once each way
+    steps = np.r_[np.full(30, -1.0), np.full(30, 1.0), np.full(30, -1.0)]
+    df = make_bars(90)
+    df["Close"] = 100 + np.cumsum(steps)
+    fast, slow = df["Close"].rolling(5).mean(), df["Close"].rolling(20).mean()
+    above = (fast > slow) & (fast.shift() <= slow.shift())
+    below = (fast < slow) & (fast.shift() >= slow.shift())
+    assert above.sum() == 1 and below.sum() == 1
+
+    engine = AlertEngine([Rule("Up", "sma5 crosses_above sma20"), Rule("Down", "sma5 crosses_below sma20")])
+    fired = {"Up": [], "Down": []}
+    for n in range(21, len(df) + 1):
+        for alert in engine.evaluate(["TCS"], {"TCS": df.iloc[:n]}, {})["Alert"]:
+            fired[alert].append(n - 1)
+
+    assert fired == {"Up": [int(np.flatnonzero(above)[0])], "Down": [int(np.flatnonzero(below)[0])]}
+
+
+@pytest.fixture
+def ragged_closes():
+    """Right-aligned (bars, symbols) closes with 0, 40 and 250 leading NaNs;
+    the last symbol has fewer bars than the RSI period."""
+    arr = np.full((260, 3), np.nan)
+    for j, lead in enumerate((0, 40, 250)):
+        arr[lead:, j] = make_bars(260 - lead, seed=j)["Close"].to_numpy()
+    return arr
+
+
+@pytest.mark.parametrize("span", [5, 12, 26])
+def test_ema_last_matches_core(ragged_closes, span):
+    expected = ema_2d(ragged_closes, span)[-1]
+    np.testing.assert_allclose(_ema_last(ragged_closes, span), expected, rtol=1e-9)
+    for j in range(ragged_closes.shape[1]):
+        col = ragged_closes[:, j]
+        series = pd.Series(col[~np.isnan(col)])
+        assert _ema_last(ragged_closes, span)[j] == pytest.approx(series.ewm(span=span, adjust=False).mean().iloc[-1])
+
+
+@pytest.mark.parametrize("period", [3, 14])
+def test_rsi_last_matches_core(ragged_closes, period):
+    got = _rsi_last(ragged_closes, period)
+
+    np.testing.assert_allclose(got, _wilder_rsi_2d(ragged_closes, period)[-1], rtol=1e-9)
+    for j in range(ragged_closes.shape[1]):
+        col = ragged_closes[:, j]
+        expected = rsi_series(pd.Series(col[~np.isnan(col)]), period).iloc[-1]
+        assert (np.isnan(got[j]) and np.isnan(expected)) or got[j] == pytest.approx(expected)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from conftest import make_bars
+from core import sma_crossover_backtest, sma_crossover_sweep
+
+PAIRS = [(5, 20), (20, 50), (50, 20), (12, 200), (40, 210), (40, 211)]  # 220 bars: 210 is the longest
+
+
+@pytest.fixture(scope="module")
+def sweep_and_bars():
+    df = make_bars(220, seed=8)
+    fast = sorted({f for f, _ in PAIRS})
+    slow = sorted({s for _, s in PAIRS})
+    return df, sma_crossover_sweep(df, fast, slow).set_index(["fast", "slow"])
+
+
+@pytest.mark.parametrize("fast, slow", PAIRS)
+def test_sweep_row_matches_single_backtest(sweep_and_bars, fast, slow):
+    df, sweep = sweep_and_bars
+    row = sweep.loc[(fast, slow)]
+
+    single = sma_crossover_backtest(df, fast, slow)
+
+    if single is None:  # fewer than max(fast, slow) + 10 candles
+        assert np.isnan(row["strategy_return_pct"]) and np.isnan(row["buy_hold_return_pct"])
+        assert row["trades"] == 0
+        return
+    assert row["strategy_return_pct"] == pytest.approx(single["strategy_return_pct"], rel=1e-9, abs=1e-9)
+    assert row["buy_hold_return_pct"] == pytest.approx(single["buy_hold_return_pct"], rel=1e-9, abs=1e-9)
+    entries = single["data"]["position"].diff().fillna(single["data"]["position"]) > 0
+    assert row["trades"] == entries.sum()
@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import StubLoaders, make_bars
+from data_access import DataAccess
+
+
+def _hub(stub: StubLoaders) -> DataAccess:
+    return DataAccess(loader=stub.history, quote_loader=stub.quotes, ttl=60)
+
+
+def test_overlapping_periods_fetch_once():
+    stub = StubLoaders(delay=0)
+    hub = _hub(stub)
+
+    three = hub.history(["TCS", "SBIN"], "3mo")
+    six = hub.history(["SBIN", "INFY"], "6mo")
+    year = hub.history(["TCS"], "1y")
+
+    assert stub.history_calls == Counter({("TCS", "1d"): 1, ("SBIN", "1d"): 1, ("INFY", "1d"): 1})
+    assert set(stub.periods) == {"1y"}
+    assert len(three["TCS"]) < len(six["SBIN"]) < len(year["TCS"])
+    assert hub.fetch_counts == Counter({("hist", s, "1d"): 1 for s in ("TCS", "SBIN", "INFY")})
+
+
+def test_concurrent_callers_share_one_fetch_per_key():
+    stub = StubLoaders()
+    hub = _hub(stub)
+    requests = [
+        ("history", ["TCS", "SBIN"], "3mo"),
+        ("history", ["SBIN", "INFY"], "6mo"),
+        ("history", ["TCS", "INFY", "SBIN"], "1y"),
+        ("quotes", ["TCS", "SBIN"], None),
+        ("quotes", ["SBIN", "INFY"], None),
+    ] * 4
+
+    def run(req):
+        kind, syms, period = req
+        return hub.history(syms, period) if kind == "history" else hub.quotes(syms)
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        results = list(pool.map(run, requests))
+
+    syms = ("TCS", "SBIN", "INFY")
+    assert all(v is not None for res in results for v in res.values())
+    assert stub.history_calls == Counter({(s, "1d"): 1 for s in syms})
+    assert stub.quote_calls == Counter({s: 1 for s in syms})
+    assert hub.fetch_counts == Counter(
+        {**{("hist", s, "1d"): 1 for s in syms}, **{("quote", s): 1 for s in syms}}
+    )
+    assert hub.total_fetches == 6
+    assert hub.stats()["coalesced"] > 0
+
+
+def test_intervals_are_separate_keys():
+    stub = StubLoaders(delay=0)
+    hub = _hub(stub)
+
+    hub.history(["TCS"], "6mo", "1d")
+    hub.history(["TCS"], "5d", "15m")
+
+    assert hub.fetch_counts == Counter({("hist", "TCS", "1d"): 1, ("hist", "TCS", "15m"): 1})
+
+
+def test_failed_fetch_is_retried_soon(monkeypatch):
+    stub = StubLoaders(delay=0)
+    fail = {"on": True}
+
+    def flaky_history(symbols, period, interval):
+        if fail["on"]:
+            raise ConnectionError("upstream down")
+        return stub.history(symbols, period, interval)
+
+    def flaky_quotes(symbols):
+        return {} if fail["on"] else stub.quotes(symbols)
+
+    hub = DataAccess(loader=flaky_history, quote_loader=flaky_quotes)  # market-calendar expiry
+    before = time.time()
+    assert hub.history(["TCS"], "6mo") == {"TCS": None}
+    assert hub.quotes(["TCS"]) == {"TCS": None}
+    for entry in hub._entries.values():
+        assert entry.expires <= before + 60
+
+    monkeypatch.setattr("data_access.RETRY_TTL", 0)
+    hub.history(["SBIN"], "6mo")
+    hub.quotes(["SBIN"])
+    fail["on"] = False
+
+    assert hub.history(["SBIN"], "6mo")["SBIN"] is not None
+    assert hub.quotes(["SBIN"])["SBIN"] == 100.0
+
+
+def test_waiter_needing_a_wider_period_fetches_it_again():
+    started, go = threading.Event(), threading.Event()
+    periods = []
+
+    def loader(symbols, period, interval):
+        periods.append(period)
+        if period == "1y":
+            started.set()
+            go.wait(5)
+        return {s: make_bars({"1y": 250, "5y": 1250}[period]) for s in symbols}
+
+    hub = DataAccess(loader=loader, quote_loader=StubLoaders().quotes, ttl=60)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        year = pool.submit(hub.history, ["TCS"], "1y")
+        started.wait(5)
+        five = pool.submit(hub.history, ["TCS"], "5y")
+        while hub.stats()["coalesced"] == 0:
+            time.sleep(0.005)
+        go.set()
+        year, five = year.result(), five.result()
+
+    assert periods == ["1y", "5y"]
+    assert len(year["TCS"]) <= 250 < len(five["TCS"])
+
+
+def test_results_survive_eviction_of_their_own_entries():
+    stub = StubLoaders(delay=0)
+    hub = DataAccess(loader=stub.history, quote_loader=stub.quotes, ttl=60, max_bytes=1)
+
+    bars = hub.history(["TCS", "SBIN", "INFY"], "6mo")
+    prices = hub.quotes(["TCS", "SBIN", "INFY"])
+
+    assert hub.stats()["evictions"] > 0
+    assert all(df is not None for df in bars.values())
+    assert prices == {"TCS": 100.0, "SBIN": 100.0, "INFY": 100.0}
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import make_bars
+from flow import flow_summary
+from scanners import flow_shard
+
+
+@pytest.fixture
+def panel():
+    """30 days: one symbol only rises, one only falls, one alternates with
+    more volume on the up days and one has 5 candles."""
+    dates = pd.bdate_range("2024-01-01", periods=30)
+    steps = np.arange(30.0)
+    close = pd.DataFrame(
+        {
+            "UP": 100 + steps,
+            "DOWN": 200 - steps,
+            "MIXED": 100 + np.where(steps % 2 == 0, 1.0, 0.0),
+            "SHORT": np.where(steps >= 25, 50 + steps, np.nan),
+        },
+        index=dates,
+    )
+    volume = pd.DataFrame(1000.0, index=dates, columns=close.columns)
+    volume.loc[:, "MIXED"] = np.where(steps % 2 == 0, 1200.0, 1000.0)  # up days trade 1200
+    return close, volume
+
+
+def test_flow_summary_labels_and_ratios(panel):
+    close, volume = panel
+
+    out = flow_summary(close, volume, lookbacks=(10, 20))
+
+    assert list(out.index) == ["UP", "DOWN", "MIXED", "SHORT"]
+    assert out.loc["UP", "Flow"].startswith("Strong Accumulation")
+    assert out.loc["DOWN", "Flow"].startswith("Strong Distribution")
+    assert out.loc["MIXED", "Flow"] == "Mixed / Neutral"
+    assert out.loc["SHORT", "Flow"] == "Too few candles"
+
+    assert out.loc["UP", "up_down_10"] == np.inf
+    assert out.loc["DOWN", "up_down_20"] == 0
+    assert out.loc["MIXED", "up_down_10"] == pytest.approx(1.2)  # 5 x 1200 up vs 5 x 1000 down
+    assert np.isnan(out.loc["SHORT", "up_down_10"])
+    assert out.loc["UP", "obv_chg_10"] == 10 * 1000
+    assert out.loc["DOWN", "obv_chg_10"] == -10 * 1000
+
+
+def test_flow_shard_marks_missing_history():
+    hist = {"TCS": make_bars(60), "SBIN": None}
+
+    rows = flow_shard(["TCS", "SBIN"], hist, {}).set_index("Symbol")
+
+    assert rows.loc["SBIN", "Flow"] == "No data"
+    assert rows.loc["TCS", "Flow"] != "No data"
@@ -0,0 +1,101 @@
+import os
+import time
+
+import pandas as pd
+
+import core
+
+SYMS = ["RELIANCE", "TCS", "SBIN"]
+
+
+def _age_cache(cache_dir, days: int = 10) -> None:
+    # old enough that the market has opened since, so every file is stale
+    past = time.time() - days * 86_400
+    for path in cache_dir.iterdir():
+        os.utime(path, (past, past))
+
+
+def test_cold_load_is_one_call(fake_yf):
+    out = core.get_history_batch(SYMS, "6mo")
+
+    assert len(fake_yf.calls) == 1
+    assert fake_yf.calls[0]["period"] == "6mo"
+    assert all(out[s] is not None and not out[s].empty for s in SYMS)
+    assert fake_yf.bytes > 0
+
+
+def test_warm_load_makes_no_calls(fake_yf):
+    core.get_history_batch(SYMS, "6mo")
+    cold_bytes = fake_yf.bytes
+
+    out = core.get_history_batch(SYMS, "6mo")
+    narrower = core.get_history("TCS", "3mo")
+
+    assert len(fake_yf.calls) == 1
+    assert fake_yf.bytes == cold_bytes
+    assert out["TCS"].index[0] >= core._period_start("6mo", out["TCS"].index)
+    assert len(narrower) < len(out["TCS"])
+
+
+def test_stale_cache_tops_up_with_start_only(fake_yf, cache_dir):
+    core.get_history_batch(SYMS, "6mo")
+    cold_bytes = fake_yf.bytes
+    last = core.get_history("RELIANCE", "6mo").index[-1]
+    _age_cache(cache_dir)
+
+    core.get_history_batch(SYMS, "6mo")
+
+    top_up = fake_yf.calls[1]
+    assert len(fake_yf.calls) == 2
+    assert "period" not in top_up
+    assert pd.Timestamp(top_up["start"]) == last
+    assert sorted(t.removesuffix(".NS") for t in top_up["tickers"]) == sorted(SYMS)
+    # a top-up only moves the bars from the last cached one on
+    assert fake_yf.bytes - cold_bytes < cold_bytes / 10
+
+
+def test_top_up_appends_new_bars(fake_yf, cache_dir):
+    full = fake_yf.bars["SBIN"]
+    fake_yf.bars["SBIN"] = full.iloc[:-3]
+    core.get_history_batch(["SBIN"], "6mo")
+    fake_yf.bars["SBIN"] = full
+    _age_cache(cache_dir)
+
+    df = core.get_history("SBIN", "6mo")
+
+    assert df.index[-1] == full.index[-1]
+    assert not df.index.has_duplicates
+
+
+def test_failing_ticker_is_isolated(fake_yf, monkeypatch):
+    monkeypatch.setattr(core, "BATCH_CHUNK", 1)
+    fake_yf.fail = {"TCS"}
+    fake_yf.bars["MISSING"] = None
+
+    out = core.get_history_batch(SYMS + ["MISSING"], "6mo")
+
+    assert out["TCS"] is None
+    assert out["MISSING"] is None
+    assert out["RELIANCE"] is not None and out["SBIN"] is not None
+
+
+def test_missing_ticker_in_batch_does_not_drop_others(fake_yf):
+    fake_yf.bars["GHOST"] = None
+
+    out = core.get_history_batch(SYMS + ["GHOST"], "6mo")
+
+    assert len(fake_yf.calls) == 1
+    assert out["GHOST"] is None
+    assert all(out[s] is not None for s in SYMS)
+
+
+def test_failed_top_up_serves_cached_bars(fake_yf, cache_dir):
+    core.get_history_batch(["RELIANCE"], "6mo")
+    cached = core.get_history("RELIANCE", "6mo")
+    _age_cache(cache_dir)
+    fake_yf.fail = {"RELIANCE"}
+
+    df = core.get_history("RELIANCE", "6mo")
+
+    pd.testing.assert_frame_equal(df, cached)
+
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import make_bars
+from core import (
+    RankWeights,
+    build_panel,
+    compute_snapshot,
+    indicator_panel,
+    rank_panel,
+    rank_score,
+)
+
+
+@pytest.fixture
+def misaligned():
+    """30 symbols on one calendar, one of them a bar ahead, one with a gap
+    and one with a short history."""
+    end = pd.Timestamp("2024-06-14")
+    frames = {f"S{i:02d}": make_bars(130, end=end, seed=i) for i in range(30)}
+    frames["AHEAD"] = make_bars(131, end=end + pd.offsets.BDay(), seed=99)
+    frames["GAPPY"] = make_bars(130, end=end, seed=98).drop(index=pd.Timestamp("2024-06-05"))
+    frames["SHORT"] = make_bars(8, end=end, seed=97)
+    return frames
+
+
+def _panel(frames):
+    return indicator_panel(build_panel(frames, "Close"), build_panel(frames, "Volume"))
+
+
+def _close(a, b) -> bool:
+    return (a is None and np.isnan(b)) or (a is not None and np.isclose(a, b, rtol=1e-9))
+
+
+def test_panel_matches_snapshots_on_misaligned_calendars(misaligned):
+    ind = _panel(misaligned)
+
+    for sym, df in misaligned.items():
+        snap = compute_snapshot(df)
+        row = ind.loc[sym]
+        assert _close(snap.sma[5], row["sma5"]), sym
+        assert _close(snap.sma[20], row["sma20"]), sym
+        assert _close(snap.ema[26], row["ema26"]), sym
+        assert _close(snap.support, row["support"]), sym
+        assert _close(snap.resistance, row["resistance"]), sym
+        assert _close(snap.rel_vol, row["rel_vol"]), sym
+
+
+@pytest.mark.parametrize("weekly", [0, 10])
+def test_rank_panel_matches_rank_score_with_extra_bar(misaligned, weekly):
+    weights = RankWeights(weekly_trend=weekly)
+    live = {sym: float(df["Close"].iloc[-1]) * 0.99 for sym, df in misaligned.items()}
+
+    ranked = rank_panel(_panel(misaligned), live, weights).set_index("Symbol")
+
+    for sym, df in misaligned.items():
+        assert ranked.loc[sym, "Score"] == rank_score(sym, df, live[sym], weights)["Score"], sym
+
+
+def test_extra_bar_does_not_change_other_symbols(misaligned):
+    aligned = {s: df for s, df in misaligned.items() if s != "AHEAD"}
+
+    with_extra = _panel(misaligned).drop(index="AHEAD")
+
+    pd.testing.assert_frame_equal(with_extra, _panel(aligned))
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from conftest import make_bars
+import core
+from core import DEFAULT_SPEC, IndicatorSpec, compute_snapshot, indicator_frame, rsi_series
+
+
+def _same(a, b) -> bool:
+    return (a is None and np.isnan(b)) or (a is not None and np.isclose(a, b, rtol=1e-12))
+
+
+@pytest.mark.parametrize("n", [8, 21, 34, 35, 300])
+def test_snapshot_is_the_last_frame_row(n):
+    df = make_bars(n, seed=n)
+    df.iloc[n // 2, df.columns.get_loc("Close")] = np.nan  # a gap inside the windows
+
+    snap = compute_snapshot(df)
+    last = indicator_frame(df).iloc[-1]
+
+    for w in DEFAULT_SPEC.sma:
+        assert _same(snap.sma[w], last[f"sma{w}"]), w
+    for w in DEFAULT_SPEC.ema:
+        assert _same(snap.ema[w], last[f"ema{w}"]), w
+    for name in ("rsi", "macd", "signal", "support", "resistance", "avg_vol", "rel_vol"):
+        col = f"rsi{DEFAULT_SPEC.rsi}" if name == "rsi" else name
+        assert _same(getattr(snap, name), last[col]), name
+
+
+def test_revised_last_volume_is_not_a_memo_hit():
+    spec = IndicatorSpec(weekly_sma=None)
+    df = make_bars(60)
+    before = compute_snapshot(df, spec, "TCS")
+
+    revised = df.copy()
+    revised.iloc[-1, revised.columns.get_loc("Volume")] *= 3
+    after = compute_snapshot(revised, spec, "TCS")
+
+    assert after.last_vol == 3 * before.last_vol
+    assert after.rel_vol > before.rel_vol
+    assert after is compute_snapshot(revised, spec, "TCS")
+
+
+def _reference_rsi(closes: list[float], period: int = 14) -> list[float]:
+    """Wilder's RSI as printed: simple averages of the first ``period``
+    moves, then avg = (prev * (period - 1) + move) / period."""
+    moves = [b - a for a, b in zip(closes, closes[1:])]
+    gains = [max(m, 0.0) for m in moves]
+    losses = [max(-m, 0.0) for m in moves]
+    out = [float("nan")] * len(closes)
+    avg_gain, avg_loss = sum(gains[:period]) / period, sum(losses[:period]) / period
+    for t in range(period, len(moves) + 1):
+        if t > period:
+            avg_gain = (avg_gain * (period - 1) + gains[t - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[t - 1]) / period
+        out[t] = 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+    return out
+
+
+@pytest.mark.parametrize("period", [3, 14])
+def test_rsi_series_matches_reference_wilder(period):
+    close = make_bars(120, seed=3)["Close"]
+    close.iloc[40:60] = np.linspace(100, 130, 20)  # only gains: RSI pinned at 100
+
+    got = rsi_series(close, period)
+
+    np.testing.assert_allclose(got.to_numpy(), _reference_rsi(close.tolist(), period), rtol=1e-12)
+    assert got.index.equals(close.index)
+    assert core.calc_rsi(close, period) == pytest.approx(got.iloc[-1], rel=1e-12)
+
+
+def test_rsi_series_is_nan_until_period_moves():
+    assert rsi_series(make_bars(14)["Close"], 14).isna().all()
+    assert rsi_series(make_bars(15)["Close"], 14).notna().sum() == 1
+
+
+@pytest.mark.parametrize(
+    "scalar, series",
+    [
+        (lambda s: core.calc_sma(s, 20), lambda s: core.sma_series(s, 20)),
+        (lambda s: core.calc_ema(s, 26), lambda s: core.ema_series(s, 26)),
+        (lambda s: core.calc_macd(s)[0], lambda s: core.macd_series(s)["macd"]),
+        (lambda s: core.calc_macd(s)[1], lambda s: core.macd_series(s)["signal"]),
+        (lambda s: core.calc_sr(s, 30)[0], lambda s: core.sr_series(s, 30)["support"]),
+    ],
+)
+@pytest.mark.parametrize("n", [10, 40, 250])
+def test_scalar_helpers_are_the_last_series_value(scalar, series, n):
+    close = make_bars(n, seed=n)["Close"]
+    assert _same(scalar(close), series(close).iloc[-1])
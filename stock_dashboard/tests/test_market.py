@@ -0,0 +1,61 @@
+from datetime import date, datetime
+
+import pytest
+
+import market
+from market import IST, expires_at, next_open
+
+
+def _ist(*args) -> datetime:
+    return datetime(*args, tzinfo=IST)
+
+
+@pytest.fixture(autouse=True)
+def holidays(monkeypatch):
+    # Friday 2025-08-15 is Independence Day
+    monkeypatch.setattr(market, "NSE_HOLIDAYS", {date(2025, 8, 15)})
+
+
+@pytest.mark.parametrize(
+    "ts, opens",
+    [
+        (_ist(2025, 8, 11, 8, 0), _ist(2025, 8, 11, 9, 15)),  # Monday before the open
+        (_ist(2025, 8, 11, 9, 15), _ist(2025, 8, 12, 9, 15)),  # Monday at the open
+        (_ist(2025, 8, 8, 17, 0), _ist(2025, 8, 11, 9, 15)),  # Friday after the close
+        (_ist(2025, 8, 9, 11, 0), _ist(2025, 8, 11, 9, 15)),  # Saturday
+        (_ist(2025, 8, 10, 23, 59), _ist(2025, 8, 11, 9, 15)),  # Sunday night
+        (_ist(2025, 8, 14, 16, 30), _ist(2025, 8, 18, 9, 15)),  # Thursday before a Friday holiday
+    ],
+)
+def test_next_open_skips_weekends_and_holidays(ts, opens):
+    assert next_open(ts) == opens
+    assert next_open(ts.timestamp()) == opens
+
+
+def test_expires_at_follows_the_session():
+    # live: seconds later, also through the post-close grace period
+    assert expires_at(_ist(2025, 8, 8, 11, 0), 60) == _ist(2025, 8, 8, 11, 1).timestamp()
+    assert expires_at(_ist(2025, 8, 8, 15, 45), 60) == _ist(2025, 8, 8, 15, 46).timestamp()
+    # after the close and on the weekend: good until Monday's open
+    monday = _ist(2025, 8, 11, 9, 15).timestamp()
+    assert expires_at(_ist(2025, 8, 8, 16, 0), 60) == monday
+    assert expires_at(_ist(2025, 8, 9, 12, 0), 60) == monday
+    # a holiday is not live
+    assert expires_at(_ist(2025, 8, 15, 11, 0), 60) == _ist(2025, 8, 18, 9, 15).timestamp()
+
+
+def test_naive_times_are_read_as_ist():
+    assert next_open(datetime(2025, 8, 9, 11, 0)) == _ist(2025, 8, 11, 9, 15)
+
+
+def test_holiday_file_format(tmp_path):
+    path = tmp_path / "holidays.csv"
+    path.write_text("# comment\n2025-08-15,Independence Day\n\n2025-10-02  # Gandhi Jayanti\n")
+
+    assert market._load_holidays(str(path)) == {date(2025, 8, 15), date(2025, 10, 2)}
+    assert market._load_holidays(str(tmp_path / "missing.csv")) == set()
+
+
+def test_shipped_holiday_file_parses():
+    days = market._load_holidays(market.HOLIDAYS_FILE)
+    assert days and all(d.weekday() < 5 for d in days)
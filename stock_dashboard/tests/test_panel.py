@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import make_bars
+from core import build_panel, indicator_panel, rank_score
+from flow import flow_summary
+from panel import Panel
+from scanners import flow_shard, rank_shard
+
+END = pd.Timestamp("2024-06-14")
+
+
+@pytest.fixture
+def frames():
+    out = {f"S{i:02d}": make_bars(130, end=END, seed=i) for i in range(20)}
+    out["SHORT"] = make_bars(8, end=END, seed=90)
+    out["NOLAST"] = make_bars(130, end=END - pd.offsets.BDay(), seed=91)
+    out["AHEAD"] = make_bars(131, end=END + pd.offsets.BDay(), seed=92)
+    gappy = make_bars(130, end=END, seed=93)
+    gappy.iloc[-5, gappy.columns.get_loc("Volume")] = np.nan
+    out["GAPPY"] = gappy.astype({"Volume": "float64"})
+    return out
+
+
+def test_layout_and_views(frames):
+    panel = Panel.from_frames(frames, ("Close", "Volume", "High"))
+
+    assert panel.values("Close").dtype == np.float32
+    assert panel.values("Volume").dtype == np.uint32
+    assert panel.values("Close").flags.c_contiguous
+    assert np.shares_memory(panel.frame("Close").to_numpy(), panel.values("Close"))
+    assert np.shares_memory(panel.series("S03").to_numpy(), panel.values("Close"))
+    assert panel.columns == ["Close", "Volume", "High"]
+    assert panel.nbytes < sum(df.memory_usage().sum() for df in frames.values())
+
+
+def test_missing_volume_stays_missing(frames):
+    volume = Panel.from_frames(frames).frame("Volume")
+
+    pd.testing.assert_frame_equal(volume, build_panel(frames, "Volume").astype("float64"), check_freq=False)
+    assert volume["SHORT"].notna().sum() == 8
+    assert np.isnan(volume["NOLAST"].iloc[-2])  # END has no bar for it
+    assert np.isnan(volume.loc[frames["GAPPY"].index[-5], "GAPPY"])
+
+
+def test_indicators_match_build_panel(frames):
+    panel = Panel.from_frames(frames)
+
+    compact = indicator_panel(panel.frame("Close"), panel.frame("Volume"))
+    wide = indicator_panel(build_panel(frames, "Close"), build_panel(frames, "Volume"))
+
+    # rel_vol of a short history is NaN, not a ratio against zero-filled bars
+    assert np.isnan(compact.loc["SHORT", "rel_vol"])
+    assert not (compact["rel_vol"] == 0).any()
+    assert compact.isna().equals(wide.isna())
+    np.testing.assert_allclose(compact.to_numpy(), wide.to_numpy(), rtol=1e-6, atol=1e-5)
+
+
+def test_rank_shard_matches_rank_score(frames):
+    # LTP exactly at the last close hits the support edge case
+    prices = {s: float(df["Close"].iloc[-1]) for s, df in frames.items()}
+
+    ranked = rank_shard(list(frames), frames, prices).set_index("Symbol")
+
+    for sym, df in frames.items():
+        assert ranked.loc[sym, "Score"] == rank_score(sym, df, prices[sym])["Score"], sym
+
+
+def test_flow_shard_matches_build_panel(frames):
+    cols = ("Close", "Volume", "High", "Low")
+    wide = flow_summary(*(build_panel(frames, c) for c in cols))
+
+    rows = flow_shard(list(frames), frames, {}).set_index("Symbol")
+
+    np.testing.assert_allclose(
+        rows[wide.columns.drop("Flow")].to_numpy(dtype="float64"),
+        wide.drop(columns="Flow").round(2).to_numpy(dtype="float64"),
+        rtol=1e-4,
+        atol=0.01,
+    )
+    assert (rows["Flow"] == wide["Flow"]).all()
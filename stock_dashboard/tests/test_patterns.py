@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from patterns import DOUBLE_BOTTOM, DOUBLE_TOP, NO_PATTERN, latest_patterns, pattern_stats, scan_patterns
+
+HORIZONS = (5, 10)
+
+
+@pytest.fixture
+def close():
+    """A 40-bar W (lows 100 and 101, middle high 110, last close 109), its
+    mirror M, then 10 bars rising / falling 1% a bar; plus a flat symbol."""
+    w = np.interp(np.arange(40), [0, 7, 15, 20, 22, 27, 34, 39], [110, 100, 104, 110, 110, 101, 103, 109])
+    after = np.arange(1, 11)
+    return pd.DataFrame(
+        {
+            "W": np.r_[w, 109 * 1.01**after],
+            "M": np.r_[210 - w, 101 * 0.99**after],
+            "FLAT": 100.0,
+        },
+        index=pd.bdate_range("2024-01-01", periods=50),
+    )
+
+
+def test_latest_patterns_on_the_pattern_window(close):
+    hints = latest_patterns(close.iloc[:40])
+
+    assert hints.to_dict() == {"W": DOUBLE_BOTTOM, "M": DOUBLE_TOP, "FLAT": NO_PATTERN}
+
+
+def test_scan_patterns_dates_each_run_once_with_forward_returns(close):
+    occ = scan_patterns(close, horizons=HORIZONS).set_index("Symbol")
+
+    assert sorted(occ.index) == ["M", "W"]
+    assert occ.loc["W", "Pattern"] == DOUBLE_BOTTOM and occ.loc["M", "Pattern"] == DOUBLE_TOP
+    assert (occ["Date"] == close.index[39]).all()
+    assert occ.loc["W", "Close"] == pytest.approx(109)
+    assert occ.loc["W", "fwd_5"] == pytest.approx((1.01**5 - 1) * 100)
+    assert occ.loc["M", "fwd_10"] == pytest.approx((0.99**10 - 1) * 100)
+
+
+def test_pattern_stats_counts_hits_in_each_patterns_direction(close):
+    stats = pattern_stats(scan_patterns(close, horizons=HORIZONS), HORIZONS).set_index("Pattern")
+
+    assert stats["Count"].to_dict() == {DOUBLE_TOP: 1, DOUBLE_BOTTOM: 1}
+    assert (stats[["hit_5", "hit_10"]] == 100.0).all().all()
+    assert stats.loc[DOUBLE_BOTTOM, "avg_10"] == pytest.approx((1.01**10 - 1) * 100)
+
+
+def test_short_history_has_no_occurrences(close):
+    assert scan_patterns(close.iloc[:30]).empty
+    assert (latest_patterns(close.iloc[:30]) == NO_PATTERN).all()
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from benchmarks.nse_stub import NseStub
+from core import QuoteClient
+from upstream import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, Quote
+
+SYMS = [f"SYM{i}" for i in range(24)]
+
+
+@pytest.fixture
+def stub():
+    with NseStub(rate=1e6, latency=0.01) as server:
+        yield server
+
+
+def test_many_quotes_share_pooled_connections(stub):
+    client = QuoteClient(base_url=stub.url, workers=4, rate=1e6, burst=1e6)
+
+    quotes = client.get_many(SYMS)
+
+    assert all(isinstance(q, Quote) and not q.stale for q in quotes.values())
+    assert stub.stats["ok"] == len(SYMS)
+    assert stub.stats["unauthorized"] == 0  # primed once, the cookie is reused
+    # the priming request plus at most one connection per worker
+    assert stub.stats["connections"] <= 1 + client.workers
+
+
+def test_failed_fetch_falls_back_to_last_good_price(stub):
+    client = QuoteClient(base_url=stub.url, ttl=0, rate=1e6, burst=1e6, attempts=1, breaker=CircuitBreaker(10**9))
+    fresh = client.get("TCS")
+
+    stub.down = True
+    stale = client.get("TCS")
+
+    assert not fresh.stale
+    assert stale.stale and stale == fresh and stale.as_of == fresh.as_of
+    assert client.get("SBIN") is None  # never fetched, nothing to fall back on
+
+
+def test_breaker_opens_after_failures_and_probes_after_cool_down(stub):
+    breaker = CircuitBreaker(threshold=3, reset_after=0.3)
+    client = QuoteClient(base_url=stub.url, ttl=0, workers=1, rate=1e6, burst=1e6, attempts=1, breaker=breaker)
+    stub.down = True
+
+    for sym in ("A", "B", "C"):
+        assert client.get(sym) is None
+    assert breaker.state == OPEN
+    assert client.get("D") is None
+    assert stub.stats["down"] == 3  # open: failed fast, never sent
+
+    time.sleep(0.3)
+    assert breaker.state == HALF_OPEN
+    stub.down = False
+    assert client.get("D") is not None
+    assert breaker.state == CLOSED
+
+
+def test_bucket_keeps_requests_under_the_server_rate(stub):
+    stub.rate = 10
+    syms = SYMS[:15]
+    naive = QuoteClient(base_url=stub.url, rate=1e6, burst=1e6, attempts=1)
+    assert sum(q is None for q in naive.get_many(syms).values()) > 0
+    assert stub.stats["throttled"] > 0
+
+    time.sleep(1.0)  # let the stub's one-second window clear
+    throttled = stub.stats["throttled"]
+    limited = QuoteClient(base_url=stub.url, rate=8, burst=1, attempts=1)
+    t0 = time.perf_counter()
+    quotes = limited.get_many(syms[:10])
+
+    assert time.perf_counter() - t0 >= 9 / 8 * 0.9
+    assert all(q is not None for q in quotes.values())
+    assert stub.stats["throttled"] == throttled
+
+
+def test_throttled_request_is_retried_after_retry_after(stub):
+    stub.rate, stub.retry_after = 1, 1.0
+    client = QuoteClient(base_url=stub.url, workers=1, rate=1e6, burst=1e6, attempts=3)
+
+    t0 = time.perf_counter()
+    quotes = client.get_many(["TCS", "SBIN"])
+
+    assert all(q is not None and not q.stale for q in quotes.values())
+    assert stub.stats["throttled"] == 1 and stub.stats["ok"] == 2
+    assert time.perf_counter() - t0 >= stub.retry_after
@@ -0,0 +1,67 @@
+import pandas as pd
+
+from conftest import make_bars
+from core import bars_key, rank_score
+from ranking import RankingService
+
+
+def _universe(n: int = 40):
+    end = pd.Timestamp("2024-06-14")
+    hist = {f"S{i:02d}": make_bars(130, end=end, seed=i) for i in range(n)}
+    prices = {s: float(df["Close"].iloc[-1]) for s, df in hist.items()}
+    return hist, prices
+
+
+def test_scores_match_rank_score():
+    hist, prices = _universe()
+    service = RankingService()
+
+    service.update(list(hist), hist, prices)
+
+    table = service.table().set_index("Symbol")
+    for sym, df in hist.items():
+        assert table.loc[sym, "Score"] == rank_score(sym, df, prices[sym])["Score"], sym
+
+
+def test_at_least_is_the_score_threshold():
+    hist, prices = _universe()
+    service = RankingService()
+    service.update(list(hist), hist, prices)
+    table = service.table()
+
+    for threshold in (0, 50, 70, 1000):
+        best = service.at_least(threshold)
+        assert sorted(best["Symbol"]) == sorted(table.loc[table["Score"] >= threshold, "Symbol"])
+        assert best["Score"].is_monotonic_decreasing
+
+
+def test_empty_service():
+    service = RankingService()
+
+    assert service.grade_counts() == {}
+    assert service.at_least(70).empty
+    assert service.top(5).empty
+
+
+def test_volume_only_revision_updates_rel_vol():
+    hist, prices = _universe(3)
+    service = RankingService()
+    service.update(list(hist), hist, prices)
+    before = service.table().set_index("Symbol").loc["S01", "RelVol"]
+
+    revised = hist["S01"].copy()
+    revised.iloc[-1, revised.columns.get_loc("Volume")] *= 3
+    changed = service.update(["S01"], {**hist, "S01": revised}, prices)
+
+    assert changed["Symbol"].tolist() == ["S01"]
+    assert changed["RelVol"].iloc[0] > before
+
+
+def test_bars_key_tracks_last_volume():
+    df = make_bars(30)
+    revised = df.copy()
+    revised.iloc[-1, revised.columns.get_loc("Volume")] += 1
+
+    assert bars_key(df) == bars_key(df.copy())
+    assert bars_key(df) != bars_key(revised)
+    assert bars_key(None) is None
@@ -0,0 +1,42 @@
+import time
+
+from refresher import Refresher
+from conftest import StubLoaders
+
+
+def _wait_until(cond, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return cond()
+
+
+def test_idle_symbols_stop_being_polled():
+    stub = StubLoaders(delay=0)
+    refresher = Refresher(
+        stub, quote_every=0.02, bars_every=0.02, closed_every=0, cold_wait=2, watch_idle=0.3
+    ).start()
+    try:
+        assert refresher.quote("TCS") == 100.0
+        assert refresher.quote("SBIN") == 100.0
+
+        # keep asking for TCS only; SBIN goes idle
+        deadline = time.time() + 0.6
+        while time.time() < deadline:
+            refresher.quote("TCS")
+            time.sleep(0.05)
+        assert _wait_until(lambda: "SBIN" not in refresher._watched)
+        polled = stub.quote_calls["SBIN"]
+        time.sleep(0.2)
+
+        assert stub.quote_calls["SBIN"] == polled
+        assert stub.quote_calls["TCS"] > polled
+        assert "TCS" in refresher._watched
+        assert "SBIN" not in refresher._quotes and "SBIN" not in refresher._bars
+
+        # asking again watches it again
+        assert refresher.quote("SBIN") == 100.0
+    finally:
+        refresher.stop()
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import make_bars
+from market import IST
+from resample import resample_bars
+
+AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Adj Close": "last", "Volume": "sum"}
+
+
+def _rough(df: pd.DataFrame, seed: int = 1) -> pd.DataFrame:
+    """Highs and lows that differ from bar to bar, so max/min are tested."""
+    rng = np.random.default_rng(seed)
+    df = df.copy()
+    df["High"] = df["Close"] * (1 + rng.uniform(0, 0.03, len(df)))
+    df["Low"] = df["Close"] * (1 - rng.uniform(0, 0.03, len(df)))
+    return df
+
+
+def _minute_bars(days: list[str]) -> pd.DataFrame:
+    """1-minute bars from 09:00 to 15:44 IST, so both ends spill outside the session."""
+    index = pd.DatetimeIndex(
+        np.concatenate([pd.date_range(f"{d} 09:00", f"{d} 15:44", freq="min", tz=IST) for d in days])
+    )
+    df = _rough(make_bars(len(index), seed=2))
+    df.index = index
+    return df
+
+
+@pytest.mark.parametrize("tz", [None, IST])
+@pytest.mark.parametrize("interval, rule", [("1wk", "W-MON"), ("1mo", "MS")])
+def test_daily_to_weekly_and_monthly_matches_pandas(interval, rule, tz):
+    df = _rough(make_bars(300, end="2024-06-14"))
+    df.index = df.index.tz_localize(tz)
+
+    expected = df.resample(rule, closed="left", label="left").agg(AGG).dropna(subset=["Close"])
+
+    pd.testing.assert_frame_equal(resample_bars(df, interval), expected, check_freq=False, check_index_type=False)
+
+
+def test_weekly_bars_are_labelled_with_their_monday():
+    df = make_bars(30, end="2024-06-14")
+
+    out = resample_bars(df, "1wk")
+
+    assert (out.index.dayofweek == 0).all()
+    assert out.index[-1] == pd.Timestamp("2024-06-10")
+
+
+@pytest.mark.parametrize("interval, minutes", [("5m", 5), ("60m", 60), ("90m", 90)])
+def test_intraday_buckets_match_pandas_within_the_session(interval, minutes):
+    df = _minute_bars(["2024-06-13", "2024-06-14"])
+    session = df.between_time("09:15", "15:29")
+
+    expected = (
+        session.resample(f"{minutes}min", origin="start_day", offset="9h15min")
+        .agg(AGG)
+        .dropna(subset=["Close"])
+    )
+
+    pd.testing.assert_frame_equal(resample_bars(df, interval), expected, check_freq=False, check_index_type=False)
+
+
+def test_90m_buckets_start_at_the_open_and_end_at_15_15():
+    out = resample_bars(_minute_bars(["2024-06-14"]), "90m")
+
+    assert out.index.strftime("%H:%M").tolist() == ["09:15", "10:45", "12:15", "13:45", "15:15"]
+    # the last bucket is cut at the 15:30 close
+    assert out["Volume"].iloc[-1] == _minute_bars(["2024-06-14"]).between_time("15:15", "15:29")["Volume"].sum()
+
+
+def test_naive_intraday_timestamps_are_read_as_ist():
+    df = _minute_bars(["2024-06-14"])
+    naive = df.tz_localize(None)
+
+    pd.testing.assert_frame_equal(resample_bars(naive, "15m"), resample_bars(df, "15m").tz_localize(None))
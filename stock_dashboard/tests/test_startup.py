@@ -0,0 +1,14 @@
+import subprocess
+import sys
+from pathlib import Path
+
+BENCH = Path(__file__).resolve().parents[1] / "benchmarks" / "bench_startup.py"
+
+
+def test_cold_start_stays_offline_and_within_budget():
+    # fresh interpreters: imports already done by this test run do not count
+    run = subprocess.run([sys.executable, str(BENCH)], capture_output=True, text=True, timeout=300)
+
+    assert "import scan:" in run.stdout and "heavy modules loaded: none" in run.stdout, run.stdout
+    assert "network modules loaded: none" in run.stdout, run.stdout
+    assert run.returncode == 0, run.stdout + run.stderr
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core import ema_series, macd_series, rsi_series, sma_series, sr_series
+from streaming import (
+    RollingMinMax,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+    StreamingSMA,
+    TickBuffer,
+)
+
+SEED_BARS = 40
+TOL = 1e-9
+
+
+@pytest.fixture(scope="module")
+def closes() -> pd.Series:
+    rng = np.random.default_rng(7)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.015, 120))))
+
+
+def _same(value, expected: float) -> bool:
+    if value is None:
+        return np.isnan(expected)
+    return not np.isnan(expected) and value == pytest.approx(expected, rel=TOL, abs=TOL)
+
+
+def _replay(ind, closes: pd.Series, batch: list[pd.Series], seed: int = SEED_BARS) -> None:
+    """Seed ``ind`` with ``seed`` bars, then per bar check a few intraday
+    previews against the batch value of that tick and the committed close."""
+    def as_tuple(v):
+        return v if isinstance(v, tuple) else (v,)
+
+    for t in range(seed, len(closes)):
+        x = float(closes.iloc[t])
+        for tick in (x * 0.99, x * 1.01, x):
+            ticked = closes.iloc[: t + 1].copy()
+            ticked.iloc[-1] = tick
+            want = [s(ticked).iloc[-1] for s in batch]
+            got = as_tuple(ind.preview(tick))
+            assert all(_same(g, w) for g, w in zip(got, want)), (t, tick, got, want)
+        got = as_tuple(ind.update(x))
+        want = [s(closes.iloc[: t + 1]).iloc[-1] for s in batch]
+        assert all(_same(g, w) for g, w in zip(got, want)), (t, got, want)
+
+
+@pytest.mark.parametrize("window", [5, 20])
+def test_sma_matches_batch(closes, window):
+    ind = StreamingSMA.from_series(closes.iloc[:SEED_BARS], window)
+    _replay(ind, closes, [lambda s: sma_series(s, window)])
+
+
+@pytest.mark.parametrize("window", [12, 26])
+def test_ema_matches_batch(closes, window):
+    ind = StreamingEMA.from_series(closes.iloc[:SEED_BARS], window)
+    _replay(ind, closes, [lambda s: ema_series(s, window)])
+
+
+def test_rsi_matches_batch(closes):
+    ind = StreamingRSI.from_series(closes.iloc[:SEED_BARS], 14)
+    _replay(ind, closes, [lambda s: rsi_series(s, 14)])
+
+
+def test_macd_matches_batch(closes):
+    ind = StreamingMACD.from_series(closes.iloc[:SEED_BARS])
+    _replay(ind, closes, [lambda s: macd_series(s)["macd"], lambda s: macd_series(s)["signal"]])
+
+
+def test_min_max_matches_batch(closes):
+    ind = RollingMinMax.from_series(closes.iloc[:SEED_BARS], 30)
+    _replay(ind, closes, [lambda s: sr_series(s, 30)["support"], lambda s: sr_series(s, 30)["resistance"]])
+
+
+def test_warmup_is_none_like_batch(closes):
+    # seeded from nothing, values stay None exactly as long as the batch is NaN
+    for ind, batch in (
+        (StreamingSMA(20), [lambda s: sma_series(s, 20)]),
+        (StreamingEMA(26), [lambda s: ema_series(s, 26)]),
+        (StreamingRSI(14), [lambda s: rsi_series(s, 14)]),
+        (StreamingMACD(), [lambda s: macd_series(s)["macd"], lambda s: macd_series(s)["signal"]]),
+    ):
+        _replay(ind, closes.iloc[:60], batch, seed=0)
+
+
+def test_tick_buffer_wraps_and_drops_old_ticks():
+    buf = TickBuffer(capacity=4)
+    for i in range(6):
+        assert buf.append(1000.0 + i, 10.0 + i)
+    assert not buf.append(1002.0, 99.0)
+
+    ts, px = buf.arrays()
+
+    assert len(buf) == 4
+    assert ts.tolist() == [1002.0, 1003.0, 1004.0, 1005.0]
+    assert px.tolist() == [12.0, 13.0, 14.0, 15.0]
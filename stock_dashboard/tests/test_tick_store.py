@@ -0,0 +1,78 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+import tick_store
+from tick_store import TickStore
+
+DAY_START = pd.Timestamp("2024-06-14 09:15", tz="Asia/Kolkata").timestamp()
+
+
+def test_append_and_read_back(tmp_path):
+    store = TickStore(str(tmp_path))
+    store.append(DAY_START + np.arange(3.0), ["TCS", "SBIN", "TCS"], [10.0, 20.0, 11.0])
+
+    tcs = store.range(DAY_START, symbol="TCS")
+
+    assert tcs["price"].tolist() == [10.0, 11.0]
+    assert store.bars("TCS", "1m", DAY_START)["Close"].tolist() == [11.0]
+
+
+def test_readers_see_consistent_rows_while_the_writer_grows(tmp_path, monkeypatch):
+    monkeypatch.setattr(tick_store, "INITIAL_ROWS", 4)
+    store = TickStore(str(tmp_path))
+    rows = 3000
+    done = threading.Event()
+    errors = []
+
+    def write():
+        try:
+            for i in range(rows):
+                store.append([DAY_START + i], ["TCS"], [100.0 + i])
+        finally:
+            done.set()
+
+    def read():
+        try:
+            while not done.is_set():
+                cols = store.range(DAY_START)
+                n = len(cols["ts"])
+                assert all(len(col) == n for col in cols.values())
+                # every published row is a written one
+                assert (cols["price"] == 100.0 + (cols["ts"] - DAY_START)).all()
+                store.bars("TCS", "1m", DAY_START)
+        except Exception as exc:  # surfaced in the main thread
+            errors.append(exc)
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    for t in readers:
+        t.start()
+    write()
+    for t in readers:
+        t.join()
+
+    assert not errors, errors[0]
+    assert len(store.range(DAY_START)["ts"]) == rows
+
+
+def test_append_quotes_skips_missing_and_unchanged_prices(tmp_path):
+    store = TickStore(str(tmp_path))
+
+    assert store.append_quotes({"TCS": 10.0, "SBIN": None}, DAY_START) == 1
+    assert store.append_quotes({"TCS": 10.0, "SBIN": 20.0}, DAY_START + 1) == 1
+    assert store.append_quotes({"TCS": 10.5, "SBIN": 20.0}, DAY_START + 2) == 1
+
+    assert store.range(DAY_START, symbol="TCS")["price"].tolist() == [10.0, 10.5]
+    assert store.range(DAY_START, symbol="SBIN")["ts"].tolist() == [DAY_START + 1]
+
+
+def test_bars_are_ohlc_per_bucket(tmp_path):
+    store = TickStore(str(tmp_path))
+    store.append(DAY_START + np.array([0.0, 20, 40, 61]), ["TCS"] * 4, [10.0, 12.0, 9.0, 11.0])
+
+    bars = store.bars("TCS", "1m", DAY_START)
+
+    assert list(bars.columns) == ["Open", "High", "Low", "Close"]
+    assert bars.to_numpy().tolist() == [[10.0, 12.0, 9.0, 9.0], [11.0, 11.0, 11.0, 11.0]]
+    assert bars.index[0] == pd.Timestamp(DAY_START, unit="s", tz="UTC").tz_convert("Asia/Kolkata")
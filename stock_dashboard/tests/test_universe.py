@@ -0,0 +1,84 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from conftest import StubLoaders
+from scanners import rank_shard
+from universe import list_universes, load_universe, scan_universe
+
+SYMS = [f"SYM{i:03d}" for i in range(250)]
+
+
+def _names(syms, hist, prices) -> pd.DataFrame:
+    return pd.DataFrame({"Symbol": syms, "Bars": [len(hist[s]) for s in syms], "LTP": [prices.get(s) for s in syms]})
+
+
+def test_load_universe_reads_the_symbol_column(tmp_path):
+    (tmp_path / "ind_nifty_test.csv").write_text(
+        "Company Name,Industry,Symbol,Series,ISIN Code\n"
+        "Tata Consultancy,IT,TCS,EQ,INE467B01029\n"
+        "State Bank,Banks, sbin ,EQ,INE062A01020\n"
+        "Tata Consultancy,IT,TCS,EQ,INE467B01029\n"
+    )
+    (tmp_path / "plain.csv").write_text("infy\nwipro,extra\n\n")
+    (tmp_path / "notes.txt").write_text("not a universe")
+
+    assert list(list_universes(str(tmp_path))) == ["ind_nifty_test", "plain"]
+    assert load_universe("ind_nifty_test", str(tmp_path)) == ["TCS", "SBIN"]
+    assert load_universe(str(tmp_path / "plain.csv"), str(tmp_path)) == ["INFY", "WIPRO"]
+
+
+def test_shipped_nifty50_universe():
+    syms = load_universe("nifty50")
+    assert len(syms) == 50 and len(set(syms)) == 50
+
+
+def test_scan_covers_every_symbol_once_in_shards():
+    stub = StubLoaders(delay=0)
+
+    results = list(scan_universe(SYMS, _names, stub, shard_size=100))
+
+    assert [len(r.rows) for r in results] == [100, 100, 50]
+    assert [r.done for r in results] == [100, 200, 250]
+    assert all(r.total == 250 for r in results)
+    assert pd.concat([r.rows for r in results])["Symbol"].tolist() == SYMS
+    assert set(stub.history_calls.values()) == {1} and len(stub.history_calls) == 250
+    assert set(stub.quote_calls.values()) == {1}
+
+
+def test_scan_without_quotes_skips_the_quote_loader():
+    stub = StubLoaders(delay=0)
+
+    rows = pd.concat(r.rows for r in scan_universe(SYMS[:30], _names, stub, quotes=False, shard_size=10))
+
+    assert rows["LTP"].isna().all()
+    assert not stub.quote_calls
+
+
+@pytest.mark.parametrize("stop", ["cancel", "close"])
+def test_stopped_scan_fetches_at_most_one_shard_ahead(stop):
+    stub = StubLoaders(delay=0.01)
+    cancel = threading.Event()
+    scan = scan_universe(SYMS, _names, stub, shard_size=50, cancel=cancel)
+
+    first = next(scan)
+    if stop == "cancel":
+        cancel.set()
+        assert list(scan) == []
+    else:
+        scan.close()
+        assert cancel.is_set()
+
+    assert first.done == 50
+    # the first shard plus the one prefetched while it was being scored
+    assert len(stub.history_calls) <= 100
+
+
+def test_rank_shard_over_a_synthetic_universe():
+    stub = StubLoaders(delay=0)
+
+    rows = pd.concat(r.rows for r in scan_universe(SYMS[:120], rank_shard, stub, shard_size=40))
+
+    assert sorted(rows["Symbol"]) == SYMS[:120]
+    assert rows["Score"].between(0, 100).all()
@@ -0,0 +1,313 @@
+"""Append-only intraday tick store on memory-mapped NumPy columns.
+
+Ticks are stored column-wise (``ts`` unix seconds, ``sym`` integer symbol
+id, ``price``, ``volume``) in one directory per IST trading day::
+
+    <root>/symbols.txt          symbol per line, line number = id
+    <root>/2024-06-14/ts.bin    float64
+    <root>/2024-06-14/sym.bin   int32
+    <root>/2024-06-14/price.bin float64
+    <root>/2024-06-14/volume.bin int64
+    <root>/2024-06-14/count.bin int64, number of rows written
+
+Column files are sparse and grow by doubling, and only the pages a query
+touches are read into memory. A full day of 500 symbols at a one-second
+cadence is about 11M rows or 320 MB on disk. Within a day, ticks are kept
+in time order, so a time range is a ``searchsorted`` slice. Without a
+symbol filter that slice is a zero-copy view of the mapped files. One
+process writes; readers in other processes see the rows up to ``count``.
+"""
+
+import os
+import threading
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+import core
+from market import IST
+
+TICK_DIR = os.environ.get("NSE_TICK_DIR", os.path.join(core.CACHE_DIR, "ticks"))
+COLUMNS = {"ts": "float64", "sym": "int32", "price": "float64", "volume": "int64"}
+INITIAL_ROWS = 1 << 20  # rows a new day partition is sized for
+BAR_SECONDS = {"1m": 60, "5m": 300, "15m": 900, "30m": 1800, "60m": 3600, "1h": 3600}
+
+_IST_OFFSET = 19800  # seconds east of UTC, IST has no DST
+
+
+def _day_number(ts: np.ndarray) -> np.ndarray:
+    return ((ts + _IST_OFFSET) // 86400).astype("int64")
+
+
+def _day_of(number: int) -> date:
+    return date.fromordinal(date(1970, 1, 1).toordinal() + int(number))
+
+
+def _as_ts(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time(), IST)
+    value = pd.Timestamp(value)
+    if value.tzinfo is None:
+        value = value.tz_localize(IST)
+    return value.timestamp()
+
+
+class _Partition:
+    """The column files of one day."""
+
+    def __init__(self, path: str, writable: bool):
+        self.path = path
+        self.writable = writable
+        if writable:
+            os.makedirs(path, exist_ok=True)
+            for name, dtype in COLUMNS.items():
+                file = self._file(name)
+                if not os.path.exists(file):
+                    with open(file, "wb") as fh:
+                        fh.truncate(INITIAL_ROWS * np.dtype(dtype).itemsize)
+            if not os.path.exists(self._file("count")):
+                np.zeros(1, dtype="int64").tofile(self._file("count"))
+        self._count = np.memmap(self._file("count"), dtype="int64", mode="r+" if writable else "r")
+        self._map()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.bin")
+
+    def _map(self) -> dict[str, np.memmap]:
+        mode = "r+" if self.writable else "r"
+        # built whole and swapped in with one assignment: readers on other
+        # threads never see a partial map
+        self.cols = {name: np.memmap(self._file(name), dtype=dtype, mode=mode) for name, dtype in COLUMNS.items()}
+        return self.cols
+
+    @property
+    def capacity(self) -> int:
+        return min(len(col) for col in self.cols.values())
+
+    def __len__(self) -> int:
+        return int(self._count[0])
+
+    def _grow(self, rows: int) -> None:
+        capacity = max(self.capacity * 2, rows)
+        for col in self.cols.values():
+            col.flush()
+        # the old maps stay valid for readers until the new ones replace them
+        for name, dtype in COLUMNS.items():
+            with open(self._file(name), "r+b") as fh:
+                fh.truncate(capacity * np.dtype(dtype).itemsize)
+        self._map()
+
+    def append(self, columns: dict[str, np.ndarray]) -> None:
+        n = len(self)
+        k = len(columns["ts"])
+        if n and columns["ts"][0] < self.cols["ts"][n - 1]:
+            raise ValueError("ticks must be appended in time order")
+        if n + k > self.capacity:
+            self._grow(n + k)
+        for name, values in columns.items():
+            self.cols[name][n : n + k] = values
+        # publish the rows only once they are written
+        self._count[0] = n + k
+
+    def view(self) -> dict[str, np.ndarray]:
+        # count first, then the map: the writer swaps in a grown map before it
+        # publishes rows that need it, so this map holds all ``n`` rows
+        n = len(self)
+        cols = self.cols
+        if n > min(len(col) for col in cols.values()):  # grown by the writer process since we mapped it
+            cols = self._map()
+        return {name: col[:n] for name, col in cols.items()}
+
+
+class TickStore:
+    """Day-partitioned, memory-mapped store of (ts, symbol, price, volume)."""
+
+    def __init__(self, root: str = TICK_DIR, readonly: bool = False):
+        self.root = root
+        self.readonly = readonly
+        self._lock = threading.Lock()
+        self._parts: dict[date, _Partition] = {}
+        self._ids: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._last_price: dict[str, float] = {}  # per symbol, of append_quotes
+        if not readonly:
+            os.makedirs(root, exist_ok=True)
+        self._load_symbols()
+
+    # ---- symbols ----
+
+    def _symbols_file(self) -> str:
+        return os.path.join(self.root, "symbols.txt")
+
+    def _load_symbols(self) -> None:
+        try:
+            with open(self._symbols_file()) as fh:
+                names = [line.strip() for line in fh if line.strip()]
+        except OSError:
+            names = []
+        for name in names[len(self._symbols) :]:
+            self._ids[name] = len(self._symbols)
+            self._symbols.append(name)
+
+    def symbol_id(self, symbol: str, create: bool = False) -> int | None:
+        symbol = symbol.upper()
+        if symbol not in self._ids:
+            self._load_symbols()
+        if symbol not in self._ids and create:
+            with open(self._symbols_file(), "a") as fh:
+                fh.write(symbol + "\n")
+            self._ids[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        return self._ids.get(symbol)
+
+    @property
+    def symbols(self) -> list[str]:
+        self._load_symbols()
+        return list(self._symbols)
+
+    # ---- partitions ----
+
+    def _partition(self, day: date, create: bool = False) -> _Partition | None:
+        part = self._parts.get(day)
+        if part is None:
+            path = os.path.join(self.root, day.isoformat())
+            if not create and not os.path.exists(os.path.join(path, "count.bin")):
+                return None
+            part = self._parts[day] = _Partition(path, writable=not self.readonly)
+        return part
+
+    def days(self) -> list[date]:
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return []
+        out = []
+        for name in names:
+            try:
+                out.append(date.fromisoformat(name))
+            except ValueError:
+                continue
+        return sorted(out)
+
+    # ---- writes ----
+
+    def append(self, ts, symbols, prices, volumes=None) -> int:
+        """Append ticks; ``ts`` may be one timestamp for the whole batch.
+
+        Returns the number of rows written. Within a day, timestamps must be
+        non-decreasing across appends.
+        """
+        if self.readonly:
+            raise PermissionError("tick store opened read-only")
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        prices = np.asarray(prices, dtype="float64").reshape(-1)
+        ts = np.broadcast_to(np.asarray(ts, dtype="float64"), prices.shape)
+        volumes = np.zeros(prices.shape, "int64") if volumes is None else np.asarray(volumes, dtype="int64").reshape(-1)
+        if not len(prices):
+            return 0
+
+        order = np.argsort(ts, kind="stable")
+        with self._lock:
+            ids = np.array([self.symbol_id(s, create=True) for s in symbols], dtype="int32")
+            cols = {"ts": ts[order], "sym": ids[order], "price": prices[order], "volume": volumes[order]}
+            days = _day_number(cols["ts"])
+            cuts = np.flatnonzero(np.diff(days)) + 1
+            for lo, hi in zip(np.r_[0, cuts], np.r_[cuts, len(days)]):
+                part = self._partition(_day_of(days[lo]), create=True)
+                part.append({name: col[lo:hi] for name, col in cols.items()})
+        return len(prices)
+
+    def append_quotes(self, prices: dict[str, float | None], ts: float) -> int:
+        """Append one poll of ``get_live_prices``; missing quotes and prices
+        unchanged since the symbol's last appended quote are skipped. Quotes
+        have no volume, their rows store 0."""
+        with self._lock:
+            got = {s: float(p) for s, p in prices.items() if p is not None and self._last_price.get(s) != p}
+            self._last_price.update(got)
+        return self.append(ts, list(got), list(got.values()))
+
+    # ---- reads ----
+
+    def range(self, start=None, end=None, symbol: str | None = None) -> dict[str, np.ndarray]:
+        """Columns of the ticks with ``start <= ts < end``.
+
+        ``start`` / ``end`` are unix seconds, datetimes (naive = IST) or
+        dates; the default is everything from today. Without ``symbol`` and within
+        one day the arrays are views of the mapped files, not copies.
+        """
+        lo = _as_ts(start if start is not None else datetime.now(IST).date())
+        hi = _as_ts(end) if end is not None else np.inf
+        first = _day_of(_day_number(np.float64(lo)))
+        last = _day_of(_day_number(np.float64(hi))) if np.isfinite(hi) else None
+
+        days = [d for d in self.days() if d >= first and (last is None or d <= last)]
+        with self._lock:
+            parts = [self._partition(day) for day in days]
+
+        pieces = []
+        for part in parts:
+            if part is None:
+                continue
+            cols = part.view()
+            a, b = np.searchsorted(cols["ts"], [lo, hi], side="left")
+            pieces.append({name: col[a:b] for name, col in cols.items()})
+
+        if not pieces:
+            out = {name: np.empty(0, dtype) for name, dtype in COLUMNS.items()}
+        elif len(pieces) == 1:
+            out = pieces[0]
+        else:
+            out = {name: np.concatenate([p[name] for p in pieces]) for name in COLUMNS}
+
+        if symbol is not None:
+            sid = self.symbol_id(symbol)
+            mask = out["sym"] == (-1 if sid is None else sid)
+            out = {name: col[mask] for name, col in out.items()}
+        return out
+
+    def frame(self, start=None, end=None, symbol: str | None = None) -> pd.DataFrame:
+        """``range`` as a DataFrame indexed by IST time, with symbol names."""
+        cols = self.range(start, end, symbol)
+        names = np.array(self.symbols + [""], dtype=object)
+        index = pd.to_datetime(cols["ts"], unit="s", utc=True).tz_convert(IST)
+        return pd.DataFrame(
+            {"Symbol": names[cols["sym"]], "Price": cols["price"], "Volume": cols["volume"]},
+            index=pd.Index(index, name="Time"),
+        )
+
+    def bars(self, symbol: str, freq: str = "1m", start=None, end=None) -> pd.DataFrame:
+        """OHLC bars of ``symbol`` aggregated from its ticks on the fly.
+
+        A bar is labelled with its start time and only has ticks inside it;
+        minutes without a tick have no bar. There is no Volume column: live
+        quotes carry none, so the ticks recorded from them hold 0.
+        """
+        secs = BAR_SECONDS[freq]
+        cols = self.range(start, end, symbol)
+        ts, px = cols["ts"], cols["price"]
+        if not len(ts):
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close"])
+
+        bucket = (ts + _IST_OFFSET) // secs
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        ends = np.r_[starts[1:], len(ts)] - 1
+        index = pd.to_datetime(bucket[starts] * secs - _IST_OFFSET, unit="s", utc=True).tz_convert(IST)
+        return pd.DataFrame(
+            {
+                "Open": px[starts],
+                "High": np.maximum.reduceat(px, starts),
+                "Low": np.minimum.reduceat(px, starts),
+                "Close": px[ends],
+            },
+            index=pd.Index(index, name="Time"),
+        )
+
+    def flush(self) -> None:
+        with self._lock:
+            for part in self._parts.values():
+                for col in part.cols.values():
+                    if part.writable:
+                        col.flush()
@@ -0,0 +1,106 @@
+"""Symbol universes from constituent CSVs and sharded scans over them.
+
+A universe is a CSV in ``universes/`` (or the directory named by
+``NSE_UNIVERSE_DIR``). The NSE index constituent downloads
+(``ind_nifty500list.csv`` and friends) work as they are, because only the
+``Symbol`` column is read; a file without one uses its first column.
+
+``scan_universe`` walks the symbols shard by shard and yields each shard's
+result as soon as it is ready, so a page can show partial tables and
+progress and stop early. The next shard's data is fetched while the
+current one is being scored.
+"""
+
+import csv
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+import pandas as pd
+
+UNIVERSE_DIR = os.environ.get(
+    "NSE_UNIVERSE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "universes"),
+)
+SHARD_SIZE = 100
+
+
+def list_universes(directory: str = UNIVERSE_DIR) -> dict[str, str]:
+    """Universe name (file stem) -> CSV path, sorted by name."""
+    try:
+        names = sorted(f for f in os.listdir(directory) if f.lower().endswith(".csv"))
+    except OSError:
+        return {}
+    return {os.path.splitext(f)[0]: os.path.join(directory, f) for f in names}
+
+
+def load_universe(name_or_path: str, directory: str = UNIVERSE_DIR) -> list[str]:
+    """Unique upper-case symbols of a universe, in file order."""
+    path = list_universes(directory).get(name_or_path, name_or_path)
+    with open(path, newline="") as fh:
+        rows = list(csv.reader(fh))
+    if not rows:
+        return []
+    header = [h.strip().lower() for h in rows[0]]
+    col = header.index("symbol") if "symbol" in header else 0
+    body = rows[1:] if "symbol" in header else rows
+    syms = (r[col].strip().upper() for r in body if len(r) > col)
+    return list(dict.fromkeys(s for s in syms if s))
+
+
+@dataclass
+class ShardResult:
+    rows: pd.DataFrame  # this shard's result
+    done: int  # symbols scanned so far
+    total: int
+    elapsed: float  # seconds since the scan started
+
+
+def scan_universe(
+    symbols: list[str],
+    scan_shard: Callable[[list[str], dict, dict], pd.DataFrame],
+    source=None,
+    period: str = "6mo",
+    interval: str = "1d",
+    quotes: bool = True,
+    shard_size: int = SHARD_SIZE,
+    cancel: threading.Event | None = None,
+) -> Iterator[ShardResult]:
+    """Run ``scan_shard(symbols, history, prices)`` over ``shard_size`` chunks.
+
+    ``source`` is anything with the ``history`` / ``quotes`` methods of the
+    shared ``DataAccess`` hub, which is the default. Setting ``cancel``, or
+    closing the generator, stops the scan after the current shard.
+    """
+    if source is None:
+        from data_access import shared_data
+
+        source = shared_data()
+    cancel = cancel or threading.Event()
+    shards = [symbols[i : i + shard_size] for i in range(0, len(symbols), shard_size)]
+
+    def fetch(shard: list[str]) -> tuple[dict, dict]:
+        hist = source.history(shard, period, interval)
+        prices = source.quotes(shard) if quotes else {}
+        return hist, prices
+
+    start = time.perf_counter()
+    done = 0
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan-prefetch")
+    try:
+        pending = pool.submit(fetch, shards[0]) if shards else None
+        for i, shard in enumerate(shards):
+            if cancel.is_set():
+                return
+            hist, prices = pending.result()
+            if i + 1 < len(shards):
+                pending = pool.submit(fetch, shards[i + 1])
+            rows = scan_shard(shard, hist, prices)
+            done += len(shard)
+            yield ShardResult(rows, done, len(symbols), time.perf_counter() - start)
+    finally:
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
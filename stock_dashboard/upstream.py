@@ -0,0 +1,109 @@
+"""Throttling guards for upstream endpoints: rate limit, backoff, breaker.
+
+- ``TokenBucket``: a shared rate limit; callers block until a token is free.
+- ``backoff_delay``: full-jitter exponential backoff for retries.
+- ``CircuitBreaker``: after ``threshold`` consecutive failures it opens and
+  rejects calls for ``reset_after`` seconds, then lets one probe through
+  (half-open) and closes again on success.
+- ``Quote``: a float price that remembers when it was fetched and whether
+  it is a stale last-known-good value standing in for a failed fetch.
+"""
+
+import random
+import threading
+import time
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate  # tokens per second
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, possibly into debt; seconds until it is really ours."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns the seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 8.0) -> float:
+    """Full-jitter delay before retry ``attempt`` (0-based)."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int = 5, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        return HALF_OPEN if now - self._opened_at >= self.reset_after else OPEN
+
+    def allow(self) -> bool:
+        """True when a call may go out; only one probe at a time when half-open."""
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class Quote(float):
+    """A price with ``as_of`` (unix time it was fetched) and ``stale``."""
+
+    as_of: float
+    stale: bool
+
+    def __new__(cls, price: float, as_of: float, stale: bool = False):
+        obj = super().__new__(cls, price)
+        obj.as_of = as_of
+        obj.stale = stale
+        return obj
+
+    def __reduce__(self):
+        return (Quote, (float(self), self.as_of, self.stale))
+
+    def __repr__(self) -> str:
+        return f"Quote({float(self)!r}{', stale' if self.stale else ''})"